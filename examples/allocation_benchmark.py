@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Counts the small model objects that are created per game step when two random bots play FFAI-11 games, and the
+memory used by one instance of each.
+"""
+
+import ffai
+import sys
+import time
+from collections import Counter
+
+classes = [ffai.Square, ffai.Action, ffai.ActionChoice, ffai.Outcome, ffai.DiceRoll, ffai.D3, ffai.D6, ffai.D8,
+           ffai.BBDie]
+created = Counter()
+
+
+def count_instances(cls):
+    init = cls.__init__
+
+    def counting_init(self, *args, **kwargs):
+        created[cls.__name__] += 1
+        init(self, *args, **kwargs)
+
+    cls.__init__ = counting_init
+
+
+def instance_size(obj):
+    size = sys.getsizeof(obj)
+    if hasattr(obj, '__dict__'):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def play(seed):
+    config = ffai.load_config("ff-11")
+    config.fast_mode = True
+    config.pathfinding_enabled = False
+    ruleset = ffai.load_rule_set(config.ruleset)
+    arena = ffai.load_arena(config.arena)
+    home = ffai.load_team_by_filename("human", ruleset)
+    away = ffai.load_team_by_filename("orc", ruleset)
+    game = ffai.Game(seed, home, away, ffai.Agent("home", human=True), ffai.Agent("away", human=True), config,
+                     arena=arena, ruleset=ruleset, seed=seed)
+    game.init()
+    bot = ffai.RandomBot("bot", seed=seed)
+    steps = 0
+    while not game.state.game_over:
+        game.step(bot.act(game))
+        steps += 1
+    return game, steps
+
+
+if __name__ == "__main__":
+    for cls in classes:
+        count_instances(cls)
+    total_steps = 0
+    start = time.time()
+    for seed in range(5):
+        game, steps = play(seed)
+        total_steps += steps
+    seconds = time.time() - start
+    print(f"{total_steps} steps in {seconds:.2f} s ({seconds / total_steps * 1000:.3f} ms per step)")
+    examples = {
+        'Square': ffai.Square(1, 1),
+        'Action': ffai.Action(ffai.ActionType.END_TURN),
+        'ActionChoice': ffai.ActionChoice(ffai.ActionType.END_TURN, team=None),
+        'Outcome': ffai.Outcome(ffai.OutcomeType.END_OF_GAME),
+        'DiceRoll': ffai.DiceRoll([]),
+        'D6': ffai.D6(game.rnd)
+    }
+    print(f"{'class':<14}{'per step':>10}{'bytes':>8}")
+    for cls in classes:
+        name = cls.__name__
+        size = instance_size(examples[name]) if name in examples else ''
+        print(f"{name:<14}{created[name] / total_steps:>10.1f}{size:>8}")
+    print(f"{'total':<14}{sum(created.values()) / total_steps:>10.1f}")
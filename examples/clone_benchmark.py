@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Compares Game.clone() with a deepcopy of the entire game on an FFAI-11 game in the middle of the first half.
+"""
+
+import ffai
+import time
+from copy import deepcopy
+
+
+def deepcopy_clone(game):
+    # The way Game.safe_clone() used to clone games
+    home_agent = game.home_agent
+    away_agent = game.away_agent
+    game.home_agent = ffai.Agent(home_agent.name, agent_id=home_agent.agent_id)
+    game.away_agent = ffai.Agent(away_agent.name, agent_id=away_agent.agent_id)
+    clone = deepcopy(game)
+    game.home_agent = home_agent
+    game.away_agent = away_agent
+    return clone
+
+
+def get_mid_game(seed=0):
+    config = ffai.load_config("ff-11")
+    ruleset = ffai.load_rule_set(config.ruleset)
+    home = ffai.load_team_by_filename("human", ruleset)
+    away = ffai.load_team_by_filename("orc", ruleset)
+    game = ffai.Game(seed, home, away, ffai.Agent("home", human=True), ffai.Agent("away", human=True), config, seed=seed)
+    game.init()
+    bot = ffai.RandomBot("bot", seed=seed)
+    while game.state.round < 5 and game.state.half == 1 and not game.state.game_over:
+        game.step(bot.act(game))
+    return game
+
+
+def time_per_call(f, game, n):
+    start = time.time()
+    for _ in range(n):
+        f(game)
+    return (time.time() - start) / n
+
+
+if __name__ == "__main__":
+    game = get_mid_game()
+    print(f"Half {game.state.half}, round {game.state.round}, {len(game.state.reports)} reports")
+    deepcopy_time = time_per_call(deepcopy_clone, game, 20)
+    clone_time = time_per_call(lambda g: g.clone(), game, 200)
+    print(f"deepcopy: {deepcopy_time * 1000:.2f} ms")
+    print(f"Game.clone(): {clone_time * 1000:.2f} ms")
+    print(f"Speed-up: {deepcopy_time / clone_time:.1f}x")
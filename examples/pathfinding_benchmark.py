@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Compares the open and closed sets of FFPathFinder with the sorted list and plain list that it used before on board
+states from FFAI-11 games between random bots. All paths are computed for every player on the pitch with both
+implementations, the paths are checked to be identical and the time spent is printed. The costs of the moves are
+computed in a first search so the timed searches measure the search itself.
+"""
+
+import ffai
+import ffai.ai.pathfinding as pf
+import time
+
+
+class ListPathFinder(pf.FFPathFinder):
+    """
+    FFPathFinder with the open set in a SortedList that is re-sorted on every append and the closed set in a list.
+    """
+
+    def __init__(self, tile_map, max_search_distance):
+        super().__init__(tile_map, max_search_distance)
+        self.open = pf.SortedList(lambda node: node.value())
+
+    def in_open_list(self, node):
+        return self.open.contains(node)
+
+    def update_in_open(self, node):
+        self.open.remove(node)
+        self.open.append(node)
+
+    def add_to_closed(self, node):
+        self.closed.append(node)
+
+    def in_closed_list(self, node):
+        return node in self.closed
+
+    def remove_from_closed(self, node):
+        self.closed.remove(node)
+
+    def clear_closed(self):
+        self.closed.clear()
+
+
+def get_states(num_games=3, steps_between=100):
+    for seed in range(num_games):
+        config = ffai.load_config("ff-11")
+        config.fast_mode = True
+        ruleset = ffai.load_rule_set(config.ruleset)
+        home = ffai.load_team_by_filename("human", ruleset)
+        away = ffai.load_team_by_filename("orc", ruleset)
+        game = ffai.Game(seed, home, away, ffai.Agent("home", human=True), ffai.Agent("away", human=True), config,
+                         ruleset=ruleset, seed=seed)
+        game.init()
+        bot = ffai.RandomBot("bot", seed=seed)
+        steps = 0
+        while not game.state.game_over:
+            game.step(bot.act(game))
+            steps += 1
+            if steps % steps_between == 0:
+                yield game
+
+
+def search(game, player, finder_class):
+    mover = pf.FFMover(player)
+    finder = finder_class(game.ff_map, player.num_moves_left())
+    return finder.find_paths(mover, player.position.x, player.position.y)
+
+
+if __name__ == "__main__":
+    seconds = {pf.FFPathFinder: 0.0, ListPathFinder: 0.0}
+    searches = 0
+    for game in get_states():
+        for team in game.state.teams:
+            for player in game.get_players_on_pitch(team, up=True):
+                game.ff_map = pf.FFTileMap(game)
+                search(game, player, pf.FFPathFinder)
+                results = {}
+                for finder_class in seconds:
+                    start = time.perf_counter()
+                    paths = search(game, player, finder_class)
+                    seconds[finder_class] += time.perf_counter() - start
+                    results[finder_class] = [(path.prob, [(square.x, square.y) for square in path.steps])
+                                             for path in paths]
+                assert results[pf.FFPathFinder] == results[ListPathFinder]
+                searches += 1
+    print(f"{searches} searches with identical paths")
+    for finder_class, total in seconds.items():
+        print(f"{finder_class.__name__:<16}{total:>8.2f} s{total / searches * 1000:>10.2f} ms per search")
@@ -130,6 +130,11 @@ class FFAIEnv(gym.Env):
         ActionType.START_HANDOFF
     ]
 
+    # The action types of the flat action masks of get_action_mask()
+    non_spatial_action_types = simple_action_types + defensive_formation_action_types + \
+        offensive_formation_action_types
+    spatial_action_types = positional_action_types
+
     # Procedures that require actions
     procedures = [
         StartGame,
@@ -157,6 +162,7 @@ class FFAIEnv(gym.Env):
         self.config = config
         self.config.competition_mode = False
         self.config.fast_mode = True
+        self.config.silent = True
         self.game = None
         self.team_id = None
         self.ruleset = load_rule_set(config.ruleset, all_rules=False)
@@ -169,7 +175,7 @@ class FFAIEnv(gym.Env):
         self.root = None
         self.cv = None
         self.last_obs = None
-        self.last_report_idx = 0
+        self.last_report_seq = 0
         self.last_ball_team = None
         self.last_ball_x = None
         self.own_team = None
@@ -233,7 +239,7 @@ class FFAIEnv(gym.Env):
         if action_type in self.positional_action_types:
             position = p
         real_action = Action(action_type=action_type, position=position, player=player)
-        self.last_report_idx = len(self.game.state.reports)
+        self.last_report_seq = self.game.state.reports.seq
         return self._step(real_action)
 
     def _step(self, action):
@@ -356,13 +362,7 @@ class FFAIEnv(gym.Env):
         # Procedure
         for procedure in FFAIEnv.procedures:
             proc_name = procedure.__name__
-            obs['procedures'][proc_name] = 0.0
-
-        for procedure in game.state.stack.items:
-            if procedure.__class__ in FFAIEnv.procedures:
-            # proc_idx = FFAIEnv.procedures.index(procedure.__class__)
-                proc_name = procedure.__class__.__name__
-                obs['procedures'][proc_name] = 1.0
+            obs['procedures'][proc_name] = 1.0 if game.state.stack.count(procedure) > 0 else 0.0
 
         self.last_obs = obs
 
@@ -395,7 +395,7 @@ class FFAIEnv(gym.Env):
                          config=self.config,
                          ruleset=self.ruleset,
                          seed=seed)
-        self.last_report_idx = len(self.game.state.reports)
+        self.last_report_seq = self.game.state.reports.seq
         self.last_ball_team = None
         self.last_ball_x = None
         self.game.init()
@@ -405,9 +405,7 @@ class FFAIEnv(gym.Env):
         return self._observation(self.game)
 
     def get_outcomes(self):
-        if self.last_report_idx == len(self.game.state.reports):
-            return []
-        return self.game.state.reports[self.last_report_idx:]
+        return self.game.state.reports.since(self.last_report_seq)
 
     def available_action_types(self):
         if isinstance(self.game.get_procedure(), Setup):
@@ -431,6 +429,27 @@ class FFAIEnv(gym.Env):
                 return [player.position for player in action.players if player is not None]
         return []
 
+    def get_action_mask(self, out=None):
+        """
+        :param out: a preallocated boolean array to write the mask to, or None.
+        :return: a flat boolean mask of the available actions with an entry for each of the non-spatial action types
+        followed by an entry for each square for each of the spatial action types. See Game.get_action_mask().
+        """
+        return self.game.get_action_mask(FFAIEnv.non_spatial_action_types, FFAIEnv.spatial_action_types, out=out)
+
+    def compute_action(self, action_idx):
+        """
+        :param action_idx: an index into the action mask of get_action_mask().
+        :return: the action at the index in the format taken by step().
+        """
+        action = self.game.get_action_from_index(action_idx, FFAIEnv.non_spatial_action_types,
+                                                 FFAIEnv.spatial_action_types)
+        return {
+            'action-type': action.action_type,
+            'x': action.position.x if action.position is not None else None,
+            'y': action.position.y if action.position is not None else None
+        }
+
     def _available_players(self, action_type):
         action = None
         for a in self.game.state.available_actions:
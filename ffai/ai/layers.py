@@ -21,11 +21,7 @@ class FeatureLayer:
 class OccupiedLayer(FeatureLayer):
 
     def produce(self, game):
-        out = np.zeros((game.arena.height, game.arena.width))
-        for y in range(len(game.state.pitch.board)):
-            for x in range(len(game.state.pitch.board[0])):
-                out[y][x] = 1.0 if game.state.pitch.board[y][x] is not None else 0.0
-        return out
+        return game.get_board_arrays().occupied().astype(float)
 
     def name(self):
         return "occupied"
@@ -38,10 +34,8 @@ class OwnPlayerLayer(FeatureLayer):
         active_team = game.state.available_actions[0].team if len(game.state.available_actions) > 0 else None
         if active_team is None:
             return out
-        for y in range(len(game.state.pitch.board)):
-            for x in range(len(game.state.pitch.board[0])):
-                out[y][x] = 1.0 if game.state.pitch.board[y][x] is not None and \
-                                   game.state.pitch.board[y][x].team == active_team is not None else 0.0
+        team_index = game.state.teams.index(active_team)
+        out[game.get_board_arrays().team_grid(team_index)] = 1.0
         return out
 
     def name(self):
@@ -55,10 +49,8 @@ class OppPlayerLayer(FeatureLayer):
         active_team = game.state.available_actions[0].team if len(game.state.available_actions) > 0 else None
         if active_team is None:
             return out
-        for y in range(len(game.state.pitch.board)):
-            for x in range(len(game.state.pitch.board[0])):
-                out[y][x] = 1.0 if game.state.pitch.board[y][x] is not None and \
-                                   game.state.pitch.board[y][x].team != active_team is not None else 0.0
+        team_index = game.state.teams.index(game.get_opp_team(active_team))
+        out[game.get_board_arrays().team_grid(team_index)] = 1.0
         return out
 
     def name(self):
@@ -72,11 +64,11 @@ class OwnTackleZoneLayer(FeatureLayer):
         active_team = game.state.available_actions[0].team if len(game.state.available_actions) > 0 else None
         if active_team is None:
             return out
-        for player in active_team.players:
-            if player.position is not None:
-                if player.has_tackle_zone():
-                    for square in game.get_adjacent_squares(player.position):
-                        out[square.y][square.x] += 0.125
+        tackle_zones = game.state.pitch.tackle_zones
+        tackle_zones.sync()
+        grid = tackle_zones.tackle_zones.get(active_team.team_id)
+        if grid is not None:
+            out[1:-1, 1:-1] = np.array(grid)[1:-1, 1:-1] * 0.125
         return out
 
     def name(self):
@@ -90,11 +82,11 @@ class OppTackleZoneLayer(FeatureLayer):
         active_team = game.state.available_actions[0].team if len(game.state.available_actions) > 0 else None
         if active_team is None:
             return out
-        for player in game.get_opp_team(active_team).players:
-            if player.position is not None:
-                if player.has_tackle_zone():
-                    for square in game.get_adjacent_squares(player.position):
-                        out[square.y][square.x] += 0.125
+        tackle_zones = game.state.pitch.tackle_zones
+        tackle_zones.sync()
+        grid = tackle_zones.tackle_zones.get(game.get_opp_team(active_team).team_id)
+        if grid is not None:
+            out[1:-1, 1:-1] = np.array(grid)[1:-1, 1:-1] * 0.125
         return out
 
     def name(self):
@@ -108,12 +100,10 @@ class UsedLayer(FeatureLayer):
         active_team = game.state.available_actions[0].team if len(game.state.available_actions) > 0 else None
         if active_team is None:
             return out
-        for player in active_team.players:
-            if player.position is not None:
-                out[player.position.y][player.position.x] = 1.0 if player.state.used else 0.0
-        for player in game.get_opp_team(active_team).players:
-            if player.position is not None:
-                out[player.position.y][player.position.x] = 1.0 if player.state.used else 0.0
+        arrays = game.get_board_arrays()
+        on_pitch = arrays.on_pitch()
+        positions = arrays.position[on_pitch]
+        out[positions[:, 1], positions[:, 0]] = arrays.used[on_pitch]
         return out
 
     def name(self):
@@ -127,12 +117,10 @@ class UpLayer(FeatureLayer):
         active_team = game.state.available_actions[0].team if len(game.state.available_actions) > 0 else None
         if active_team is None:
             return out
-        for player in active_team.players:
-            if player.position is not None:
-                out[player.position.y][player.position.x] = 1.0 if player.state.up else 0.0
-        for player in game.get_opp_team(active_team).players:
-            if player.position is not None:
-                out[player.position.y][player.position.x] = 1.0 if player.state.up else 0.0
+        arrays = game.get_board_arrays()
+        on_pitch = arrays.on_pitch()
+        positions = arrays.position[on_pitch]
+        out[positions[:, 1], positions[:, 0]] = arrays.up[on_pitch]
         return out
 
     def name(self):
@@ -12,11 +12,11 @@ Peter Moore.  The main modifications,
 """
 from typing import Optional, List
 from ffai.core.model import Player, Square
-from ffai.core.table import Skill, WeatherType, Tile
+from ffai.core.table import Skill, WeatherType, Tile, Rules
 from ffai.core.game import Game
 import time
 import copy
-from functools import lru_cache
+import numpy as np
 
 
 class Path:
@@ -35,6 +35,58 @@ class Path:
         return len(self) == 0
 
 
+class PathGrid:
+
+    def __init__(self, game: Game, start: Square, prob: np.ndarray, moves: np.ndarray, parent: np.ndarray):
+        """
+        The safest paths from a start square to every reachable square. The arrays are indexed [y, x] like the board and
+        the Paths are only built for the squares that are asked for.
+        :param game:
+        :param start: the square the paths start from.
+        :param prob: the success probability of the path to each square. 1 at the start and 0 where no path exists.
+        :param moves: the number of steps of the path to each square. 0 at the start and -1 where no path exists.
+        :param parent: the index y*width+x of the previous square on the path to each square. -1 at the start and where
+        no path exists.
+        """
+        self.game = game
+        self.start = start
+        self.prob = prob
+        self.moves = moves
+        self.parent = parent
+
+    def reachable(self) -> np.ndarray:
+        """
+        :return: a boolean array that is True for the squares that have a path, excluding the start square.
+        """
+        return self.parent >= 0
+
+    def get_path(self, position: Square) -> Optional[Path]:
+        """
+        :return: the safest path to the given position or None if there is no path.
+        """
+        if position == self.start:
+            return Path([], 1.0)
+        if self.parent[position.y, position.x] < 0:
+            return None
+        width = self.parent.shape[1]
+        steps = []
+        i = position.y * width + position.x
+        while i >= 0:
+            y, x = divmod(i, width)
+            steps.append(self.game.get_square(x, y))
+            i = self.parent[y, x]
+        steps.pop()
+        steps.reverse()
+        return Path(steps, float(self.prob[position.y, position.x]))
+
+    def get_paths(self) -> List[Path]:
+        """
+        :return: the paths to all reachable squares in the same order as get_all_paths().
+        """
+        xs, ys = np.nonzero(self.reachable().T)
+        return [self.get_path(self.game.get_square(x, y)) for x, y in zip(xs.tolist(), ys.tolist())]
+
+
 class Node:
 
     def __init__(self, x: int, y: int):
@@ -44,6 +96,10 @@ class Node:
         self.moves: float = 0
         self.__parent: Optional[Node] = None
         self.depth: int = 0
+        self.open: bool = False
+        self.closed: bool = False
+        self.heap_index: int = -1
+        self.key = None
 
     @property
     def parent(self: 'Node'):
@@ -86,20 +142,131 @@ class SortedList:
         return o in self.list
 
 
+class NodeHeap:
+    """
+    A binary min-heap of nodes ordered by (node.value(), insertion order), which gives the same order as SortedList
+    with value() as its key. Each node knows its index in the heap so its key can be updated and it can be removed in
+    O(log n) time.
+    """
+
+    def __init__(self):
+        self.heap: List[Node] = []
+        self.counter = 0
+
+    def first(self) -> Node:
+        return self.heap[0]
+
+    def clear(self):
+        for node in self.heap:
+            node.open = False
+            node.heap_index = -1
+        self.heap.clear()
+
+    def append(self, node: Node):
+        node.key = (node.value(), self.counter)
+        self.counter += 1
+        node.open = True
+        node.heap_index = len(self.heap)
+        self.heap.append(node)
+        self._sift_up(node.heap_index)
+
+    def update(self, node: Node):
+        """
+        Moves a node in the heap after its cost has changed, as if it was removed and appended again.
+        """
+        node.key = (node.value(), self.counter)
+        self.counter += 1
+        self._sift_up(node.heap_index)
+        self._sift_down(node.heap_index)
+
+    def remove(self, node: Node):
+        i = node.heap_index
+        last = self.heap.pop()
+        node.open = False
+        node.heap_index = -1
+        if last is not node:
+            self.heap[i] = last
+            last.heap_index = i
+            self._sift_up(i)
+            self._sift_down(last.heap_index)
+
+    def __len__(self):
+        return len(self.heap)
+
+    def contains(self, node: Node):
+        return node.open
+
+    def _sift_up(self, i: int):
+        heap = self.heap
+        node = heap[i]
+        while i > 0:
+            parent_index = (i - 1) >> 1
+            parent = heap[parent_index]
+            if node.key < parent.key:
+                heap[i] = parent
+                parent.heap_index = i
+                i = parent_index
+            else:
+                break
+        heap[i] = node
+        node.heap_index = i
+
+    def _sift_down(self, i: int):
+        heap = self.heap
+        n = len(heap)
+        node = heap[i]
+        while True:
+            child_index = 2 * i + 1
+            if child_index >= n:
+                break
+            child = heap[child_index]
+            if child_index + 1 < n and heap[child_index + 1].key < child.key:
+                child_index += 1
+                child = heap[child_index]
+            if child.key < node.key:
+                heap[i] = child
+                child.heap_index = i
+                i = child_index
+            else:
+                break
+        heap[i] = node
+        node.heap_index = i
+
+
 class FFMover:
     def __init__(self, player: Player, allow_skill_reroll=True):
         self.allow_skill_reroll = allow_skill_reroll
         self.player: Player = player
         self.move_allowed: int = player.num_moves_left()
+        self.moves_left_without_gfi: int = player.num_moves_left(include_gfi=False)
         self.cur_depth = 0
+        # The dodge table of the player, looked up by FFPathFinder at the start of each search
+        self.dodge_table: Optional[List[Optional[List[float]]]] = None
 
 
 class FFTileMap:
+    """
+    The board as seen by FFPathFinder. The squares that are blocked and the dodge probabilities of the movers are
+    memoized in tables indexed by y * width + x, and the results of the searches of the module functions are cached by
+    mover and query. The tile map is kept by the game across steps. When Pitch.version or the tackle zone version of
+    Pitch.player_versions has changed, sync() compares the players on the board with the last synchronized board and
+    only repairs the entries that are near a square whose player has changed.
+    """
+
     def __init__(self, game: Game):
         self.game: Game = game
         self.width = game.state.pitch.width
         self.height = game.state.pitch.height
         self.visited: List[List[bool]] = [[False for y in range(self.height)] for x in range(self.width)]
+        self.pitch = None
+        self.version = None
+        self.occupants = None
+        self.blocked_squares: Optional[List[bool]] = None
+        self.dodge_probs = {}
+        # Results of searches by key with a bit mask of the squares that the search depends on, see cache_path()
+        self.paths = {}
+        # Distances to the squares of each tile, which do not depend on the board
+        self.tile_distances = {}
 
     def get_width_in_tiles(self) -> int:
         return self.width
@@ -118,22 +285,79 @@ class FFTileMap:
     def has_visited(self, x: int, y: int) -> bool:
         return self.visited[x][y]
 
-    @lru_cache(maxsize=50000)
-    def blocked(self, mover: FFMover, x: int, y: int) -> bool:
-        square = self.game.get_square(x, y)
+    def sync(self):
+        """
+        Repairs the memo tables and the cached searches if the board or the state of a player has changed since the
+        last call. Called by FFPathFinder before each search.
+        """
+        pitch = self.game.state.pitch
+        version = (pitch.version, pitch.player_versions.tackle_zones)
+        if pitch is self.pitch and version == self.version:
+            return
+        pitch.tackle_zones.sync()
+        occupants = {key: (player.player_id, has_tackle_zone, player.state.up, player.get_ag(), player.get_skill_mask())
+                     for key, (player, has_tackle_zone, _) in pitch.tackle_zones.occupants.items()}
+        if pitch is not self.pitch:
+            self.pitch = pitch
+            self.dodge_probs = {}
+            self.paths = {}
+            board = pitch.board
+            # Need to ignore the "crowd" squares on the boundary by blocking them.
+            self.blocked_squares = [x <= 0 or y <= 0 or x >= self.width - 1 or y >= self.height - 1 or
+                                    board[y][x] is not None for y in range(self.height) for x in range(self.width)]
+        else:
+            changed = [key for key in occupants.keys() | self.occupants.keys()
+                       if occupants.get(key) != self.occupants.get(key)]
+            if changed:
+                self.repair(changed)
+        self.occupants = occupants
+        self.version = version
+
+    def repair(self, changed: List[int]):
+        """
+        Updates the blocked squares and clears the memoized dodge probabilities and the cached searches that depend on
+        the squares whose player has changed. A player affects the tackle zones and the adjacent players of the squares
+        next to it and the dodges to those squares, so the dodges from squares within a distance of two are cleared.
+        :param changed: the indices of the squares whose player has changed.
+        """
+        board = self.game.state.pitch.board
+        region = set()
+        for key in changed:
+            x, y = key % self.width, key // self.width
+            self.blocked_squares[key] = x <= 0 or y <= 0 or x >= self.width - 1 or y >= self.height - 1 or \
+                board[y][x] is not None
+            for yy in range(max(0, y - 2), min(self.height, y + 3)):
+                for xx in range(max(0, x - 2), min(self.width, x + 3)):
+                    region.add(yy * self.width + xx)
+        for _, _, table in self.dodge_probs.values():
+            for key in region:
+                table[key] = None
+        region_mask = 0
+        for key in region:
+            region_mask |= 1 << key
+        self.paths = {key: entry for key, entry in self.paths.items() if not entry[1] & region_mask}
+
+    def cache_path(self, key, result, nodes: List['Node'], squares=()):
+        """
+        Caches the result of a search until a player changes within a distance of two of one of the nodes that the
+        search closed or of one of the given squares, e.g. the start and the target of the search.
+        """
+        mask = 0
+        for node in nodes:
+            mask |= 1 << (node.y * self.width + node.x)
+        for square in squares:
+            mask |= 1 << (square.y * self.width + square.x)
+        self.paths[key] = (result, mask)
 
-        # Need to ignore the "crowd" squares on the boundary by blocking them.
-        return (x <= 0) or (y <= 0) or (x >= self.width - 1) or (y >= self.height - 1) or self.game.get_player_at(square) is not None
+    def blocked(self, mover: FFMover, x: int, y: int) -> bool:
+        return self.blocked_squares[y * self.width + x]
 
     def get_cost(self, mover: FFMover, sx: int, sy: int, tx: int, ty: int) -> float:
-        square_from = self.game.get_square(sx, sy)
-        square_to = self.game.get_square(tx, ty)
         moving_unit = mover.player
-        # A huge speed up if we can cache this function call
-        dodge_prob = self.dodge_prob(moving_unit, square_from, square_to, allow_dodge_reroll=mover.allow_skill_reroll)
+        dodge_prob = self.get_dodge_prob(moving_unit, sx, sy, tx, ty, mover.allow_skill_reroll, mover.dodge_table)
         move_prob = 1.0
         cur_depth: int = mover.cur_depth  # essentially number of moves already done.
-        if cur_depth != -1 and (cur_depth + 1 > self.num_moves_left(moving_unit, include_gfi=False)):
+        if cur_depth != -1 and (cur_depth + 1 > mover.moves_left_without_gfi):
             move_prob = 1.0 / 6.0
             if self.game.state.weather == WeatherType.BLIZZARD:
                 move_prob = 2.0 / 6.0
@@ -142,26 +366,88 @@ class FFTileMap:
         cost = 1 - move_prob * dodge_prob
         return cost
 
-    @lru_cache(maxsize=50000)
     def num_moves_left(self, player, include_gfi=False):
         return player.num_moves_left(include_gfi=include_gfi)
 
-    @lru_cache(maxsize=50000)
     def dodge_prob(self, moving_unit, square_from, square_to, allow_dodge_reroll):
-        return self.game.get_dodge_prob_from(moving_unit, square_from, square_to, allow_dodge_reroll=allow_dodge_reroll)
+        return self.get_dodge_prob(moving_unit, square_from.x, square_from.y, square_to.x, square_to.y,
+                                   allow_dodge_reroll)
+
+    def get_dodge_table(self, player: Player, allow_dodge_reroll: bool) -> List[Optional[List[float]]]:
+        """
+        :return: the memo table of the dodge probabilities of player by square. The table is replaced when the player's
+        agility or skills have changed.
+        """
+        ag = player.get_ag()
+        skill_mask = player.get_skill_mask()
+        entry = self.dodge_probs.get((player.player_id, allow_dodge_reroll))
+        if entry is None or entry[0] != ag or entry[1] != skill_mask:
+            entry = (ag, skill_mask, [None] * (self.width * self.height))
+            self.dodge_probs[(player.player_id, allow_dodge_reroll)] = entry
+        return entry[2]
+
+    def get_dodge_prob(self, player: Player, sx: int, sy: int, tx: int, ty: int, allow_dodge_reroll: bool,
+                       table: Optional[List[Optional[List[float]]]] = None) -> float:
+        """
+        :return: the same probability as Game.get_dodge_prob_from() for a dodge of player from (sx, sy) to the adjacent
+        square (tx, ty) but without moving the player. The probabilities of the dodges from a square are computed
+        together and memoized until the next change of the board near them or of the player's agility or skills.
+        :param table: the table returned by get_dodge_table() for the player, if it has already been looked up.
+        """
+        if table is None:
+            table = self.get_dodge_table(player, allow_dodge_reroll)
+        probs = table[sy * self.width + sx]
+        if probs is None:
+            probs = self._compute_dodge_probs(player, sx, sy, allow_dodge_reroll)
+            table[sy * self.width + sx] = probs
+        return probs[(ty - sy + 1) * 3 + tx - sx + 1]
+
+    def _compute_dodge_probs(self, player: Player, sx: int, sy: int, allow_dodge_reroll: bool) -> List[float]:
+        """
+        :return: the probabilities of the dodges from (sx, sy) to the surrounding squares in row-major order.
+        """
+        opp_team = self.game.get_opp_team(player.team)
+        tackle_zones = self.game.state.pitch.tackle_zones.tackle_zones.get(opp_team.team_id)
+        if tackle_zones is None or tackle_zones[sy][sx] == 0:
+            return [1.0] * 9
+        from_position = self.game.get_square(sx, sy)
+        # The probability only depends on the number of tackle zones at the target, so it is computed once per number
+        count_probs = {}
+        probs = []
+        for y in range(sy - 1, sy + 2):
+            for x in range(sx - 1, sx + 2):
+                tackle_zones_to = tackle_zones[y][x] if 0 <= x < self.width and 0 <= y < self.height else 0
+                p = count_probs.get(tackle_zones_to)
+                if p is None:
+                    p = self.game.get_dodge_prob_with(player, from_position, tackle_zones_to, allow_dodge_reroll)
+                    count_probs[tackle_zones_to] = p
+                probs.append(p)
+        return probs
+
+    def get_tile_distances(self, tile: Tile) -> List[List[int]]:
+        """
+        :return: a grid with the distance from each square to the nearest square of the given tile, e.g. an endzone.
+        """
+        distances = self.tile_distances.get(tile)
+        if distances is None:
+            board = self.game.arena.board
+            squares = [(x, y) for y in range(self.height) for x in range(self.width) if board[y][x] == tile]
+            distances = [[min([max(abs(x - sx), abs(y - sy)) for sx, sy in squares], default=self.width + self.height)
+                          for x in range(self.width)] for y in range(self.height)]
+            self.tile_distances[tile] = distances
+        return distances
 
     def get_movement(self, mover: FFMover, sx: int, sy: int, tx: int, ty: int) -> float:
         return self.dist(sx, sy, tx, ty)
 
-    @lru_cache(maxsize=50000)
     def dist(self, sx: int, sy: int, tx: int, ty: int) -> float:
-        return self.game.get_square(sx, sy).distance(self.game.get_square(tx, ty))
+        return max(abs(tx - sx), abs(ty - sy))
 
 
 class FFPathFinder:
 
     def __init__(self, tile_map: FFTileMap, max_search_distance: int):
-        self.open: SortedList = SortedList(lambda x: x.value())
+        self.open: NodeHeap = NodeHeap()
         self.closed: List[Node] = []
         self.tile_map: FFTileMap = tile_map
         self.max_search_distance: int = max_search_distance
@@ -174,8 +460,8 @@ class FFPathFinder:
 
     def find_path(self, mover: FFMover, sx: int, sy: int, tx: int = None, ty: int = None, tile: Tile = None, player: Player = None) -> Optional[Path]:
         # easy first check, if the destination is blocked, we can't get there
-        FFTileMap.dodge_prob.cache_clear()
-        FFTileMap.num_moves_left.cache_clear()
+        self.tile_map.sync()
+        mover.dodge_table = self.tile_map.get_dodge_table(mover.player, mover.allow_skill_reroll)
         if tx is not None and ty is not None and self.tile_map.blocked(mover, tx, ty):
             return None
 
@@ -188,13 +474,18 @@ class FFPathFinder:
         self.nodes[sx][sy].cost = 0
         self.nodes[sx][sy].moves = 0 if mover.player.state.up or mover.player.has_skill(Skill.JUMP_UP) else 3
         self.nodes[sx][sy].depth = 0
-        self.closed.clear()
+        self.clear_closed()
         self.open.clear()
         self.open.append(self.nodes[sx][sy])
 
         if tx is not None and ty is not None:
             self.nodes[tx][ty].parent = None
 
+        # Every step adds one move so no goal can be reached if the nearest one is too far away
+        goal_distance = self.get_goal_distance(sx, sy, tx, ty, tile, player)
+        if goal_distance > 0 and self.nodes[sx][sy].moves + goal_distance > self.max_search_distance:
+            return None
+
         # Make a set of goals found
         goals = set()
 
@@ -248,7 +539,12 @@ class FFPathFinder:
 
                         if next_step_cost < neighbour.cost:
                             if self.in_open_list(neighbour):
-                                self.remove_from_open(neighbour)
+                                # update the node's key in the open list instead of removing and adding it again
+                                neighbour.cost = next_step_cost
+                                neighbour.moves = next_step_moves
+                                neighbour.parent = current
+                                self.update_in_open(neighbour)
+                                continue
 
                             if self.in_closed_list(neighbour):
                                 self.remove_from_closed(neighbour)
@@ -272,6 +568,20 @@ class FFPathFinder:
                 best_path = path
         return best_path
 
+    def get_goal_distance(self, sx: int, sy: int, tx: int = None, ty: int = None, tile: Tile = None, player: Player = None) -> int:
+        """
+        :return: the distance from (sx, sy) to the nearest square that find_path() would accept as a goal, ignoring
+        the players on the board. It is a lower bound of the number of moves needed to reach a goal.
+        """
+        distance = self.tile_map.get_width_in_tiles() + self.tile_map.get_height_in_tiles()
+        if tx is not None and ty is not None:
+            distance = min(distance, max(abs(sx - tx), abs(sy - ty)))
+        if tile is not None:
+            distance = min(distance, self.tile_map.get_tile_distances(tile)[sy][sx])
+        if player is not None:
+            distance = min(distance, max(1, player.position.distance(self.tile_map.game.get_square(sx, sy))) - 1)
+        return distance
+
     def create_path(self, sx: int, sy: int, tx: int, ty: int) -> Optional[Path]:
         if tx == sx and ty == sy:
             return Path([], 1.0)
@@ -292,11 +602,30 @@ class FFPathFinder:
         Find all paths up to self.max_search_distance starting from (sx, sy).
         :return: 3-D List of either Paths (where a path to the node exists) or None, where no Path exists
         """
-        t0 = time.time()
+        self.search_all(mover, sx, sy)
+        paths = self.create_paths(sx, sy)
+        return paths
+
+    def find_path_grid(self, mover, sx: int, sy: int) -> PathGrid:
+        """
+        Find all paths up to self.max_search_distance starting from (sx, sy).
+        :return: a PathGrid with the probability, moves and parent of each square.
+        """
+        self.search_all(mover, sx, sy)
+        return self.create_path_grid(sx, sy)
+
+    def search_all(self, mover, sx: int, sy: int):
+        """
+        Runs the search from (sx, sy) without a target, leaving the safest path to each square in self.nodes.
+        """
+        self.tile_map.sync()
+        mover.dodge_table = self.tile_map.get_dodge_table(mover.player, mover.allow_skill_reroll)
+        # The tile map is kept across searches and steps, so only the squares visited by this search may be used
+        self.tile_map.clear_visited()
         self.nodes[sx][sy].cost = 0
         self.nodes[sx][sy].depth = 0
         self.nodes[sx][sy].moves = 0
-        self.closed.clear()
+        self.clear_closed()
         self.open.clear()
         self.open.append(self.nodes[sx][sy])      # Start with starting node.
 
@@ -326,7 +655,11 @@ class FFPathFinder:
 
                         if next_step_cost < neighbour.cost:
                             if self.in_open_list(neighbour):
-                                self.remove_from_open(neighbour)
+                                neighbour.cost = next_step_cost
+                                neighbour.moves = next_step_moves
+                                neighbour.parent = current
+                                self.update_in_open(neighbour)
+                                continue
 
                             if self.in_closed_list(neighbour):
                                 self.remove_from_closed(neighbour)
@@ -336,8 +669,32 @@ class FFPathFinder:
                             neighbour.parent = current
                             self.add_to_open(neighbour)
 
-        paths = self.create_paths(sx, sy)
-        return paths
+    def create_path_grid(self, sx: int, sy: int) -> PathGrid:
+        width = self.tile_map.get_width_in_tiles()
+        height = self.tile_map.get_height_in_tiles()
+        prob = np.zeros((height, width))
+        moves = np.full((height, width), -1, dtype=int)
+        parent = np.full((height, width), -1, dtype=int)
+        prob[sy, sx] = 1.0
+        moves[sy, sx] = 0
+        # Every node that got a parent has been in the open list and was then closed
+        for node in self.closed:
+            if node.parent is not None:
+                prob[node.y, node.x] = 1 - node.cost
+                parent[node.y, node.x] = node.parent.y * width + node.parent.x
+        # A node can be re-parented after its children were expanded, so the moves are counted along the final parents
+        for node in self.closed:
+            chain = []
+            while node.parent is not None and moves[node.y, node.x] < 0:
+                chain.append(node)
+                node = node.parent
+            if moves[node.y, node.x] < 0:
+                continue
+            count = moves[node.y, node.x]
+            for node in reversed(chain):
+                count += 1
+                moves[node.y, node.x] = count
+        return PathGrid(self.tile_map.game, self.tile_map.game.get_square(sx, sy), prob, moves, parent)
 
     def create_paths(self, sx: int, sy: int) -> List[Path]:
         paths = []
@@ -366,14 +723,24 @@ class FFPathFinder:
     def remove_from_open(self, node: Node):
         self.open.remove(node)
 
+    def update_in_open(self, node: Node):
+        self.open.update(node)
+
     def add_to_closed(self, node: Node):
+        node.closed = True
         self.closed.append(node)
 
     def in_closed_list(self, node: Node) -> bool:
-        return node in self.closed
+        return node.closed
 
     def remove_from_closed(self, node: Node):
-        self.closed.remove(node)
+        # The node stays in self.closed, which only tracks the nodes to reset in clear_closed()
+        node.closed = False
+
+    def clear_closed(self):
+        for node in self.closed:
+            node.closed = False
+        self.closed.clear()
 
     def is_valid_location(self, mover: FFMover, sx: int, sy: int, x: int, y: int) -> bool:
         valid = not self.tile_map.blocked(mover, x, y)
@@ -417,6 +784,43 @@ def _reset_state(game, player, orig_player, orig_ball):
         game.ball = orig_ball
 
 
+def _find_cached(game, player, allow_skill_reroll, max_steps, query, search, squares=()):
+    """
+    Runs search(finder, mover) for the player unless the tile map of the game has cached the result of the same query
+    for the player in the same state on a board that has not changed near the squares the search depended on.
+    :param query: a tuple that identifies the query.
+    :param squares: squares besides the nodes of the search that the result depends on.
+    :return: the result of the search. A copy is returned, so the caller may modify it without changing the cache.
+    """
+    if game.ff_map is None:
+        game.ff_map = FFTileMap(game)
+    tile_map = game.ff_map
+    tile_map.sync()
+    key = (player.player_id, player.position.x, player.position.y, player.state.moves, player.state.up,
+           player.num_moves_left(), player.num_moves_left(include_gfi=False), player.get_ag(), player.get_skill_mask(),
+           game.state.weather, allow_skill_reroll, max_steps) + query
+    entry = tile_map.paths.get(key)
+    if entry is not None:
+        return _copy_result(entry[0])
+    finder = FFPathFinder(tile_map, max_steps)
+    result = search(finder, FFMover(player, allow_skill_reroll=allow_skill_reroll))
+    tile_map.cache_path(key, result, finder.closed, (player.position,) + tuple(squares))
+    return _copy_result(result)
+
+
+def _copy_result(result):
+    """
+    :return: a copy of a Path, a list of Paths or a PathGrid that shares only the squares with result.
+    """
+    if isinstance(result, Path):
+        return Path(list(result.steps), result.prob)
+    if isinstance(result, list):
+        return [_copy_result(path) for path in result]
+    if isinstance(result, PathGrid):
+        return PathGrid(result.game, result.start, result.prob.copy(), result.moves.copy(), result.parent.copy())
+    return result
+
+
 def get_safest_path(game, player, position, from_position=None, num_moves_used=None, allow_skill_reroll=True, max_search_distance=False):
     """
     :param game:
@@ -429,16 +833,11 @@ def get_safest_path(game, player, position, from_position=None, num_moves_used=N
     given position and the cost/probability of failure.
     """
     orig_player, orig_ball = _alter_state(game, player, from_position, num_moves_used)
-    FFTileMap.dodge_prob.cache_clear()
-    FFTileMap.num_moves_left.cache_clear()
-    FFTileMap.blocked.cache_clear()
 
-    if game.ff_map is None:
-        game.ff_map = FFTileMap(game)
-    player_mover = FFMover(player, allow_skill_reroll=allow_skill_reroll)
     max_steps = player.num_moves_left() - 1 if not max_search_distance else max_search_distance
-    finder = FFPathFinder(game.ff_map, max_steps)
-    path = finder.find_path(player_mover, player.position.x, player.position.y, position.x, position.y)
+    path = _find_cached(game, player, allow_skill_reroll, max_steps, ('safest', position.x, position.y),
+                        lambda finder, mover: finder.find_path(mover, player.position.x, player.position.y, position.x, position.y),
+                        squares=[position])
 
     _reset_state(game, player, orig_player, orig_ball)
 
@@ -461,16 +860,11 @@ def get_safest_path_to_player(game, player, target_player, from_position=None, n
     a position that is adjacent to the other player and the cost/probability of failure.
     """
     orig_player, orig_ball = _alter_state(game, player, from_position, num_moves_used)
-    FFTileMap.dodge_prob.cache_clear()
-    FFTileMap.num_moves_left.cache_clear()
-    FFTileMap.blocked.cache_clear()
 
-    if game.ff_map is None:
-        game.ff_map = FFTileMap(game)
-    player_mover = FFMover(player, allow_skill_reroll=allow_skill_reroll)
     max_steps = player.num_moves_left() - 1 if not max_search_distance else max_search_distance
-    finder = FFPathFinder(game.ff_map, max_steps)
-    path = finder.find_path(player_mover, player.position.x, player.position.y, player=target_player)
+    path = _find_cached(game, player, allow_skill_reroll, max_steps,
+                        ('player', target_player.position.x, target_player.position.y),
+                        lambda finder, mover: finder.find_path(mover, player.position.x, player.position.y, player=target_player))
 
     _reset_state(game, player, orig_player, orig_ball)
 
@@ -490,22 +884,38 @@ def get_all_paths(game, player, from_position=None, num_moves_used=None, allow_s
     given position and the cost/probability of failure, for each reachable square.
     """
     orig_player, orig_ball = _alter_state(game, player, from_position, num_moves_used)
-    FFTileMap.dodge_prob.cache_clear()
-    FFTileMap.num_moves_left.cache_clear()
-    FFTileMap.blocked.cache_clear()
 
-    if game.ff_map is None:
-        game.ff_map = FFTileMap(game)
-    player_mover = FFMover(player, allow_skill_reroll=allow_skill_reroll)
     max_steps = player.num_moves_left() if not max_search_distance else max_search_distance
-    finder = FFPathFinder(game.ff_map, max_steps)
-    paths = finder.find_paths(player_mover, player.position.x, player.position.y)
+    paths = _find_cached(game, player, allow_skill_reroll, max_steps, ('all',),
+                         lambda finder, mover: finder.find_paths(mover, player.position.x, player.position.y))
 
     _reset_state(game, player, orig_player, orig_ball)
 
     return paths
 
 
+def get_all_path_grid(game, player, from_position=None, num_moves_used=None, allow_skill_reroll=True, max_search_distance=False):
+    """
+    Same search as get_all_paths() but the result is kept in dense arrays and the Paths are only built when asked for.
+    :param game:
+    :param player: the player to move
+    :param from_position: position to start movement from. If None, it will start from the player's current position.
+    :param num_moves_used: the number of moves already used by the player. If None, it will use the player's current number of used moves.
+    :param allow_skill_reroll: whether to allow skill re-rolls in the probability computations.
+    :param max_search_distance: the maximum search distance. If None, it will use the player's number of moves left.
+    :return a PathGrid with the success probability, moves used and parent of the safest path to each square.
+    """
+    orig_player, orig_ball = _alter_state(game, player, from_position, num_moves_used)
+
+    max_steps = player.num_moves_left() if not max_search_distance else max_search_distance
+    grid = _find_cached(game, player, allow_skill_reroll, max_steps, ('grid',),
+                        lambda finder, mover: finder.find_path_grid(mover, player.position.x, player.position.y))
+
+    _reset_state(game, player, orig_player, orig_ball)
+
+    return grid
+
+
 def get_safest_scoring_path(game, player, from_position=None, num_moves_used=None, allow_skill_reroll=True, max_search_distance=None):
     """
     :param game:
@@ -519,13 +929,10 @@ def get_safest_scoring_path(game, player, from_position=None, num_moves_used=Non
     """
     orig_player, orig_ball = _alter_state(game, player, from_position, num_moves_used)
 
-    if game.ff_map is None:
-        game.ff_map = FFTileMap(game)
-    player_mover = FFMover(player, allow_skill_reroll=allow_skill_reroll)
     max_steps = player.num_moves_left() if not max_search_distance else max_search_distance
-    finder = FFPathFinder(game.ff_map, max_steps)
     tile = Tile.HOME_TOUCHDOWN if player.team == game.state.away_team else Tile.AWAY_TOUCHDOWN
-    path = finder.find_path(player_mover, player.position.x, player.position.y, tile=tile)
+    path = _find_cached(game, player, allow_skill_reroll, max_steps, ('scoring', tile),
+                        lambda finder, mover: finder.find_path(mover, player.position.x, player.position.y, tile=tile))
 
     _reset_state(game, player, orig_player, orig_ball)
 
@@ -6,15 +6,23 @@ Year: 2018
 This module contains the Game class, which is the main class and interface used to interact with a game in FFAI.
 """
 
-from copy import deepcopy
+from copy import copy, deepcopy
 
 import numpy as np
 
 from ffai.core.load import *
 from ffai.core.procedure import *
+from ffai.core.journal import Journal, Reversible
 
 
-class Game:
+class Game(Reversible):
+
+    # The PassDistance of each value in the grids of get_pass_distance_grid()
+    pass_distances = (None,) + tuple(PassDistance)
+    # The positions of the action types in the masks of get_action_mask() for each arena size and action type lists
+    action_mask_layouts = {}
+    # The available actions and their first action choice of each type, see get_action_choice()
+    _action_choices = None
 
     def __init__(self, game_id, home_team, away_team, home_agent, away_agent, config=None, arena=None, ruleset=None, state=None, seed=None, record=False):
         assert config is not None or arena is not None
@@ -40,6 +48,8 @@ class Game:
 
         self.action = None
         self.ff_map = None
+        self.journal = None
+        self.procedure_times = None
 
     def to_json(self):
         return {
@@ -62,16 +72,88 @@ class Game:
         }
 
     def safe_clone(self):
-        # Make dummy agents for the clone
-        home_agent = self.home_agent
-        away_agent = self.away_agent
-        self.home_agent = Agent(home_agent.name, agent_id=home_agent.agent_id)
-        self.away_agent = Agent(away_agent.name, agent_id=away_agent.agent_id)
-        clone = deepcopy(self)
-        self.home_agent = home_agent
-        self.away_agent = away_agent
+        """
+        Clones the game with clone() such that it can be handed to an agent without exposing this game. Unlike a deep
+        copy of the game, the clone has no replay and shares the immutable parts of the game, e.g. the arena, ruleset,
+        config and roles, with this game.
+        :return: a clone of the game with dummy agents.
+        """
+        return self.clone()
+
+    def clone(self):
+        """
+        Clones the game by copying only its mutable state, i.e. the game state, teams, players, pitch, balls, dugouts,
+        procedures, available actions and clocks. The arena, ruleset, config, roles, squares and the rolls of past
+        reports are immutable and are shared with the clone. Other objects without a clone() method are deep-copied. The
+        agents are replaced with dummy agents and the clone has no replay.
+        :return: a clone of the game.
+        """
+        clone = copy(self)
+        clone.__dict__.pop('_journal', None)
+        memo = {id(self): clone}
+        clone.home_agent = Agent(self.home_agent.name, human=self.home_agent.human, agent_id=self.home_agent.agent_id)
+        clone.away_agent = Agent(self.away_agent.name, human=self.away_agent.human, agent_id=self.away_agent.agent_id)
+        memo[id(self.home_agent)] = clone.home_agent
+        memo[id(self.away_agent)] = clone.away_agent
+        clone.actor = clone_value(self.actor, memo)
+        clone.disqualified_agent = clone_value(self.disqualified_agent, memo)
+        clone.replay = None
+        clone.ff_map = None
+        clone.journal = None
+        clone.procedure_times = None
+        clone.rnd = deepcopy(self.rnd)
+        clone.state = self.state.clone(memo)
+        clone.action = clone_value(self.action, memo)
+        clone.forced_action = clone_value(self.forced_action, memo)
         return clone
 
+    def enable_journal(self):
+        """
+        Starts recording every modification of the game state in a journal such that steps can be reverted with
+        revert() and redone with redo(). Steps taken before the journal was enabled cannot be reverted.
+        """
+        if self.journal is not None:
+            return
+        journal = Journal()
+        self.journal = journal
+        journal.attach(self)
+
+    def disable_journal(self):
+        """
+        Stops recording modifications of the game state and discards the journal.
+        """
+        if self.journal is None:
+            return
+        self.journal.detach()
+        self.journal = None
+
+    def num_reversible_steps(self):
+        """
+        :return: the number of steps that can be reverted.
+        """
+        return self.journal.num_steps() if self.journal is not None else 0
+
+    def revert(self, n=1):
+        """
+        Reverts the last n calls to step(), including the actions taken by bots within them, and restores the state of
+        the random number generator. The journal must be enabled.
+        :param n: the number of steps to revert.
+        """
+        assert self.journal is not None, "The journal must be enabled to revert steps"
+        self.journal.revert(n)
+        self.state.pitch.increment_version()
+        self.state.pitch.increment_player_versions()
+
+    def redo(self, n=1):
+        """
+        Redoes the last n reverted steps. Taking a new step discards the steps that can be redone.
+        :param n: the number of steps to redo.
+        """
+        assert self.journal is not None, "The journal must be enabled to redo steps"
+        self.journal.redo(n)
+        self.state.pitch.increment_version()
+        self.state.pitch.increment_player_versions()
+
     def init(self):
         """
         Initialized the Game. The START_GAME action must still be called after this if humans are in the game.
@@ -79,13 +161,13 @@ class Game:
         EndGame(self)
         Pregame(self)
         if not self.away_agent.human:
-            game_copy_away = self.safe_clone()
+            game_copy_away = self.safe_clone() if self.config.clone_game_for_agents else self
             self.actor = self.away_agent
             self.away_agent.new_game(game_copy_away, game_copy_away.state.away_team)
             self.actor = None
         if not self.home_agent.human:
             self.actor = self.home_agent
-            game_copy_home = self.safe_clone()
+            game_copy_home = self.safe_clone() if self.config.clone_game_for_agents else self
             self.actor = None
             self.home_agent.new_game(game_copy_home, game_copy_home.state.home_team)
 
@@ -108,10 +190,14 @@ class Game:
         :return:
         """
 
+        # Start a new step in the journal so it can be reverted
+        if self.journal is not None:
+            self.journal.begin_step(self.rnd)
+
         # Ensure player points to player object
         if action is not None:
             action.player = self.get_player(action.player.player_id) if action.player is not None else None
-            action.position = Square(action.position.x, action.position.y) if action.position is not None else None
+            action.position = self.get_square(action.position.x, action.position.y) if action.position is not None else None
 
         # Set action as a property so other methods can access it
         self.action = action
@@ -135,9 +221,6 @@ class Game:
                 self._end_game()
                 return
 
-            # Reset pathfinding map
-            self.ff_map = None
-            
             # if procedure is ready for input
             if done:
 
@@ -190,7 +273,7 @@ class Game:
             self.action = None
             self.remove_clocks()
             self.disqualified_agent = self.actor
-            self.report(Outcome(OutcomeType.END_OF_GAME_DISQUALIFICATION, team=self.get_agent_team(self.actor)))
+            self.report(OutcomeType.END_OF_GAME_DISQUALIFICATION, team=self.get_agent_team(self.actor))
             self._end_game()
             return
 
@@ -208,7 +291,7 @@ class Game:
                 self.action = None
                 self.remove_clocks()
                 self.disqualified_agent = self.actor
-                self.report(Outcome(OutcomeType.END_OF_GAME_DISQUALIFICATION, team=self.get_agent_team(self.actor)))
+                self.report(OutcomeType.END_OF_GAME_DISQUALIFICATION, team=self.get_agent_team(self.actor))
                 self._end_game()
                 return
 
@@ -287,48 +370,75 @@ class Game:
             self.replay.record_step(self)
             self.replay.dump(self.game_id)
 
-    def _is_action_allowed(self, action):
+    def get_action_choice(self, action_type):
+        """
+        :param action_type:
+        :return: the first available action choice of the given action type or None if there is none.
+        """
+        available_actions = self.state.available_actions
+        action_choices = self._action_choices
+        if action_choices is None or action_choices[0] is not available_actions:
+            by_type = {}
+            for action_choice in available_actions:
+                if action_choice.action_type not in by_type:
+                    by_type[action_choice.action_type] = action_choice
+            # Cached on the game, outside the journal, for the current list of available actions
+            action_choices = (available_actions, by_type)
+            object.__setattr__(self, '_action_choices', action_choices)
+        return action_choices[1].get(action_type)
+
+    def _is_action_allowed(self, action, silent=None):
         """
-        Checks whether the specified action is allowed by comparing to actions in self.state.available_actions.
+        Checks whether the specified action is allowed by comparing to the action choice of the same type in
+        self.state.available_actions.
         :param action:
+        :param silent: whether to suppress the messages explaining why an action is not allowed. Defaults to the
+        configuration's silent setting.
         :return: True if the specified actions is allowed.
         """
         if action is None:
             return True
-        for action_choice in self.state.available_actions:
-            if action.action_type == action_choice.action_type:
-                # Type checking
-                if type(action.action_type) is not ActionType:
-                    print("Illegal action type: ", type(action.action_type))
-                    return False
-                if action.player is not None and not isinstance(action.player, Player):
-                    print("Illegal player type: ", type(action.action_type), action, self.state.stack.peek())
-                    return False
-                if action.position is not None and not isinstance(action.position, Square):
-                    print("Illegal position type:", type(action.position), action.action_type.name)
-                    return False
-                # Check if player argument is used instead of position argument
-                if len(action_choice.players) == 0 and action.player is not None and action.position is None:
-                    action.position = action.player.position
-                    # Check if player argument is used instead of position argument
-                elif len(action_choice.positions) == 0 and action.position is not None and action.player is None:
-                    action.player = self.get_player_at(action.position)
-                # Check player argument
-                if len(action_choice.players) > 1 and action.player not in action_choice.players:
-                    if action.player is None:
-                        print("Illegal player: None")
-                    else:
-                        print("Illegal player:", action.player.to_json(), action.action_type.name)
-                    return False
-                # Check position argument
-                if len(action_choice.positions) > 0 and action.position not in action_choice.positions:
-                    if action.position is None:
-                        print("Illegal position: None")
-                    else:
-                        print("Illegal position:", action.position.to_json(), action.action_type.name)
-                    return False
-                return True
-        return False
+        if silent is None:
+            silent = self.config.silent
+        action_choice = self.get_action_choice(action.action_type)
+        if action_choice is None:
+            return False
+        # Type checking
+        if type(action.action_type) is not ActionType:
+            if not silent:
+                print("Illegal action type: ", type(action.action_type))
+            return False
+        if action.player is not None and not isinstance(action.player, Player):
+            if not silent:
+                print("Illegal player type: ", type(action.action_type), action, self.state.stack.peek())
+            return False
+        if action.position is not None and not isinstance(action.position, Square):
+            if not silent:
+                print("Illegal position type:", type(action.position), action.action_type.name)
+            return False
+        # Check if player argument is used instead of position argument
+        if len(action_choice.players) == 0 and action.player is not None and action.position is None:
+            action.position = action.player.position
+            # Check if player argument is used instead of position argument
+        elif len(action_choice.positions) == 0 and action.position is not None and action.player is None:
+            action.player = self.get_player_at(action.position)
+        # Check player argument
+        if len(action_choice.players) > 1 and not action_choice.has_player(action.player):
+            if not silent:
+                if action.player is None:
+                    print("Illegal player: None")
+                else:
+                    print("Illegal player:", action.player.to_json(), action.action_type.name)
+            return False
+        # Check position argument
+        if len(action_choice.positions) > 0 and not action_choice.has_position(action.position):
+            if not silent:
+                if action.position is None:
+                    print("Illegal position: None")
+                else:
+                    print("Illegal position:", action.position.to_json(), action.action_type.name)
+            return False
+        return True
 
     def _safe_act(self):
         '''
@@ -426,7 +536,16 @@ class Game:
             print("Proc={}".format(proc))
             print("Action={}".format(action.action_type if action is not None else "None"))
 
-        proc.done = proc.step(action)
+        if self.procedure_times is None:
+            proc.done = proc.step(action)
+        else:
+            start = time.perf_counter()
+            proc.done = proc.step(action)
+            name = type(proc).__name__
+            if name not in self.procedure_times:
+                self.procedure_times[name] = [0, 0.0]
+            self.procedure_times[name][0] += 1
+            self.procedure_times[name][1] += time.perf_counter() - start
 
         if self.config.debug_mode:
             print("Done={}".format(proc.done))
@@ -544,6 +663,8 @@ class Game:
         '''
         Adds a secondary clock for quick decisions.
         '''
+        if not self.config.clocks:
+            return
         self.pause_clocks()
         assert team is not None and type(team) == Team
         clock = Clock(team, self.config.time_limits.secondary)
@@ -554,6 +675,8 @@ class Game:
         Adds a primary clock that will be paused if secondary clocks are added.
         '''
         self.state.clocks.clear()
+        if not self.config.clocks:
+            return
         assert team is not None and type(team) == Team
         clock = Clock(team, self.config.time_limits.turn, is_primary=True)
         self.state.clocks.append(clock)
@@ -609,11 +732,23 @@ class Game:
             elif self.state.available_actions[0].team == self.state.away_team:
                 self.actor = self.away_agent
  
-    def report(self, outcome):
-        """
-        Adds the outcome to the game's reports.
-        """
-        self.state.reports.append(outcome)
+    def report(self, outcome_type, position=None, player=None, opp_player=None, rolls=None, team=None, n=0,
+               skill=None):
+        """
+        Adds an outcome to the game's reports unless its type is filtered out by config.reported_outcome_types, in which
+        case no Outcome is created.
+        :param outcome_type: the OutcomeType of the outcome or an already created Outcome.
+        The remaining parameters are passed on to the Outcome.
+        """
+        reported = self.config.reported_outcome_types
+        if type(outcome_type) is Outcome:
+            if reported is None or outcome_type.outcome_type in reported:
+                self.state.reports.append(outcome_type)
+            return
+        if reported is not None and outcome_type not in reported:
+            return
+        self.state.reports.append(Outcome(outcome_type, position=position, player=player, opp_player=opp_player,
+                                          rolls=rolls, team=team, n=n, skill=skill))
 
     def is_team_side(self, position, team):
         """
@@ -634,7 +769,7 @@ class Game:
         for y in range(len(self.arena.board)):
             for x in range(len(self.arena.board[y])):
                 if self.arena.board[y][x] in (TwoPlayerArena.home_tiles if team == self.state.home_team else TwoPlayerArena.away_tiles):
-                    tiles.append(Square(x, y))
+                    tiles.append(self.state.pitch.squares[y][x])
         return tiles
 
     def is_scrimmage(self, position):
@@ -797,11 +932,7 @@ class Game:
         """
         :return: The top-most Turn procedure in the stack.
         """
-        for i in reversed(range(self.state.stack.size())):
-            proc = self.state.stack.items[i]
-            if isinstance(proc, Turn):
-                return proc
-        return None
+        return self.state.stack.get_last(Turn)
 
     def can_use_reroll(self, team):
         """
@@ -837,8 +968,11 @@ class Game:
         :param player:
         :return: True if player has the ball.
         """
-        ball = self.get_ball_at(player.position)
-        return True if ball is not None and ball.is_carried else False
+        position = player.position
+        for ball in self.state.pitch.balls:
+            if ball.on_ground and ball.position == position:
+                return ball.is_carried
+        return False
 
     def get_ball(self):
         """
@@ -902,6 +1036,19 @@ class Game:
         if turn is not None:
             return turn.quick_snap
 
+    def get_board_arrays(self):
+        """
+        Returns the struct-of-arrays representation of the pitch and the players. It is created on the first call and
+        from then on kept in sync with the pitch by put(), remove(), move() and swap().
+        :return: the BoardArrays of the pitch with refreshed player arrays.
+        """
+        pitch = self.state.pitch
+        if pitch.arrays is None:
+            pitch.arrays = BoardArrays(self.arena.width, self.arena.height, self.state.teams, pitch.player_versions)
+        else:
+            pitch.arrays.sync()
+        return pitch.arrays
+
     def get_players_on_pitch(self, team, used=None, up=None):
         """
         :param team: The team of the players.
@@ -909,13 +1056,11 @@ class Game:
         :param up: If specified, filter by ther players up state.
         :return: Players on the pitch who's on team.
         """
-        players = []
-        for y in range(len(self.state.pitch.board)):
-            for x in range(len(self.state.pitch.board[y])):
-                player = self.state.pitch.board[y][x]
-                if player is not None and player.team == team and (used is None or used == player.state.used) and (up is None or up == player.state.up):
-                    players.append(player)
-        return players
+        players = self.state.pitch.get_team_players(team)
+        if used is None and up is None:
+            return players
+        return [player for player in players
+                if (used is None or used == player.state.used) and (up is None or up == player.state.up)]
 
     def pitch_to_reserves(self, player):
         """
@@ -989,8 +1134,12 @@ class Game:
         :param piece: Ball or player
         :param position:
         """
-        piece.position = Square(position.x, position.y)
+        piece.position = self.get_square(position.x, position.y)
         self.state.pitch.board[position.y][position.x] = piece
+        if self.state.pitch.arrays is not None:
+            self.state.pitch.arrays.put(piece, position)
+        self.state.pitch.tackle_zones.set(position, piece)
+        self.state.pitch.set_player(position, piece if isinstance(piece, Player) else None)
 
     def remove(self, piece):
         """
@@ -999,6 +1148,10 @@ class Game:
         """
         assert piece.position is not None
         self.state.pitch.board[piece.position.y][piece.position.x] = None
+        if self.state.pitch.arrays is not None:
+            self.state.pitch.arrays.remove(piece, piece.position)
+        self.state.pitch.tackle_zones.set(piece.position, None)
+        self.state.pitch.set_player(piece.position, None)
         piece.position = None
 
     def move(self, player, position):
@@ -1027,12 +1180,19 @@ class Game:
         """
         assert piece_a.position is not None
         assert piece_b.position is not None
-        pos_a = Square(piece_a.position.x, piece_a.position.y)
-        pos_b = Square(piece_b.position.x, piece_b.position.y)
+        pos_a = piece_a.position
+        pos_b = piece_b.position
         piece_a.position = pos_b
         piece_b.position = pos_a
         self.state.pitch.board[pos_a.y][pos_a.x] = piece_b
         self.state.pitch.board[pos_b.y][pos_b.x] = piece_a
+        if self.state.pitch.arrays is not None:
+            self.state.pitch.arrays.put(piece_a, pos_b)
+            self.state.pitch.arrays.put(piece_b, pos_a)
+        self.state.pitch.tackle_zones.set(pos_a, piece_b)
+        self.state.pitch.tackle_zones.set(pos_b, piece_a)
+        self.state.pitch.set_player(pos_a, piece_b if isinstance(piece_b, Player) else None)
+        self.state.pitch.set_player(pos_b, piece_a if isinstance(piece_a, Player) else None)
 
     def get_catch_modifiers(self, catcher, accurate=False, interception=False, handoff=False):
         """
@@ -1108,8 +1268,19 @@ class Game:
         :param position: The position the player is dodging to
         :return: the modifier to be added to the dodge roll.
         """
+        return self.get_dodge_modifiers_from(player, player.position, self.num_tackle_zones_at(player, position),
+                                             include_diving_tackle)
+
+    def get_dodge_modifiers_from(self, player, from_position, tackle_zones_to, include_diving_tackle=False):
+        """
+        :param player:
+        :param from_position: The position the player is dodging from, which need not be the player's position.
+        :param tackle_zones_to: The number of opponent tackle zones at the position the player is dodging to.
+        :param include_diving_tackle:
+        :return: the modifier to be added to the dodge roll.
+        """
         modifiers = 1
-        tackle_zones_to = self.num_tackle_zones_at(player, position)
+        opp_team = self.get_opp_team(player.team)
 
         ignore_opp_mods = False
         if player.has_skill(Skill.STUNTY):
@@ -1121,14 +1292,14 @@ class Game:
         if player.has_skill(Skill.TWO_HEADS):
             modifiers += 1
 
-        prehensile_tailers = self.get_adjacent_opponents(player, skill=Skill.PREHENSILE_TAIL)
+        prehensile_tailers = self.get_adjacent_players(from_position, team=opp_team, skill=Skill.PREHENSILE_TAIL)
         modifiers -= len(prehensile_tailers)  # subtract 1 for each prehensile tail detractor
 
         if not ignore_opp_mods:
             modifiers -= tackle_zones_to
 
         if include_diving_tackle:
-            diving_tacklers = self.get_adjacent_opponents(player, skill=Skill.DIVING_TACKLE)
+            diving_tacklers = self.get_adjacent_players(from_position, team=opp_team, skill=Skill.DIVING_TACKLE)
             if len(diving_tacklers) > 0:
                 modifiers -= 2
 
@@ -1170,11 +1341,11 @@ class Game:
         :param position:
         :return: Number of opponent tackle zones player would be in, if standing at position.
         """
-        tackle_zones = 0
-        for p in self.get_adjacent_players(position, team=self.get_opp_team(player.team)):
-            if p is not None and p.has_tackle_zone():
-                tackle_zones += 1
-        return tackle_zones
+        tackle_zones = self.state.pitch.tackle_zones
+        if not (0 <= position.x < tackle_zones.width and 0 <= position.y < tackle_zones.height):
+            return 0
+        tackle_zones.sync()
+        return tackle_zones.num_tackle_zones(self.get_opp_team(player.team), position)
 
     def get_catcher(self, position):
         """
@@ -1214,14 +1385,11 @@ class Game:
         """
         min_players_checked = min(min_players, len(self.get_reserves(team)) + len(self.get_players_on_pitch(team)))
         cnt = 0
-        for y in range(len(self.state.pitch.board)):
-            for x in range(len(self.state.pitch.board[y])):
-                if not self.is_team_side(Square(x, y), team):
-                    continue
-                if tile is None or self.arena.board[y][x] == tile:
-                    piece = self.state.pitch.board[y][x]
-                    if isinstance(piece, Player) and piece.team == team:
-                        cnt += 1
+        for player in self.get_players_on_pitch(team):
+            if not self.is_team_side(player.position, team):
+                continue
+            if tile is None or self.arena.board[player.position.y][player.position.x] == tile:
+                cnt += 1
         if cnt > max_players or cnt < min_players_checked:
             return False
         return True
@@ -1273,14 +1441,15 @@ class Game:
         """
         :return: a list of procedure names in the stack.
         """
-        procs = []
-        for proc in self.state.stack.items:
-            if isinstance(proc, Turn) and proc.quick_snap:
-                procs.append("QuickSnap")
-            elif isinstance(proc, Turn) and proc.blitz:
-                procs.append("Blitz")
-            else:
-                procs.append(proc.__class__.__name__)
+        stack = self.state.stack
+        procs = [proc.__class__.__name__ for proc in stack.items]
+        # Only the turns, which are looked up in the index of the stack, are renamed
+        for position in stack.get_positions(Turn):
+            proc = stack.items[position]
+            if proc.quick_snap:
+                procs[position] = "QuickSnap"
+            elif proc.blitz:
+                procs[position] = "Blitz"
         return procs
 
     def get_player_action_type(self):
@@ -1417,9 +1586,8 @@ class Game:
         :return: True if the the game has reported an outcome of the given type. If last is specified, only the recent number of reports are checked.
         """
         assert last is None or last > 0
-        n = len(self.state.reports) if last is None else min(len(self.state.reports), last)
-        j = len(self.state.reports) - n
-        for report in self.state.reports[j:]:
+        reports = self.state.reports.since(0) if last is None else self.state.reports.last(last)
+        for report in reports:
             if report.outcome_type == outcome_type:
                 return True
         return False
@@ -1444,8 +1612,10 @@ class Game:
         :param in_air:
         :return: Ball or None
         """
-        balls_at = self.get_balls_at(position, in_air)
-        return balls_at[0] if balls_at else None
+        for ball in self.state.pitch.balls:
+            if ball.position == position and (ball.on_ground or in_air):
+                return ball
+        return None
 
     def get_ball_positions(self):
         """
@@ -1523,7 +1693,7 @@ class Game:
         :param y:
         :return: A square with the position (x,y)
         """
-        if 0 >= x < self.state.pitch.width and 0 >= y < self.state.pitch.height:
+        if 0 <= x < self.state.pitch.width and 0 <= y < self.state.pitch.height:
             return self.state.pitch.squares[y][x]
         return Square(x, y)
 
@@ -1592,6 +1762,10 @@ class Game:
         :param skill: Only include players with this skill.
         :return:
         """
+        tackle_zones = self.state.pitch.tackle_zones
+        if team is not None and 0 <= position.x < tackle_zones.width and 0 <= position.y < tackle_zones.height \
+                and tackle_zones.num_adjacent(team, position) == 0:
+            return []
         players = []
         for square in self.get_adjacent_squares(position, diagonal=diagonal):
             player_at = self.get_player_at(square)
@@ -1617,12 +1791,19 @@ class Game:
         :param foul: Indicates whether it is a foul. The Guard skill is ignored if fould=True.
         :return: a list of assisting players in a block between player and opp_player.
         """
+        tackle_zones = self.state.pitch.tackle_zones
+        tackle_zones.sync()
+        num_assisters = tackle_zones.num_assisters(player.team, opp_player.position)
+        if player.position is not None and player.position.distance(opp_player.position) == 1 and player.can_assist():
+            num_assisters -= 1
+        if num_assisters == 0:
+            return []
         assists = []
         for yy in range(-1, 2, 1):
             for xx in range(-1, 2, 1):
                 if yy == 0 and xx == 0:
                     continue
-                p = Square(opp_player.position.x+xx, opp_player.position.y+yy)
+                p = self.get_square(opp_player.position.x+xx, opp_player.position.y+yy)
                 if not self.is_out_of_bounds(p) and player.position != p:
                     player_at = self.get_player_at(p)
                     if player_at is not None:
@@ -1660,7 +1841,7 @@ class Game:
             for xx in range(-1, 2, 1):
                 if yy == 0 and xx == 0:
                     continue
-                p = Square(opp_player.position.x+xx, opp_player.position.y+yy)
+                p = self.get_square(opp_player.position.x+xx, opp_player.position.y+yy)
                 if not self.is_out_of_bounds(p) and player.position != p:
                     player_at = self.get_player_at(p)
                     if player_at is not None:
@@ -1693,42 +1874,24 @@ class Game:
         """
         return self.num_block_dice_at(attacker, defender, attacker.position, blitz, dauntless_success)
 
-    def get_block_probs(self, attacker, defender):
+    def get_block_probs(self, attacker, defender, blitz=False):
         """
         :param attacker:
         :param defender:
-        :return: a tuple containing the knock-down probabilities of the attacker and defender.
+        :param blitz: whether the block is part of a blitz.
+        :return: a tuple containing the estimated knock-down probabilities of the attacker and defender and their
+        probabilities of fumbling the ball. See get_block_outcome_probs() for the assumptions it makes.
         """
-        dice = self.num_block_dice(attacker, defender)
+        dice = self.num_block_dice(attacker, defender, blitz=blitz)
         push_squares = self.get_push_squares(attacker.position, defender.position)
-        crowd_push = self.arena.board[push_squares[0].y][push_squares[0].x] == Tile.CROWD and not defender.has_skill(Skill.STAND_FIRM)
-        p_self = 1.0 / 6.0 if attacker.has_skill(Skill.BLOCK) else 2.0 / 6.0
-        p_opp = 2.0 / 6.0 if attacker.has_skill(Skill.BLOCK) else 2.0 / 6.0
-        if crowd_push:
-            p_opp += 2.0 / 6.0
-        if not crowd_push:
-            p_opp -= (1.0 / 6.0 if defender.has_skill(Skill.DODGE) and not attacker.has_skill(Skill.TACKLE) else 0.0)
-        if dice == 2:
-            p_self -= (1.0 - p_self) * p_self
-            p_opp += (1.0 - p_opp) * p_opp
-        if dice == 3:
-            p_self -= (1.0 - p_self) * p_self
-            p_opp += (1.0 - p_opp) * p_opp
-        if dice == -2:
-            p_self += (1.0 - p_self) * p_self
-            p_opp -= (1.0 - p_opp) * p_opp
-        if dice == -3:
-            p_self += (1.0 - p_self) * p_self
-            p_opp -= (1.0 - p_opp) * p_opp
-        p_fumble_opp = 0.0
-        p_fumble_self = 0.0
-        if self.get_ball_carrier() == defender:
-            p_fumble_opp = p_opp
-            if not crowd_push and attacker.has_skill(Skill.STRIP_BALL) and not defender.has_skill(Skill.SURE_HANDS):
-                p_fumble_opp += 2.0 / 6.0
-        elif self.get_ball_carrier() == attacker:
-            p_fumble_self = p_self
-        return p_self, p_opp, p_fumble_self, p_fumble_opp
+        crowd = self.arena.board[push_squares[0].y][push_squares[0].x] == Tile.CROWD
+        attacker_skills = attacker.get_skill_mask()
+        if attacker.has_used_skill(Skill.PRO):
+            attacker_skills &= ~Skill.PRO.mask
+        ball_carrier = self.get_ball_carrier()
+        probs = get_block_outcome_probs(dice, attacker_skills, defender.get_skill_mask(), blitz=blitz, crowd=crowd,
+                                        attacker_ball=ball_carrier == attacker, defender_ball=ball_carrier == defender)
+        return probs[:4]
 
     def get_blitz_probs(self, attacker, attack_position, defender):
         """
@@ -1740,7 +1903,7 @@ class Game:
         """
         orig_position = self.get_square(attacker.position.x, attacker.position.y)
         self.move(attacker, attack_position)
-        p_self, p_opp, p_fumble_self, p_fumble_opp = self.get_block_probs(attacker, defender)
+        p_self, p_opp, p_fumble_self, p_fumble_opp = self.get_block_probs(attacker, defender, blitz=True)
         self.move(attacker, orig_position)
         return p_self, p_opp, p_fumble_self, p_fumble_opp
 
@@ -1754,11 +1917,27 @@ class Game:
         """
         if self.num_tackle_zones_in(player) == 0:
             return 1.0
-        ag_roll = Rules.agility_table[player.get_ag()] - self.get_dodge_modifiers(player, position)
+        return self.get_dodge_prob_with(player, player.position, self.num_tackle_zones_at(player, position),
+                                        allow_dodge_reroll, allow_team_reroll)
+
+    def get_dodge_prob_with(self, player, from_position, tackle_zones_to, allow_dodge_reroll=True,
+                            allow_team_reroll=False):
+        """
+        :param player:
+        :param from_position: the position the player is dodging from, which need not be the player's position.
+        :param tackle_zones_to: the number of opponent tackle zones at the position the player is dodging to.
+        :param allow_dodge_reroll:
+        :param allow_team_reroll:
+        :return: the probability of a successful dodge for player, assuming that a dodge is needed.
+        """
+        ag_roll = Rules.agility_table[player.get_ag()] - self.get_dodge_modifiers_from(player, from_position,
+                                                                                        tackle_zones_to)
         ag_roll = max(2, min(6, ag_roll))
         successful_outcomes = 6-(ag_roll-1)
         p = successful_outcomes / 6.0
-        if allow_dodge_reroll and player.has_skill(Skill.DODGE) and not self.get_adjacent_opponents(player, down=False, skill=Skill.TACKLE):
+        if allow_dodge_reroll and player.has_skill(Skill.DODGE) and \
+                not self.get_adjacent_players(from_position, team=self.get_opp_team(player.team), down=False,
+                                              skill=Skill.TACKLE):
             p += (1.0-p)*p
         elif allow_team_reroll and self.can_use_reroll(player.team):
             p += (1.0-p)*p
@@ -1834,6 +2013,151 @@ class Game:
             p += (1.0-p)*p
         return p
 
+    def get_tackle_zone_grid(self, team):
+        """
+        :param team:
+        :return: an array with the number of tackle zones of players on the team that each square is in.
+        """
+        tackle_zones = self.state.pitch.tackle_zones
+        tackle_zones.sync()
+        grid = tackle_zones.tackle_zones.get(team.team_id)
+        if grid is None:
+            return np.zeros((self.state.pitch.height, self.state.pitch.width), dtype=int)
+        return np.array(grid)
+
+    def _get_prob_grid(self, player, modifiers, reroll):
+        """
+        :param player: the player making the agility roll.
+        :param modifiers: an array with the modifiers of the roll on each square.
+        :param reroll: whether the roll can be rerolled.
+        :return: an array with the probability of success on each square. Squares that are out of bounds are 0.
+        """
+        ag_roll = np.clip(Rules.agility_table[player.get_ag()] - modifiers, 2, 6)
+        p = (7 - ag_roll) / 6.0
+        if reroll:
+            p += (1.0 - p) * p
+        return self._clear_out_of_bounds(p)
+
+    def _clear_out_of_bounds(self, grid):
+        grid[0, :] = 0
+        grid[-1, :] = 0
+        grid[:, 0] = 0
+        grid[:, -1] = 0
+        return grid
+
+    def get_dodge_prob_grid(self, player, from_position=None, allow_dodge_reroll=True, allow_team_reroll=False):
+        """
+        :param player:
+        :param from_position: the position the player dodges from. The player's position is used if None.
+        :param allow_dodge_reroll:
+        :param allow_team_reroll:
+        :return: an array with the probability of a successful dodge for player from from_position to each square.
+        The values are the same as get_dodge_prob_from() gives for each square but the player is not moved.
+        """
+        from_position = player.position if from_position is None else from_position
+        opp_team = self.get_opp_team(player.team)
+        tackle_zones = self.get_tackle_zone_grid(opp_team)
+        height, width = tackle_zones.shape
+        if tackle_zones[from_position.y, from_position.x] == 0:
+            return self._clear_out_of_bounds(np.ones((height, width)))
+
+        modifiers = 1
+        ignore_opp_mods = False
+        if player.has_skill(Skill.STUNTY):
+            modifiers = 1
+            ignore_opp_mods = True
+        if player.has_skill(Skill.TITCHY):
+            modifiers += 1
+            ignore_opp_mods = True
+        if player.has_skill(Skill.TWO_HEADS):
+            modifiers += 1
+        modifiers -= len(self.get_adjacent_players(from_position, team=opp_team, skill=Skill.PREHENSILE_TAIL))
+        modifiers = np.full((height, width), modifiers)
+        if not ignore_opp_mods:
+            modifiers -= tackle_zones
+
+        reroll = False
+        if allow_dodge_reroll and player.has_skill(Skill.DODGE) and \
+                not self.get_adjacent_players(from_position, team=opp_team, down=False, skill=Skill.TACKLE):
+            reroll = True
+        elif allow_team_reroll and self.can_use_reroll(player.team):
+            reroll = True
+        return self._get_prob_grid(player, modifiers, reroll)
+
+    def get_pickup_prob_grid(self, player, allow_pickup_reroll=True, allow_team_reroll=False):
+        """
+        :param player:
+        :param allow_pickup_reroll:
+        :param allow_team_reroll:
+        :return: an array with the probability of a successful pickup for player of a ball on each square.
+        """
+        modifiers = np.ones((self.state.pitch.height, self.state.pitch.width), dtype=int)
+        if not player.has_skill(Skill.BIG_HAND):
+            modifiers -= self.get_tackle_zone_grid(self.get_opp_team(player.team))
+            if self.state.weather == WeatherType.POURING_RAIN:
+                modifiers -= 1
+        if player.has_skill(Skill.EXTRA_ARMS):
+            modifiers += 1
+        reroll = (allow_pickup_reroll and player.has_skill(Skill.SURE_HANDS)) or \
+            (allow_team_reroll and self.can_use_reroll(player.team))
+        return self._get_prob_grid(player, modifiers, reroll)
+
+    def get_catch_prob_grid(self, player, accurate=False, interception=False, handoff=False, allow_catch_reroll=True,
+                            allow_team_reroll=False):
+        """
+        :param player:
+        :param accurate: whether it is an accurate pass
+        :param interception: whether it is an interception attempt
+        :param handoff: whether it is a handoff
+        :param allow_catch_reroll:
+        :param allow_team_reroll:
+        :return: an array with the probability of a successful catch for player if standing on each square.
+        """
+        height = self.state.pitch.height
+        width = self.state.pitch.width
+        modifiers = 1 if accurate or handoff else 0
+        if player.has_skill(Skill.DIVING_CATCH) and accurate:
+            modifiers += 1
+        modifiers = -2 if interception else modifiers
+        if interception and player.has_skill(Skill.VERY_LONG_LEGS):
+            modifiers += 1
+        if self.state.weather == WeatherType.POURING_RAIN:
+            modifiers -= 1
+        if player.has_skill(Skill.EXTRA_ARMS):
+            modifiers += 1
+        modifiers = np.full((height, width), modifiers)
+        # Opposing tackle zones
+        opp_team = self.get_opp_team(player.team)
+        if not player.has_skill(Skill.NERVES_OF_STEEL):
+            modifiers -= self.get_tackle_zone_grid(opp_team)
+        # Disturbing presence
+        for opp_player in opp_team.players:
+            if opp_player.has_skill(Skill.DISTURBING_PRESENCE) and opp_player.position:
+                x, y = opp_player.position.x, opp_player.position.y
+                modifiers[max(0, y - 3):y + 4, max(0, x - 3):x + 4] -= 1
+        reroll = (allow_catch_reroll and player.has_skill(Skill.CATCH)) or \
+            (allow_team_reroll and self.can_use_reroll(player.team))
+        return self._get_prob_grid(player, modifiers, reroll)
+
+    def get_pass_prob_grid(self, player, dump_off=False, allow_pass_reroll=True, allow_team_reroll=False):
+        """
+        :param player: the passer.
+        :param dump_off: whether it is a dump-off pass.
+        :param allow_pass_reroll:
+        :param allow_team_reroll:
+        :return: an array with the probability of an accurate pass from the player's position to each square. Squares
+        the player cannot pass to are 0.
+        """
+        allowed = np.zeros(len(Game.pass_distances), dtype=bool)
+        distance_modifiers = np.zeros(len(Game.pass_distances), dtype=int)
+        for distance in self._get_allowed_pass_distances(player, dump_off):
+            allowed[distance.value] = True
+            distance_modifiers[distance.value] = self.get_pass_modifiers(player, distance)
+        grid = self.get_pass_distance_grid(player.position)
+        reroll = (allow_pass_reroll and player.has_skill(Skill.PASS)) or \
+            (allow_team_reroll and self.can_use_reroll(player.team))
+        return self._get_prob_grid(player, distance_modifiers[grid], reroll) * allowed[grid]
+
     def num_block_dice_at(self, attacker, defender, position, blitz=False, dauntless_success=False):
         """
         :param attacker:
@@ -1876,17 +2200,30 @@ class Game:
     def num_assists_at(self, attacker, defender, position, foul: bool = False):
         '''
         Return net assists for a block of player on opp_player when player has moved to position first.  Required for
-        calculating assists after moving in a Blitz action.
+        calculating assists after moving in a Blitz action. Whether an assisting player is in the tackle zone of
+        another player is looked up in the grids of players that can assist in Pitch.tackle_zones.
         :param attacker: Player
         :param defender: Player
         :param position: Square
         :param ignore_guard: bool
         :return: int - Net # of assists
         '''
+        tackle_zones = self.state.pitch.tackle_zones
+        tackle_zones.sync()
 
         # Note that because blitzing/fouling player may have moved, calculating assists for is slightly different to against.
         # Assists against
-        opp_assisters = self.get_adjacent_players(position, team=self.get_opp_team(attacker.team), down=False)
+        # Players at the attacker's original square and at position are discounted from the players marking an assister
+        excluded = [self.get_player_at(position)]
+        if attacker.position is not None and attacker.position != position:
+            excluded.append(self.get_player_at(attacker.position))
+        excluded = [player for player in excluded
+                    if player is not None and player.team == attacker.team and player.can_assist()]
+        opp_team = self.get_opp_team(attacker.team)
+        num_opp_assisters = tackle_zones.num_assisters(opp_team, position)
+        if defender.can_assist() and defender.position.distance(position) == 1:
+            num_opp_assisters -= 1
+        opp_assisters = self.get_adjacent_players(position, team=opp_team, down=False) if num_opp_assisters > 0 else []
         n_assist_against: int = 0
         for assister in opp_assisters:
             # For each opponent, check if they can assist
@@ -1898,19 +2235,19 @@ class Game:
                 n_assist_against += 1
             else:
                 # Check if in a tackle zone of anyone besides player (at either original square, or "position")
-                adjacent_to_assisters = self.get_adjacent_opponents(assister, down=False)
-                found_adjacent = False
-                for adjacent_to_assister in adjacent_to_assisters:
-                    # Need to make sure we take into account the blocking/blitzing player may be in a different square than currently represented on the board.
-                    if adjacent_to_assister.position == position or adjacent_to_assister.position == attacker.position or not adjacent_to_assister.can_assist():
-                        continue
-                    else:
-                        found_adjacent = True
-                        break
-                if not found_adjacent:
+                markers = tackle_zones.num_assisters(attacker.team, assister.position)
+                for player in excluded:
+                    if player.position.distance(assister.position) == 1:
+                        markers -= 1
+                if markers == 0:
                     n_assist_against += 1
         # Assists for
-        assisters = self.get_adjacent_opponents(defender, down=False)
+        # The defender is adjacent to all assisters
+        defender_marks = 1 if defender.can_assist() else 0
+        num_assisters = tackle_zones.num_adjacent(attacker.team, defender.position)
+        if attacker.position is not None and attacker.position.distance(defender.position) == 1:
+            num_assisters -= 1
+        assisters = self.get_adjacent_opponents(defender, down=False) if num_assisters > 0 else []
         n_assists_for: int = 0
         for assister in assisters:
             if assister == attacker:
@@ -1919,19 +2256,8 @@ class Game:
                 n_assists_for += 1
             elif not assister.can_assist():
                 continue
-            else:
-                adjacent_to_assisters = self.get_adjacent_opponents(assister, down=False)
-                found_adjacent = False
-                for adjacent_to_assister in adjacent_to_assisters:
-                    if adjacent_to_assister == defender:
-                        continue
-                    if not adjacent_to_assister.can_assist():
-                        continue
-                    else:
-                        found_adjacent = True
-                        break
-                if not found_adjacent:
-                    n_assists_for += 1
+            elif tackle_zones.num_assisters(defender.team, assister.position) == defender_marks:
+                n_assists_for += 1
         return (n_assists_for, n_assist_against)
 
     def get_pass_distances(self, passer, dump_off=False):
@@ -1948,8 +2274,21 @@ class Game:
         :param weather:
         :return: two lists (squares, distances) indicating the PassDistance to each square that the passer can pass to if at the given position.
         """
-        squares = []
-        distances = []
+        distances_allowed = self._get_allowed_pass_distances(passer, dump_off)
+        allowed = np.zeros(len(Game.pass_distances), dtype=bool)
+        for distance in distances_allowed:
+            allowed[distance.value] = True
+        grid = self.get_pass_distance_grid(position)
+        ys, xs = np.nonzero(allowed[grid])
+        pool = self.state.pitch.squares
+        squares = [pool[y][x] for y, x in zip(ys.tolist(), xs.tolist())]
+        distances = [Game.pass_distances[distance] for distance in grid[ys, xs].tolist()]
+        return squares, distances
+
+    def _get_allowed_pass_distances(self, passer, dump_off):
+        """
+        :return: the PassDistances the passer can pass over given the passer's skills and the weather.
+        """
         if dump_off:
             distances_allowed = [PassDistance.QUICK_PASS]
         else:
@@ -1957,20 +2296,23 @@ class Game:
                                  PassDistance.SHORT_PASS,
                                  PassDistance.LONG_PASS,
                                  PassDistance.LONG_BOMB,
-                                 PassDistance.HAIL_MARY] if Skill.HAIL_MARY_PASS in passer.get_skills() \
+                                 PassDistance.HAIL_MARY] if passer.has_skill(Skill.HAIL_MARY_PASS) \
                 else [PassDistance.QUICK_PASS, PassDistance.SHORT_PASS, PassDistance.LONG_PASS, PassDistance.LONG_BOMB]
         if self.state.weather == WeatherType.BLIZZARD:
             distances_allowed = [PassDistance.QUICK_PASS, PassDistance.SHORT_PASS]
-        for y in range(len(self.state.pitch.board)):
-            for x in range(len(self.state.pitch.board[y])):
-                to_position = Square(x, y)
-                if self.is_out_of_bounds(to_position) or position == to_position:
-                    continue
-                distance = self.get_pass_distance(position, to_position)
-                if distance in distances_allowed:
-                    squares.append(to_position)
-                    distances.append(distance)
-        return squares, distances
+        return distances_allowed
+
+    def get_pass_distance_grid(self, position):
+        """
+        :param position: the position of the passer.
+        :return: an array with the value of the PassDistance from position to each square of the pitch. Squares that
+        are out of bounds and the position itself are 0.
+        """
+        height = self.state.pitch.height
+        width = self.state.pitch.width
+        offsets, in_bounds = get_pass_distance_grids(width, height)
+        grid = offsets[height - 1 - position.y:2 * height - 1 - position.y, width - 1 - position.x:2 * width - 1 - position.x]
+        return grid * in_bounds
 
     def get_pass_distance(self, from_position, to_position):
         """
@@ -2009,51 +2351,37 @@ class Game:
         :param position_to where the ball is passed to
         """
 
-        # 1) Find line x from a to b
-        x = get_line((position_from.x, position_from.y), (position_to.x, position_to.y))
+        # 1-4) Look up the squares on and next to the line that are within the distance of the pass
+        corridor = get_pass_corridor(position_to.x - position_from.x, position_to.y - position_from.y)
 
-        # 3) Find squares s where x intersects
-        s = []
-        for i in x:
-            s.append(Square(i[0], i[1]))
-
-        # 3) Include manhattan neighbors s into n
-        # 4) Remove squares where distance to a is larger than dist(a,b)
-        max_distance = position_from.distance(position_to)
+        # 5) Remove squares without standing opponents with hands
+        board = self.state.pitch.board
+        squares = self.state.pitch.squares
+        width = self.state.pitch.width
+        height = self.state.pitch.height
         n = set()
-        for square in s:
-            for neighbor in self.get_adjacent_squares(square) + [square]:
-
-                if neighbor in n:
-                    continue
-
-                # 4) Remove squares where distance to a is larger than dist(a,b)
-                if neighbor.distance(position_from) > max_distance:
-                    continue
-                if neighbor.distance(position_to) > max_distance:
-                    continue
-                if neighbor.x > max(position_from.x, position_to.x) or neighbor.x < min(position_from.x, position_to.x):
-                    continue
-                if neighbor.y > max(position_from.y, position_to.y) or neighbor.y < min(position_from.y, position_to.y):
-                    continue
-
-                # 5) Remove squares without standing opponents with hands
-                player_at = self.get_player_at(neighbor)
-                if player_at is None:
-                    continue
-                if player_at.team != team:
-                    continue
-                if not player_at.can_catch():
-                    continue
-                if player_at.has_skill(Skill.NO_HANDS):
-                    continue
-                n.add(neighbor)
+        for dx, dy in corridor:
+            x = position_from.x + dx
+            y = position_from.y + dy
+            if not (0 <= x < width and 0 <= y < height):
+                continue
+            player_at = board[y][x]
+            if player_at is None:
+                continue
+            if player_at.team != team:
+                continue
+            if not player_at.can_catch():
+                continue
+            if player_at.has_skill(Skill.NO_HANDS):
+                continue
+            n.add(squares[y][x])
 
         if position_from in n:
             n.remove(position_from)
         if position_to in n:
             n.remove(position_to)
 
+        # 6) Determine players on squares
         players = []
         for square in n:
             players.append(self.get_player_at(square))
@@ -2066,6 +2394,68 @@ class Game:
         """
         return self.state.available_actions
 
+    def _get_action_mask_layout(self, non_spatial_action_types, spatial_action_types):
+        squares = self.arena.width * self.arena.height
+        key = (squares, tuple(non_spatial_action_types), tuple(spatial_action_types))
+        layout = Game.action_mask_layouts.get(key)
+        if layout is None:
+            non_spatial = {action_type: i for i, action_type in enumerate(non_spatial_action_types)}
+            spatial = {action_type: len(non_spatial_action_types) + i * squares
+                       for i, action_type in enumerate(spatial_action_types)}
+            layout = (non_spatial, spatial)
+            Game.action_mask_layouts[key] = layout
+        return layout
+
+    def get_action_mask(self, non_spatial_action_types, spatial_action_types, out=None):
+        """
+        Flattens the available actions into a boolean mask with an entry for each non-spatial action type followed by
+        an entry for each square of the arena, in row-major order, for each spatial action type. The mask is written
+        directly from the available action choices without creating intermediate lists.
+        :param non_spatial_action_types: the action types that are not performed on a square.
+        :param spatial_action_types: the action types that are performed on a square.
+        :param out: a boolean array of size len(non_spatial_action_types) + len(spatial_action_types) * height *
+        width to write the mask to. A new array is created if None.
+        :return: the action mask.
+        """
+        non_spatial, spatial = self._get_action_mask_layout(non_spatial_action_types, spatial_action_types)
+        width = self.arena.width
+        if out is None:
+            out = np.zeros(len(non_spatial) + len(spatial) * width * self.arena.height, dtype=bool)
+        else:
+            out.fill(False)
+        for action_choice in self.state.available_actions:
+            i = non_spatial.get(action_choice.action_type)
+            if i is not None:
+                out[i] = True
+            offset = spatial.get(action_choice.action_type)
+            if offset is None:
+                continue
+            if action_choice.positions:
+                for position in action_choice.positions:
+                    if position is not None:
+                        out[offset + position.y * width + position.x] = True
+            else:
+                for player in action_choice.players:
+                    if player is not None and player.position is not None:
+                        out[offset + player.position.y * width + player.position.x] = True
+        return out
+
+    def get_action_from_index(self, index, non_spatial_action_types, spatial_action_types):
+        """
+        :param index: an index into the action mask of get_action_mask().
+        :param non_spatial_action_types: the action types that are not performed on a square.
+        :param spatial_action_types: the action types that are performed on a square.
+        :return: the Action at the index of the action mask.
+        """
+        index = int(index)
+        if index < len(non_spatial_action_types):
+            return Action(non_spatial_action_types[index])
+        spatial_index = index - len(non_spatial_action_types)
+        squares = self.arena.width * self.arena.height
+        action_type = spatial_action_types[spatial_index // squares]
+        y, x = divmod(spatial_index % squares, self.arena.width)
+        return Action(action_type, position=self.get_square(x, y))
+
     def clear_board(self):
         """
         Moves all players from the board to their respective reserves box.
@@ -2107,27 +2497,24 @@ class Game:
             self.pitch_to_casualties(player)
         # Report effect and MNG
         if effect == CasualtyEffect.NONE:
-            self.report(Outcome(OutcomeType.BADLY_HURT, player=player, opp_player=inflictor, team=player.team,
-                                rolls=[roll]))
+            self.report(OutcomeType.BADLY_HURT, player=player, opp_player=inflictor, team=player.team,
+                        rolls=[roll])
         elif effect in Rules.miss_next_game:
             if effect not in player.state.injuries_gained and CasualtyEffect.MNG not in player.state.injuries_gained:
                 player.state.injuries_gained.append(CasualtyEffect.MNG)
-            self.report(Outcome(OutcomeType.MISS_NEXT_GAME, player=player, opp_player=inflictor, team=player.team,
-                                rolls=[roll], n=effect.name))
+            self.report(OutcomeType.MISS_NEXT_GAME, player=player, opp_player=inflictor, team=player.team,
+                        rolls=[roll], n=effect.name)
         elif effect == CasualtyEffect.DEAD:
-            self.report(Outcome(OutcomeType.DEAD, player=player, opp_player=inflictor, team=player.team,
-                                rolls=[roll]))
+            self.report(OutcomeType.DEAD, player=player, opp_player=inflictor, team=player.team,
+                        rolls=[roll])
         # Add injuries
         if effect is not CasualtyEffect.MNG and effect is not CasualtyEffect.NONE:
             player.state.injuries_gained.append(effect)
+        player.invalidate_stats()
 
     def get_current_turn_proc(self):
         """
         :return: the Turn procedure that is highest on the stack.
         """
-        for i in range(len(self.state.stack.items)):
-            idx = len(self.state.stack.items) - 1 - i
-            if type(self.state.stack.items[idx]) == Turn:
-                return self.state.stack.items[idx]
-        return None
+        return self.state.stack.get_last(Turn)
 
@@ -0,0 +1,506 @@
+"""
+This module contains the journal used to revert steps of a game. When journaling is enabled, every attribute write on a
+Reversible object and every modification of a reversible list, set or dict records an entry that can undo it. Entries
+are grouped by game step so the last steps of a game can be reverted (and redone) in time proportional to what changed.
+"""
+
+import threading
+import weakref
+from copy import copy
+
+
+class _Missing:
+    """
+    Marks a dict key or attribute that did not exist before an entry was recorded.
+    """
+
+    def __repr__(self):
+        return "MISSING"
+
+
+MISSING = _Missing()
+
+
+def _apply_attribute(obj, name, value):
+    d = obj.__dict__
+    old = d.get(name, MISSING)
+    if value is MISSING:
+        d.pop(name, None)
+    else:
+        d[name] = value
+    return _apply_attribute, obj, name, old
+
+
+def _apply_dict(d, key, value):
+    old = d.get(key, MISSING)
+    if value is MISSING:
+        dict.pop(d, key, None)
+    else:
+        dict.__setitem__(d, key, value)
+    return _apply_dict, d, key, old
+
+
+def _apply_list(lst, start, stop, items):
+    old = list.__getitem__(lst, slice(start, stop))
+    list.__setitem__(lst, slice(start, stop), items)
+    return _apply_list, lst, start, start + len(items), old
+
+
+def _apply_set(s, added, removed):
+    set.difference_update(s, added)
+    set.update(s, removed)
+    return _apply_set, s, removed, added
+
+
+def _apply_item(container, key, value):
+    old = copy(container[key])
+    container[key] = value
+    return _apply_item, container, key, old
+
+
+def _apply_rng(rnd, state):
+    old = rnd.get_state()
+    rnd.set_state(state)
+    return _apply_rng, rnd, old
+
+
+def _apply(entry):
+    """
+    Applies the entry and returns the entry that will undo it.
+    """
+    return entry[0](*entry[1:])
+
+
+class Journal:
+    """
+    Records entries that undo modifications of the game state. Each entry is a tuple of a function and its arguments
+    and applying an entry returns the entry that reverses it again.
+    """
+
+    # The number of journals that are neither detached nor garbage-collected, see Reversible
+    num_attached = 0
+    _lock = threading.Lock()
+
+    def __init__(self):
+        self.enabled = True
+        self.entries = []
+        self.steps = []
+        self.redo_steps = []
+        self.converted = {}
+        # The objects and containers that were attached, by their id
+        self.attached = {}
+        # The attached objects and containers that were given values that are not attached yet, by their id
+        self.pending = {}
+        with Journal._lock:
+            if Journal.num_attached == 0:
+                Reversible.__setattr__ = _journaled_setattr
+            Journal.num_attached += 1
+        # Releases the hook when the journal is detached or, if it never is, garbage-collected
+        self._release = weakref.finalize(self, Journal._release_hook)
+
+    @staticmethod
+    def _release_hook():
+        with Journal._lock:
+            Journal.num_attached -= 1
+            if Journal.num_attached == 0:
+                del Reversible.__setattr__
+
+    def clone(self, memo):
+        # Clones of a game start without a journal
+        return None
+
+    def log_attribute(self, obj, name):
+        self.entries.append((_apply_attribute, obj, name, obj.__dict__.get(name, MISSING)))
+
+    def log_dict(self, d, key):
+        self.entries.append((_apply_dict, d, key, d.get(key, MISSING)))
+
+    def log_list(self, lst, start, stop, old_items):
+        self.entries.append((_apply_list, lst, start, stop, old_items))
+
+    def log_set(self, s, added, removed):
+        self.entries.append((_apply_set, s, added, removed))
+
+    def log_item(self, container, key):
+        """
+        Records the item at key in a container that is not reversible itself, e.g. a numpy array.
+        """
+        self.entries.append((_apply_item, container, key, copy(container[key])))
+
+    def begin_step(self, rnd):
+        """
+        Starts a new step that can be reverted. The state of the random number generator is saved with the step.
+        """
+        self.attach_pending()
+        self.redo_steps.clear()
+        self.steps.append(len(self.entries))
+        self.entries.append((_apply_rng, rnd, rnd.get_state()))
+
+    def num_steps(self):
+        return len(self.steps)
+
+    def revert(self, n=1):
+        """
+        Reverts the last n steps.
+        """
+        assert 0 <= n <= len(self.steps)
+        self.attach_pending()
+        for _ in range(n):
+            start = self.steps.pop()
+            redo_entries = []
+            for entry in reversed(self.entries[start:]):
+                redo_entries.append(_apply(entry))
+                self.track_entry(entry)
+            redo_entries.reverse()
+            del self.entries[start:]
+            self.redo_steps.append(redo_entries)
+        self.attach_pending()
+
+    def redo(self, n=1):
+        """
+        Redoes the last n reverted steps.
+        """
+        assert 0 <= n <= len(self.redo_steps)
+        self.attach_pending()
+        for _ in range(n):
+            redo_entries = self.redo_steps.pop()
+            self.steps.append(len(self.entries))
+            for entry in redo_entries:
+                self.entries.append(_apply(entry))
+                self.track_entry(entry)
+        self.attach_pending()
+
+    def track(self, holder, value):
+        """
+        Called when value is stored in the attached holder. If value is not attached, it is attached by the next call
+        to attach_pending(), i.e. before the next step, so that the code that stored it can keep modifying it for the
+        rest of the step. Modifications of such a value are not recorded, which is fine as it was not part of the state
+        at the beginning of the step.
+        """
+        value_type = type(value)
+        if value_type is list or value_type is set or value_type is dict or \
+                (isinstance(value, _reversible_types) and value._journal is not self):
+            self.pending[id(holder)] = holder
+
+    def track_entry(self, entry):
+        """
+        Tracks the values that were restored by applying an entry.
+        """
+        function = entry[0]
+        if function is _apply_attribute or function is _apply_dict:
+            self.track(entry[1], entry[3])
+        elif function is _apply_list:
+            for item in entry[4]:
+                self.track(entry[1], item)
+        elif function is _apply_set:
+            for item in entry[3]:
+                self.track(entry[1], item)
+
+    def attach_pending(self):
+        """
+        Attaches the values that were stored in attached objects and containers since the last call.
+        """
+        while self.pending:
+            pending = self.pending
+            self.pending = {}
+            for holder in pending.values():
+                self.attach_items(holder)
+
+    def attach(self, value):
+        """
+        Attaches the journal to value and to all reversible objects reachable from it. Lists, sets and dicts held by
+        reversible objects are replaced by their reversible counterparts. A container is only converted once so objects
+        that shared a list keep sharing it. The journal must only be attached between steps, since code that holds on to
+        a converted container would modify the original.
+        :return: value or, if value is a plain list, set or dict, its reversible counterpart.
+        """
+        value_type = type(value)
+        if value_type is list or value_type is set or value_type is dict:
+            converted = self.converted.get(id(value))
+            if converted is not None:
+                return converted[1]
+            original = value
+            if value_type is list:
+                value = ReversibleList(original)
+            elif value_type is set:
+                value = ReversibleSet(original)
+            else:
+                value = ReversibleDict(original)
+            # The original is kept alive so its id is not reused
+            self.converted[id(original)] = (original, value)
+        elif not isinstance(value, _reversible_types):
+            return value
+        if value._journal is self:
+            return value
+        object.__setattr__(value, '_journal', self)
+        self.attached[id(value)] = value
+        self.attach_items(value)
+        return value
+
+    def attach_items(self, value):
+        """
+        Attaches the journal to the attributes of a reversible object or to the items of a reversible container.
+        """
+        if isinstance(value, Reversible):
+            for name, attribute in value.__dict__.items():
+                if name != '_journal':
+                    value.__dict__[name] = self.attach(attribute)
+        elif isinstance(value, ReversibleList):
+            for i, item in enumerate(value):
+                list.__setitem__(value, i, self.attach(item))
+        elif isinstance(value, ReversibleDict):
+            for key, item in value.items():
+                dict.__setitem__(value, key, self.attach(item))
+        else:
+            for item in value:
+                self.attach(item)
+
+    def detach(self):
+        """
+        Detaches the journal from all objects and containers it was attached to and discards its entries. The
+        containers keep their reversible types.
+        """
+        if not self.enabled:
+            return
+        self.enabled = False
+        for value in self.attached.values():
+            if value.__dict__.get('_journal') is self:
+                del value.__dict__['_journal']
+        self.attached = {}
+        self.pending = {}
+        self.converted = {}
+        self.entries = []
+        self.steps = []
+        self.redo_steps = []
+        self._release()
+
+
+class Reversible:
+    """
+    Base class of game objects whose attribute writes are recorded by an enabled journal. Reversible.__setattr__ is only
+    defined while a journal exists, i.e. until every journal is detached or garbage-collected, so attribute writes are
+    plain writes when no game is journaled.
+    """
+
+    _journal = None
+
+
+def _journaled_setattr(self, name, value):
+    journal = self._journal
+    if journal is not None and journal.enabled:
+        journal.log_attribute(self, name)
+        journal.track(self, value)
+    object.__setattr__(self, name, value)
+
+
+class ReversibleList(list):
+    """
+    A list whose modifications are recorded by an enabled journal.
+    """
+
+    _journal = None
+
+    def clone(self, memo):
+        # Clones of a game start without a journal
+        from ffai.core.util import clone_value
+        return [clone_value(item, memo) for item in self]
+
+    def _log(self, start, stop, old_items):
+        journal = self._journal
+        if journal is not None and journal.enabled:
+            journal.log_list(self, start, stop, old_items)
+            return journal
+        return None
+
+    def _log_all(self):
+        return self._log(0, 0, list(self))
+
+    def _fix_last_entry(self):
+        # Snapshots are recorded before the modification so the stop index is set afterwards
+        journal = self._journal
+        if journal is not None and journal.enabled:
+            entry = journal.entries[-1]
+            journal.entries[-1] = (entry[0], entry[1], entry[2], len(self), entry[4])
+
+    def append(self, item):
+        journal = self._log(len(self), len(self) + 1, [])
+        if journal is not None:
+            journal.track(self, item)
+        super().append(item)
+
+    def extend(self, items):
+        items = list(items)
+        journal = self._log(len(self), len(self) + len(items), [])
+        if journal is not None:
+            for item in items:
+                journal.track(self, item)
+        super().extend(items)
+
+    def insert(self, index, item):
+        index = max(0, min(len(self), index + len(self) if index < 0 else index))
+        journal = self._log(index, index + 1, [])
+        if journal is not None:
+            journal.track(self, item)
+        super().insert(index, item)
+
+    def pop(self, index=-1):
+        index = index + len(self) if index < 0 else index
+        item = super().pop(index)
+        self._log(index, index, [item])
+        return item
+
+    def remove(self, item):
+        index = self.index(item)
+        super().pop(index)
+        self._log(index, index, [item])
+
+    def clear(self):
+        self._log(0, 0, list(self))
+        super().clear()
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            journal = self._log_all()
+            if journal is not None:
+                for item in value:
+                    journal.track(self, item)
+            super().__setitem__(index, value)
+            self._fix_last_entry()
+            return
+        index = index + len(self) if index < 0 else index
+        journal = self._log(index, index + 1, [list.__getitem__(self, index)])
+        if journal is not None:
+            journal.track(self, value)
+        super().__setitem__(index, value)
+
+    def __delitem__(self, index):
+        self._log_all()
+        super().__delitem__(index)
+        self._fix_last_entry()
+
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+
+    def sort(self, *args, **kwargs):
+        self._log_all()
+        super().sort(*args, **kwargs)
+        self._fix_last_entry()
+
+    def reverse(self):
+        self._log_all()
+        super().reverse()
+        self._fix_last_entry()
+
+
+class ReversibleSet(set):
+    """
+    A set whose modifications are recorded by an enabled journal.
+    """
+
+    _journal = None
+
+    def clone(self, memo):
+        # Clones of a game start without a journal
+        from ffai.core.util import clone_value
+        return {clone_value(item, memo) for item in self}
+
+    def _log(self, added, removed):
+        journal = self._journal
+        if journal is not None and journal.enabled and (added or removed):
+            journal.log_set(self, added, removed)
+            for item in added:
+                journal.track(self, item)
+
+    def add(self, item):
+        if item not in self:
+            self._log({item}, set())
+            super().add(item)
+
+    def remove(self, item):
+        super().remove(item)
+        self._log(set(), {item})
+
+    def discard(self, item):
+        if item in self:
+            self.remove(item)
+
+    def pop(self):
+        item = super().pop()
+        self._log(set(), {item})
+        return item
+
+    def clear(self):
+        self._log(set(), set(self))
+        super().clear()
+
+    def update(self, *others):
+        added = set().union(*others) - self
+        self._log(added, set())
+        super().update(added)
+
+    def difference_update(self, *others):
+        removed = self & set().union(*others)
+        self._log(set(), removed)
+        super().difference_update(removed)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __isub__(self, other):
+        self.difference_update(other)
+        return self
+
+
+class ReversibleDict(dict):
+    """
+    A dict whose modifications are recorded by an enabled journal.
+    """
+
+    _journal = None
+
+    def clone(self, memo):
+        # Clones of a game start without a journal
+        from ffai.core.util import clone_value
+        return {clone_value(key, memo): clone_value(value, memo) for key, value in self.items()}
+
+    def _log(self, key):
+        journal = self._journal
+        if journal is not None and journal.enabled:
+            journal.log_dict(self, key)
+            return journal
+        return None
+
+    def __setitem__(self, key, value):
+        journal = self._log(key)
+        if journal is not None:
+            journal.track(self, value)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._log(key)
+        super().__delitem__(key)
+
+    def pop(self, key, *default):
+        if key in self:
+            self._log(key)
+        return super().pop(key, *default)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self):
+        for key in list(self.keys()):
+            self._log(key)
+        super().clear()
+
+
+_reversible_types = (Reversible, ReversibleList, ReversibleSet, ReversibleDict)
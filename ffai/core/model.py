@@ -11,8 +11,10 @@ import numpy as np
 import uuid
 import time
 import json
+import itertools
 from math import sqrt
 from ffai.core.util import *
+from ffai.core.journal import Reversible
 from ffai.core.table import *
 
 
@@ -127,13 +129,45 @@ class Configuration:
         self.fast_mode = False
         self.debug_mode = False
         self.competition_mode = False
+        self.clocks = True
         self.kick_scatter_distance = "d6"
         self.offensive_formations = []
         self.defensive_formations = []
         self.time_limits = None
+        # OutcomeTypes to add to the game's reports - None reports all and an empty set reports none
+        self.reported_outcome_types = None
+        # Maximum number of outcomes kept in the game's reports - None keeps all of them
+        self.report_capacity = None
+        # Don't print why actions are not allowed, e.g. when training bots
+        self.silent = False
+        # Hand bots a clone of the game when it starts - the batch simulator shares the game with its bots
+        self.clone_game_for_agents = True
+
+
+class PlayerVersions:
+    """
+    Version counters of the players in a game, shared by the pitch and the states of the players. tackle_zones is
+    incremented whenever a change of a player can affect whether it has a tackle zone or can assist, so TackleZones
+    knows when to synchronize, and players whenever a player or its state changes, so BoardArrays knows when to
+    refresh its player arrays. The counters are not recorded by the journal and only ever increase.
+    """
+
+    __slots__ = ('tackle_zones', 'players')
 
+    def __init__(self):
+        self.tackle_zones = 0
+        self.players = 0
+
+    def clone(self, memo):
+        return clone_object(self, memo)
+
+
+class PlayerState(Reversible):
 
-class PlayerState:
+    # Attributes that decide whether a player has a tackle zone
+    tackle_zone_attributes = frozenset(['up', 'bone_headed', 'hypnotized', 'really_stupid'])
+    # The PlayerVersions of the game, set outside the journal by GameState
+    versions = None
 
     def __init__(self):
         self.up = True
@@ -172,6 +206,17 @@ class PlayerState:
             'taken_root': self.taken_root
         }
 
+    def clone(self, memo):
+        return clone_object(self, memo)
+
+    def __setattr__(self, name, value):
+        versions = self.versions
+        if versions is not None:
+            versions.players += 1
+            if name in PlayerState.tackle_zone_attributes and self.__dict__.get(name) != value:
+                versions.tackle_zones += 1
+        super().__setattr__(name, value)
+
     def reset(self):
         self.up = True
         self.used = False
@@ -227,7 +272,7 @@ class Agent:
         raise NotImplementedError("This method must be overridden by non-human subclasses")
 
 
-class TeamState:
+class TeamState(Reversible):
 
     def __init__(self, team):
         self.bribes = 0
@@ -262,6 +307,9 @@ class TeamState:
             'time_violation': self.time_violation
         }
 
+    def clone(self, memo):
+        return clone_object(self, memo)
+
     def reset_turn(self):
         self.reroll_used = False
 
@@ -270,7 +318,7 @@ class TeamState:
         self.reroll_used = True
 
 
-class Clock:
+class Clock(Reversible):
 
     def __init__(self, team, seconds, is_primary=False):
         self.seconds = seconds
@@ -323,12 +371,15 @@ class Clock:
             'started_at': self.started_at
         }
 
+    def clone(self, memo):
+        return clone_object(self, memo)
+
 
-class GameState:
+class GameState(Reversible):
 
     def __init__(self, game, home_team, away_team):
         self.stack = Stack()
-        self.reports = []
+        self.reports = EventLog(game.config.report_capacity)
         self.half = 1
         self.round = 0
         self.coin_toss_winner = None
@@ -348,6 +399,8 @@ class GameState:
                 self.team_by_player_id[player.player_id] = team
                 self.player_by_id[player.player_id] = player
         self.pitch = Pitch(game.arena.width, game.arena.height)
+        for player in self.player_by_id.values():
+            object.__setattr__(player.state, 'versions', self.pitch.player_versions)
         self.dugouts = {team.team_id: Dugout(team) for team in self.teams}
         self.weather = WeatherType.NICE
         self.gentle_gust = False
@@ -375,7 +428,7 @@ class GameState:
             'weather': self.weather.name,
             'gentle_gust': self.gentle_gust,
             'available_actions': [action.to_json() for action in self.available_actions],
-            'reports': [report.to_json() for report in self.reports],
+            'reports': self.reports.to_json(),
             'current_team_id': self.current_team.team_id if self.current_team is not None else None,
             'round': self.round,
             'spectators': self.spectators,
@@ -383,23 +436,30 @@ class GameState:
             'clocks': [ clock.to_json() for clock in self.clocks ]
         }
 
+    def clone(self, memo):
+        return clone_object(self, memo)
 
-class Pitch:
+
+class Pitch(Reversible):
 
     range = [-1, 0, 1]
 
     def __init__(self, width, height):
         self.balls = []
         self.board = []
-        self.squares = []
+        self.squares = get_square_pool(width, height)
         for y in range(height):
             self.board.append([])
-            self.squares.append([])
             for x in range(width):
                 self.board[y].append(None)
-                self.squares[y].append(Square(x, y))
         self.height = len(self.board)
         self.width = len(self.board[0])
+        self.arrays = None
+        self.player_versions = PlayerVersions()
+        self.tackle_zones = TackleZones(width, height, self.player_versions)
+        # The players of each team on the board by the index, y * width + x, of their square
+        self.team_players = {}
+        self.version = 0
 
     def to_json(self):
         board = []
@@ -413,19 +473,334 @@ class Pitch:
             'balls': [ball.to_json() for ball in self.balls]
         }
 
+    def clone(self, memo):
+        # Squares are immutable and are shared with the clone
+        clone = Pitch.__new__(Pitch)
+        memo[id(self)] = clone
+        clone.__dict__.update(self.__dict__)
+        clone.__dict__.pop('_journal', None)
+        clone.balls = clone_value(self.balls, memo)
+        clone.board = clone_value(self.board, memo)
+        clone.arrays = clone_value(self.arrays, memo)
+        clone.player_versions = clone_value(self.player_versions, memo)
+        clone.tackle_zones = self.tackle_zones.clone(memo)
+        clone.team_players = clone_value(self.team_players, memo)
+        return clone
+
+    def set_player(self, position, player):
+        """
+        Records that player, or None, was placed at position. Called by Game.put(), Game.remove() and Game.swap().
+        """
+        self.increment_version()
+        key = position.y * self.width + position.x
+        for players in self.team_players.values():
+            if key in players:
+                del players[key]
+                break
+        if player is not None:
+            players = self.team_players.get(player.team.team_id)
+            if players is None:
+                players = {}
+                self.team_players[player.team.team_id] = players
+            players[key] = player
+
+    def increment_version(self):
+        """
+        Marks that the board has changed. Caches of values computed from the board, e.g. by the path finder, compare
+        the version to the one they were computed at. It is written outside the journal so a reverted board never gets
+        a version that it had before.
+        """
+        object.__setattr__(self, 'version', self.version + 1)
+
+    def increment_player_versions(self):
+        """
+        Marks that any player may have changed, e.g. after the journal reverted a step without going through the
+        attribute hooks of the players.
+        """
+        self.player_versions.tackle_zones += 1
+        self.player_versions.players += 1
+
+    def get_team_players(self, team):
+        """
+        :return: the players of the team on the board in row-major order of their squares.
+        """
+        players = self.team_players.get(team.team_id) if team is not None else None
+        if not players:
+            return []
+        return [players[key] for key in sorted(players)]
+
+
+class TackleZones(Reversible):
+    """
+    Grids with the number of adjacent players, the number of adjacent tackle zones and the number of adjacent players
+    that can assist of each team for every square. The grids mirror the players on Pitch.board and are updated by
+    Game.put(), Game.remove(), Game.move() and Game.swap(). Whether a player has a tackle zone and can assist is
+    rechecked for all players on the board by sync() when the state of any player has changed.
+    """
+
+    def __init__(self, width, height, player_versions):
+        self.width = width
+        self.height = height
+        self.player_versions = player_versions
+        self.adjacent = {}
+        self.tackle_zones = {}
+        self.assisters = {}
+        self.occupants = {}
+        self.version = -1
+
+    def clone(self, memo):
+        return clone_object(self, memo)
+
+    def _get_grid(self, grids, team):
+        grid = grids.get(team.team_id)
+        if grid is None:
+            grid = [[0 for _ in range(self.width)] for _ in range(self.height)]
+            grids[team.team_id] = grid
+        return grid
+
+    def _add(self, grid, x, y, value):
+        for yy in range(max(0, y - 1), min(self.height, y + 2)):
+            row = grid[yy]
+            for xx in range(max(0, x - 1), min(self.width, x + 2)):
+                if xx != x or yy != y:
+                    row[xx] += value
+
+    def set(self, position, piece):
+        """
+        Updates the grids after piece, or None, was placed on the board at position.
+        """
+        key = position.y * self.width + position.x
+        occupant = self.occupants.get(key)
+        if occupant is not None:
+            player, has_tackle_zone, can_assist = occupant
+            self._add(self._get_grid(self.adjacent, player.team), position.x, position.y, -1)
+            if has_tackle_zone:
+                self._add(self._get_grid(self.tackle_zones, player.team), position.x, position.y, -1)
+            if can_assist:
+                self._add(self._get_grid(self.assisters, player.team), position.x, position.y, -1)
+            del self.occupants[key]
+        if isinstance(piece, Player):
+            has_tackle_zone = piece.has_tackle_zone()
+            can_assist = piece.can_assist()
+            self._add(self._get_grid(self.adjacent, piece.team), position.x, position.y, 1)
+            if has_tackle_zone:
+                self._add(self._get_grid(self.tackle_zones, piece.team), position.x, position.y, 1)
+            if can_assist:
+                self._add(self._get_grid(self.assisters, piece.team), position.x, position.y, 1)
+            self.occupants[key] = (piece, has_tackle_zone, can_assist)
+
+    def sync(self):
+        """
+        Rechecks the tackle zones and assists of all players on the board if the state of any player has changed since
+        the last call.
+        """
+        if self.version == self.player_versions.tackle_zones:
+            return
+        for key, (player, had_tackle_zone, could_assist) in list(self.occupants.items()):
+            has_tackle_zone = player.has_tackle_zone()
+            can_assist = player.can_assist()
+            if has_tackle_zone != had_tackle_zone:
+                grid = self._get_grid(self.tackle_zones, player.team)
+                self._add(grid, key % self.width, key // self.width, 1 if has_tackle_zone else -1)
+            if can_assist != could_assist:
+                grid = self._get_grid(self.assisters, player.team)
+                self._add(grid, key % self.width, key // self.width, 1 if can_assist else -1)
+            self.occupants[key] = (player, has_tackle_zone, can_assist)
+        self.version = self.player_versions.tackle_zones
+
+    def num_adjacent(self, team, position):
+        """
+        :return: the number of players on the team adjacent to position.
+        """
+        grid = self.adjacent.get(team.team_id)
+        return grid[position.y][position.x] if grid is not None else 0
+
+    def num_tackle_zones(self, team, position):
+        """
+        :return: the number of tackle zones of players on the team that position is in. sync() must be called first.
+        """
+        grid = self.tackle_zones.get(team.team_id)
+        return grid[position.y][position.x] if grid is not None else 0
+
+    def num_assisters(self, team, position):
+        """
+        :return: the number of players on the team adjacent to position that can assist, i.e. that are standing and
+        not distracted. sync() must be called first.
+        """
+        grid = self.assisters.get(team.team_id)
+        return grid[position.y][position.x] if grid is not None else 0
+
+
+class BoardArrays(Reversible):
+    """
+    A struct-of-arrays representation of the pitch and the players in a game for vectorized consumers. The grid holds
+    the index of the player on each square or -1 if it is empty, and the player arrays hold the position, team, state
+    and stats of each player. The grid and the positions are kept in sync by Game.put(), Game.remove(), Game.move() and
+    Game.swap() while the remaining player arrays are refreshed from the player objects by sync() when a player has
+    changed.
+    """
+
+    def __init__(self, width, height, teams, player_versions):
+        self.player_versions = player_versions
+        self.version = -1
+        self.players = [player for team in teams for player in team.players]
+        self.index = {player.player_id: i for i, player in enumerate(self.players)}
+        num_players = len(self.players)
+        self.grid = np.full((height, width), -1, dtype=np.int16)
+        self.position = np.full((num_players, 2), -1, dtype=np.int16)
+        self.team = np.array([teams.index(player.team) for player in self.players], dtype=np.int8)
+        self.up = np.zeros(num_players, dtype=bool)
+        self.stunned = np.zeros(num_players, dtype=bool)
+        self.used = np.zeros(num_players, dtype=bool)
+        self.moves = np.zeros(num_players, dtype=np.int8)
+        self.ma = np.zeros(num_players, dtype=np.int8)
+        self.st = np.zeros(num_players, dtype=np.int8)
+        self.ag = np.zeros(num_players, dtype=np.int8)
+        self.av = np.zeros(num_players, dtype=np.int8)
+        for player in self.players:
+            if player.position is not None:
+                self.put(player, player.position)
+        self.update_players()
+
+    def clone(self, memo):
+        clone = BoardArrays.__new__(BoardArrays)
+        memo[id(self)] = clone
+        clone.__dict__.update({name: value.copy() if type(value) is np.ndarray else clone_value(value, memo)
+                               for name, value in self.__dict__.items()})
+        return clone
+
+    def _set(self, array, key, value):
+        journal = self._journal
+        if journal is not None and journal.enabled:
+            journal.log_item(array, key)
+        array[key] = value
+
+    def put(self, piece, position):
+        i = self.index.get(piece.player_id) if isinstance(piece, Player) else None
+        if i is None:
+            return
+        self._set(self.grid, (position.y, position.x), i)
+        self._set(self.position, i, (position.x, position.y))
+
+    def remove(self, piece, position):
+        i = self.index.get(piece.player_id) if isinstance(piece, Player) else None
+        if i is None:
+            return
+        if self.grid[position.y, position.x] == i:
+            self._set(self.grid, (position.y, position.x), -1)
+        self._set(self.position, i, -1)
+
+    def sync(self):
+        """
+        Refreshes the state and stats arrays if a player has changed since they were last refreshed.
+        """
+        if self.version != self.player_versions.players:
+            self.update_players()
+
+    def update_players(self):
+        """
+        Refreshes the state and stats arrays from the player objects.
+        """
+        self.version = self.player_versions.players
+        for i, player in enumerate(self.players):
+            state = player.state
+            self.up[i] = state.up
+            self.stunned[i] = state.stunned
+            self.used[i] = state.used
+            self.moves[i] = state.moves
+            self.ma[i] = player.get_ma()
+            self.st[i] = player.get_st()
+            self.ag[i] = player.get_ag()
+            self.av[i] = player.get_av()
+
+    def on_pitch(self):
+        """
+        :return: a boolean mask of the players on the pitch.
+        """
+        return self.position[:, 0] >= 0
+
+    def occupied(self):
+        """
+        :return: a boolean grid of the occupied squares.
+        """
+        return self.grid >= 0
+
+    def team_grid(self, team_index):
+        """
+        :param team_index: the index of the team in GameState.teams.
+        :return: a boolean grid of the squares occupied by players on the team.
+        """
+        return (self.grid >= 0) & (self.team[self.grid] == team_index)
+
 
 class ActionChoice:
 
-    def __init__(self, action_type, team, positions=None, players=None, rolls=None, block_rolls=None, agi_rolls=None, skill=None, disabled=False):
+    __slots__ = ('action_type', 'positions', 'players', 'team', 'rolls', '_block_rolls', 'disabled', '_agi_rolls', 'skill',
+                 '_position_keys', '_player_ids', '_game')
+
+    def __init__(self, action_type, team, positions=None, players=None, rolls=None, block_rolls=None, agi_rolls=None, skill=None, disabled=False, game=None):
+        """
+        block_rolls and agi_rolls can be given as functions without arguments that return the rolls. They are then
+        computed from the state of the game on first access, so they are only valid until the next call to
+        Game.step(). Reading them for the first time when the choice is no longer among the available actions of game
+        raises an exception; rolls that were read before remain available.
+        """
         self.action_type = action_type
         self.positions = [] if positions is None else positions
         self.players = [] if players is None else players
         self.team = team
         self.rolls = [] if rolls is None else rolls
-        self.block_rolls = [] if block_rolls is None else block_rolls
+        self._block_rolls = [] if block_rolls is None else block_rolls
         self.disabled = disabled
-        self.agi_rolls = [] if agi_rolls is None else agi_rolls
+        self._agi_rolls = [] if agi_rolls is None else agi_rolls
         self.skill = skill
+        self._position_keys = None
+        self._player_ids = None
+        self._game = game
+
+    @property
+    def block_rolls(self):
+        if callable(self._block_rolls):
+            self._check_game_state()
+            self._block_rolls = self._block_rolls()
+        return self._block_rolls
+
+    @block_rolls.setter
+    def block_rolls(self, block_rolls):
+        self._block_rolls = block_rolls
+
+    @property
+    def agi_rolls(self):
+        if callable(self._agi_rolls):
+            self._check_game_state()
+            self._agi_rolls = self._agi_rolls()
+        return self._agi_rolls
+
+    @agi_rolls.setter
+    def agi_rolls(self, agi_rolls):
+        self._agi_rolls = agi_rolls
+
+    def _check_game_state(self):
+        if self._game is not None and not any(choice is self for choice in self._game.state.available_actions):
+            raise Exception("The rolls of an action choice must be read before the game takes another step")
+
+    def has_position(self, position):
+        """
+        :return: True if position, or None, is among the positions. The positions are hashed on the first call, after
+        which they must not be modified.
+        """
+        if self._position_keys is None:
+            self._position_keys = set((p.x, p.y) if p is not None else None for p in self.positions)
+        return ((position.x, position.y) if position is not None else None) in self._position_keys
+
+    def has_player(self, player):
+        """
+        :return: True if player, or None, is among the players. The players are hashed on the first call, after which
+        they must not be modified.
+        """
+        if self._player_ids is None:
+            self._player_ids = set(p.player_id if p is not None else None for p in self.players)
+        return (player.player_id if player is not None else None) in self._player_ids
 
     def to_json(self):
         return {
@@ -440,9 +815,15 @@ class ActionChoice:
             "disabled": self.disabled
         }
 
+    def clone(self, memo):
+        # Lazy rolls are bound to the cloned procedure, so the clone computes them from the cloned game
+        return clone_object(self, memo)
+
 
 class Action:
 
+    __slots__ = ('action_type', 'position', 'player')
+
     def __init__(self, action_type, position=None, player=None):
         self.action_type = action_type
         self.position = position
@@ -455,6 +836,9 @@ class Action:
             'player_id': self.player.player_id if self.player is not None else None
         }
 
+    def clone(self, memo):
+        return clone_object(self, memo)
+
 
 class TwoPlayerArena:
 
@@ -496,12 +880,21 @@ class TwoPlayerArena:
 
 class Die:
 
+    __slots__ = ()
+
     def get_value(self):
         Exception("Method not implemented")
 
+    def clone(self, memo):
+        # Dice are not modified after they are rolled and are shared with clones
+        return self
+
 
 class DiceRoll:
 
+    __slots__ = ('dice', 'sum', 'd68', 'target', 'modifiers', 'roll_type', 'target_higher', 'target_lower',
+                 'highest_succeed', 'lowest_fail')
+
     def __init__(self, dice, modifiers=0, target=None, d68=False, roll_type=RollType.AGILITY_ROLL, target_higher=True, target_lower=False, highest_succeed=True, lowest_fail=True):
         self.dice = dice
         self.sum = 0
@@ -539,6 +932,9 @@ class DiceRoll:
             'lowest_fail': self.lowest_fail
         }
 
+    def clone(self, memo):
+        return clone_object(self, memo)
+
     def modified_target(self):
         if self.target is not None:
             return max(1*len(self.dice), min(6*len(self.dice), self.target - self.modifiers))
@@ -585,6 +981,8 @@ class DiceRoll:
 
 class D3(Die):
 
+    __slots__ = ('value',)
+
     FixedRolls = []
 
     @staticmethod
@@ -612,6 +1010,8 @@ class D3(Die):
 
 class D6(Die):
 
+    __slots__ = ('value',)
+
     FixedRolls = []
 
     @staticmethod
@@ -639,6 +1039,8 @@ class D6(Die):
 
 class D8(Die):
 
+    __slots__ = ('value',)
+
     FixedRolls = []
 
     @staticmethod
@@ -666,6 +1068,8 @@ class D8(Die):
 
 class BBDie(Die):
 
+    __slots__ = ('value',)
+
     FixedRolls = []
 
     @staticmethod
@@ -698,7 +1102,7 @@ class BBDie(Die):
         }
 
 
-class Dugout:
+class Dugout(Reversible):
 
     def __init__(self, team):
         self.team = team
@@ -716,6 +1120,9 @@ class Dugout:
             'dungeon': [player.player_id for player in self.dungeon]
         }
 
+    def clone(self, memo):
+        return clone_object(self, memo)
+
 
 class Role:
 
@@ -734,8 +1141,12 @@ class Role:
         self.d_skill_sets = d_skill_sets if d_skill_sets is not None else []
         self.star_player = star_player
 
+    def clone(self, memo):
+        # Roles are loaded with the ruleset and are shared with clones
+        return self
+
 
-class Piece:
+class Piece(Reversible):
 
     def __init__(self, position=None):
         self.position = position
@@ -749,11 +1160,10 @@ class Ball(Piece):
         self.is_carried = is_carried
 
     def move(self, x, y):
-        self.position.x += x
-        self.position.y += y
+        self.position = Square(self.position.x + x, self.position.y + y)
 
     def move_to(self, position):
-        self.position = Square(position.x, position.y)
+        self.position = position
 
     def to_json(self):
         return {
@@ -762,9 +1172,17 @@ class Ball(Piece):
             'is_carried': self.is_carried
         }
 
+    def clone(self, memo):
+        return clone_object(self, memo)
+
 
 class Player(Piece):
 
+    # Attributes that the cached stats and skill mask are computed from
+    stat_attributes = frozenset(['role', 'extra_skills', 'extra_ma', 'extra_st', 'extra_ag', 'extra_av', 'injuries',
+                                 'state'])
+    _stats = None
+
     def __init__(self, player_id, role, name, nr, team, extra_skills=None, extra_ma=0, extra_st=0, extra_ag=0, extra_av=0,
                  niggling_injuries=0, mng=False, spp=0, injuries=None, position=None):
         super().__init__(position)
@@ -805,42 +1223,82 @@ class Player(Piece):
             'position': self.position.to_json() if self.position is not None else None
         }
 
+    def clone(self, memo):
+        return clone_object(self, memo)
+
+    def __setattr__(self, name, value):
+        if name == 'state':
+            # A new state, e.g. a copy restored by the path finder, belongs to the same game as the old one
+            state = self.__dict__.get('state')
+            if state is not None:
+                object.__setattr__(value, 'versions', state.versions)
+        super().__setattr__(name, value)
+        if name in Player.stat_attributes:
+            super().__setattr__('_stats', None)
+            self._increment_versions()
+
+    def _increment_versions(self):
+        state = self.__dict__.get('state')
+        if state is not None and state.versions is not None:
+            state.versions.tackle_zones += 1
+            state.versions.players += 1
+
+    def invalidate_stats(self):
+        """
+        Must be called when the injuries gained by the player, the lists of skills and injuries or the role of the
+        player are modified in place, e.g. when a skill is appended to extra_skills. Assigning the attributes of the
+        player invalidates the stats automatically.
+        """
+        self._stats = None
+        self._increment_versions()
+
+    def _get_stats(self):
+        stats = self._stats
+        if stats is None:
+            stats = self._compute_stats()
+            self._stats = stats
+        return stats
+
+    def _compute_stats(self):
+        injuries = self.injuries + self.state.injuries_gained
+        ma = self.role.ma + self.extra_ma - injuries.count(CasualtyEffect.MA)
+        ma = min(10, max(1, max(self.role.ma - 2, ma)))
+        st = self.role.st + self.extra_st - injuries.count(CasualtyEffect.ST)
+        st = min(10, max(1, max(self.role.st - 2, st)))
+        ag = self.role.ag + self.extra_ag - injuries.count(CasualtyEffect.AG)
+        ag = min(10, max(1, max(self.role.ag - 2, ag)))
+        av = self.role.av + self.extra_av - injuries.count(CasualtyEffect.AV)
+        av = min(10, max(1, max(self.role.av - 2, av)))
+        skill_mask = 0
+        for skill in self.get_skills():
+            skill_mask |= skill.mask
+        return ma, st, ag, av, skill_mask
+
     def get_ag(self):
-        ag = self.role.ag + self.extra_ag - self.injuries.count(CasualtyEffect.AG) - self.state.injuries_gained.count(CasualtyEffect.AG)
-        ag = max(self.role.ag - 2, ag)
-        ag = max(1, ag)
-        ag = min(10, ag)
-        return ag
+        return self._get_stats()[2]
 
     def get_st(self):
-        st = self.role.st + self.extra_st - self.injuries.count(CasualtyEffect.ST) - self.state.injuries_gained.count(CasualtyEffect.ST)
-        st = max(self.role.st - 2, st)
-        st = max(1, st)
-        st = min(10, st)
-        return st
+        return self._get_stats()[1]
 
     def get_ma(self):
         if self.state.taken_root:
             return 0
-        else:
-            ma = self.role.ma + self.extra_ma - self.injuries.count(CasualtyEffect.MA) - self.state.injuries_gained.count(CasualtyEffect.MA)
-            ma = max(self.role.ma - 2, ma)
-            ma = max(1, ma)
-            ma = min(10, ma)
-            return ma
+        return self._get_stats()[0]
 
     def get_av(self):
-        av =  self.role.av + self.extra_av -  - self.injuries.count(CasualtyEffect.AV) - self.state.injuries_gained.count(CasualtyEffect.AV)
-        av = max(self.role.av - 2, av)
-        av = max(1, av)
-        av = min(10, av)
-        return av
+        return self._get_stats()[3]
+
+    def get_skill_mask(self):
+        """
+        :return: an int with the bit Skill.mask set for each skill of the player.
+        """
+        return self._get_stats()[4]
 
     def num_niggling_injuries(self):
         return self.injuries.count(CasualtyEffect.NIGGLING)
 
     def has_skill(self, skill):
-        return skill in self.get_skills()
+        return self._get_stats()[4] & skill.mask != 0
 
     def has_used_skill(self, skill):
         return skill in self.state.used_skills
@@ -863,7 +1321,7 @@ class Player(Piece):
 
     def can_catch(self):
         return self.state.up and not self.state.bone_headed and not self.state.hypnotized and \
-               not self.state.really_stupid and Skill.NO_HANDS not in self.get_skills()
+               not self.state.really_stupid and not self.has_skill(Skill.NO_HANDS)
 
     def can_assist(self):
         return self.state.up and not self.state.bone_headed and not self.state.hypnotized and not self.state.really_stupid
@@ -895,10 +1353,31 @@ class Player(Piece):
 
 
 class Square:
+    """
+    An immutable position. Squares are shared between players, balls, actions and clones of a game and get_square_pool()
+    keeps one instance of every square on the pitch.
+    """
+
+    __slots__ = ('x', 'y')
 
     def __init__(self, x, y):
-        self.x = x
-        self.y = y
+        object.__setattr__(self, 'x', x)
+        object.__setattr__(self, 'y', y)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Squares are immutable")
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return Square, (self.x, self.y)
+
+    def clone(self, memo):
+        return self
 
     def to_json(self):
         return {
@@ -926,6 +1405,208 @@ class Square:
         return self.distance(other, manhattan) == 1
 
 
+_square_pools = {}
+
+
+def get_square_pool(width, height):
+    """
+    :return: a tuple of rows with one immutable square for each position on a pitch of the given size. The pool is
+    created once and shared by all pitches of that size.
+    """
+    pool = _square_pools.get((width, height))
+    if pool is None:
+        pool = tuple(tuple(Square(x, y) for x in range(width)) for y in range(height))
+        _square_pools[(width, height)] = pool
+    return pool
+
+
+_pass_distance_grids = {}
+
+
+def get_pass_distance_grids(width, height):
+    """
+    :return: a tuple (offsets, in_bounds) for a pitch of the given size. offsets[height - 1 + dy, width - 1 + dx] is the
+    value of the PassDistance of a pass dy squares vertically and dx squares horizontally and 0 if dx and dy are 0.
+    in_bounds is True for the squares of the pitch that are not out of bounds. The arrays are created once, are shared
+    by all pitches of that size and must not be modified.
+    """
+    grids = _pass_distance_grids.get((width, height))
+    if grids is None:
+        offsets = np.zeros((2 * height - 1, 2 * width - 1), dtype=np.int8)
+        for dy in range(-height + 1, height):
+            for dx in range(-width + 1, width):
+                if abs(dy) >= len(Rules.pass_matrix) or abs(dx) >= len(Rules.pass_matrix[0]):
+                    distance = PassDistance.HAIL_MARY.value
+                else:
+                    distance = Rules.pass_matrix[abs(dy)][abs(dx)]
+                offsets[height - 1 + dy, width - 1 + dx] = distance
+        in_bounds = np.zeros((height, width), dtype=bool)
+        in_bounds[1:height - 1, 1:width - 1] = True
+        offsets.flags.writeable = False
+        in_bounds.flags.writeable = False
+        grids = (offsets, in_bounds)
+        _pass_distance_grids[(width, height)] = grids
+    return grids
+
+
+_pass_corridors = {}
+
+
+def get_pass_corridor(dx, dy):
+    """
+    :return: a tuple of the (x, y) offsets, relative to the passer, of the squares from which a player can intercept a
+    pass dx squares horizontally and dy squares vertically: the squares on the line of the pass and their neighbors
+    that are not further away from the passer or the target than the length of the pass and that are within the
+    bounding box of the pass. The offsets are in the order they are found when following the line from the passer.
+    The corridor is computed once for each offset.
+    """
+    corridor = _pass_corridors.get((dx, dy))
+    if corridor is None:
+        max_distance = max(abs(dx), abs(dy))
+        seen = set()
+        offsets = []
+        for x, y in get_line((0, 0), (dx, dy)):
+            neighbors = [(x + xx, y + yy) for yy in [-1, 0, 1] for xx in [-1, 0, 1] if xx != 0 or yy != 0]
+            for nx, ny in neighbors + [(x, y)]:
+                if (nx, ny) in seen:
+                    continue
+                seen.add((nx, ny))
+                if max(abs(nx), abs(ny)) > max_distance:
+                    continue
+                if max(abs(nx - dx), abs(ny - dy)) > max_distance:
+                    continue
+                if nx > max(0, dx) or nx < min(0, dx) or ny > max(0, dy) or ny < min(0, dy):
+                    continue
+                offsets.append((nx, ny))
+        corridor = tuple(offsets)
+        _pass_corridors[(dx, dy)] = corridor
+    return corridor
+
+
+# The skills of the attacker and the defender that change the outcome of a block
+BLOCK_ATTACKER_SKILLS = [Skill.BLOCK, Skill.TACKLE, Skill.WRESTLE, Skill.JUGGERNAUT, Skill.STRIP_BALL, Skill.PRO]
+BLOCK_DEFENDER_SKILLS = [Skill.BLOCK, Skill.DODGE, Skill.WRESTLE, Skill.STAND_FIRM, Skill.SURE_HANDS]
+BLOCK_ATTACKER_SKILL_MASK = sum(skill.mask for skill in BLOCK_ATTACKER_SKILLS)
+BLOCK_DEFENDER_SKILL_MASK = sum(skill.mask for skill in BLOCK_DEFENDER_SKILLS)
+_block_die_faces = [BBDieResult.ATTACKER_DOWN, BBDieResult.BOTH_DOWN, BBDieResult.PUSH, BBDieResult.PUSH,
+                    BBDieResult.DEFENDER_STUMBLES, BBDieResult.DEFENDER_DOWN]
+_block_outcome_probs = {}
+
+
+def _block_outcome_value(outcome):
+    """
+    :return: how much the attacker favors a block outcome (attacker down, defender down, attacker fumble, defender
+    fumble, crowd push). Knock-downs and fumbles count the same and ties are broken by keeping the attacker standing.
+    """
+    attacker_down, defender_down, attacker_fumble, defender_fumble, _ = outcome
+    return defender_down + defender_fumble - attacker_down - attacker_fumble, not attacker_down
+
+
+def _push_outcome(attacker_skills, defender_skills, blitz, crowd, attacker_ball, defender_ball, knock_down):
+    juggernaut = blitz and attacker_skills & Skill.JUGGERNAUT.mask
+    if defender_skills & Skill.STAND_FIRM.mask and not juggernaut:
+        return False, knock_down, False, defender_ball and knock_down, False
+    if crowd:
+        return False, True, False, defender_ball, True
+    strip = attacker_skills & Skill.STRIP_BALL.mask != 0 and defender_skills & Skill.SURE_HANDS.mask == 0
+    return False, knock_down, False, defender_ball and (knock_down or strip), False
+
+
+def _block_die_outcome(face, attacker_skills, defender_skills, blitz, crowd, attacker_ball, defender_ball):
+    """
+    :return: the outcome of a selected block die as a tuple of booleans (attacker down, defender down, attacker
+    fumble, defender fumble, crowd push). Juggernaut, Wrestle and Stand Firm are used when they favor their player.
+    """
+    context = attacker_skills, defender_skills, blitz, crowd, attacker_ball, defender_ball
+    if face == BBDieResult.ATTACKER_DOWN:
+        return True, False, attacker_ball, False, False
+    if face == BBDieResult.PUSH:
+        return _push_outcome(*context, knock_down=False)
+    if face == BBDieResult.DEFENDER_STUMBLES:
+        knock_down = defender_skills & Skill.DODGE.mask == 0 or attacker_skills & Skill.TACKLE.mask != 0
+        return _push_outcome(*context, knock_down=knock_down)
+    if face == BBDieResult.DEFENDER_DOWN:
+        return _push_outcome(*context, knock_down=True)
+    attacker_block = attacker_skills & Skill.BLOCK.mask != 0
+    defender_block = defender_skills & Skill.BLOCK.mask != 0
+    juggernaut = blitz and attacker_skills & Skill.JUGGERNAUT.mask
+    both_down = not attacker_block, not defender_block, attacker_ball and not attacker_block, \
+        defender_ball and not defender_block, False
+    wrestle = True, True, attacker_ball, defender_ball, False
+    attacker_wrestle = attacker_skills & Skill.WRESTLE.mask and not (attacker_block and not defender_block)
+    defender_wrestle = defender_skills & Skill.WRESTLE.mask and not (defender_block and not attacker_block) \
+        and not juggernaut
+    options = [both_down]
+    if juggernaut:
+        options.append(_push_outcome(*context, knock_down=False))
+    if attacker_wrestle:
+        options.append(wrestle)
+    outcome = max(options, key=_block_outcome_value)
+    if defender_wrestle and _block_outcome_value(wrestle) < _block_outcome_value(outcome):
+        outcome = wrestle
+    return outcome
+
+
+def _block_roll_distribution(dice, context):
+    """
+    :return: a dict with the probability of each outcome of one block roll, where the attacker selects the die if
+    dice is positive and the defender otherwise.
+    """
+    outcomes = [_block_die_outcome(face, *context) for face in _block_die_faces]
+    distribution = {}
+    for faces in itertools.product(range(len(_block_die_faces)), repeat=abs(dice)):
+        options = [outcomes[face] for face in faces]
+        if dice > 0:
+            outcome = max(options, key=_block_outcome_value)
+        else:
+            outcome = min(options, key=_block_outcome_value)
+        distribution[outcome] = distribution.get(outcome, 0) + 1 / len(_block_die_faces) ** abs(dice)
+    return distribution
+
+
+def get_block_outcome_probs(dice, attacker_skills, defender_skills, blitz=False, crowd=False, attacker_ball=False,
+                            defender_ball=False):
+    """
+    Looks up the distribution of the outcome of a block. The distribution is computed once for each context from all
+    combinations of block dice and shared between games. It is an estimate, since it makes these assumptions:
+    - The player selecting the die picks it by a fixed preference: knock-downs and fumbles first, then keeping the
+      attacker standing. An agent may pick differently, e.g. a push to follow up.
+    - Pro is used, as in the Reroll procedure, to re-roll the whole block roll on a 4+, and only after a result that
+      knocks the attacker down. A failed Pro roll is not re-rolled.
+    - Team re-rolls are ignored.
+    :param dice: the number of block dice; negative if the defender selects the die.
+    :param attacker_skills: the skill mask of the attacker, e.g. Player.get_skill_mask(). Pro is only taken into
+    account if it can still be used.
+    :param defender_skills: the skill mask of the defender.
+    :param blitz: whether the block is part of a blitz, which allows the attacker to use Juggernaut.
+    :param crowd: whether the defender is pushed into the crowd unless it has Stand Firm.
+    :param attacker_ball: whether the attacker carries the ball.
+    :param defender_ball: whether the defender carries the ball.
+    :return: a tuple containing the probabilities that the attacker is knocked down, that the defender is knocked
+    down, that the attacker fumbles, that the defender fumbles and that the defender is pushed into the crowd.
+    """
+    key = (dice, attacker_skills & BLOCK_ATTACKER_SKILL_MASK, defender_skills & BLOCK_DEFENDER_SKILL_MASK, bool(blitz),
+           bool(crowd), bool(attacker_ball), bool(defender_ball))
+    probs = _block_outcome_probs.get(key)
+    if probs is None:
+        context = key[1:]
+        distribution = _block_roll_distribution(dice, context)
+        if key[1] & Skill.PRO.mask:
+            # Pro re-rolls the block dice on a 4+
+            rerolled = {}
+            for outcome, p in distribution.items():
+                if outcome[0]:
+                    for new_outcome, new_p in distribution.items():
+                        rerolled[new_outcome] = rerolled.get(new_outcome, 0) + p * new_p / 2
+                    rerolled[outcome] = rerolled.get(outcome, 0) + p / 2
+                else:
+                    rerolled[outcome] = rerolled.get(outcome, 0) + p
+            distribution = rerolled
+        probs = tuple(sum((p for outcome, p in distribution.items() if outcome[i]), 0.0) for i in range(5))
+        _block_outcome_probs[key] = probs
+    return probs
+
+
 class Race:
 
     def __init__(self, name, roles, reroll_cost, apothecary, stakes):
@@ -936,7 +1617,7 @@ class Race:
         self.stakes = stakes
 
 
-class Team:
+class Team(Reversible):
 
     def __init__(self, team_id, name, race, players=None, treasury=0, apothecaries=0, rerolls=0, ass_coaches=0,
                  cheerleaders=0, fan_factor=0):
@@ -972,6 +1653,9 @@ class Team:
             'state': self.state.to_json()
         }
 
+    def clone(self, memo):
+        return clone_object(self, memo)
+
     def __eq__(self, other):
         return other is not None and other.team_id == self.team_id
 
@@ -981,6 +1665,8 @@ class Team:
 
 class Outcome:
 
+    __slots__ = ('outcome_type', 'position', 'player', 'opp_player', 'rolls', 'team', 'n', 'skill')
+
     def __init__(self, outcome_type, position=None, player=None, opp_player=None, rolls=None, team=None, n=0, skill=None):
         self.outcome_type = outcome_type
         self.position = position
@@ -1006,6 +1692,169 @@ class Outcome:
             'skill': self.skill.name if self.skill is not None else None
         }
 
+    def clone(self, memo):
+        # Rolls are part of the game's history and are shared with the clone
+        clone = Outcome.__new__(Outcome)
+        memo[id(self)] = clone
+        for name in Outcome.__slots__:
+            setattr(clone, name, getattr(self, name))
+        clone.player = clone_value(self.player, memo)
+        clone.opp_player = clone_value(self.opp_player, memo)
+        clone.team = clone_value(self.team, memo)
+        return clone
+
+
+class EventLog(Reversible):
+    """
+    The outcomes reported in a game. Each outcome is given a monotonic sequence number and, if a capacity is set, only
+    the most recent capacity outcomes are kept in a ring buffer. Consumers can either subscribe a callback that is
+    called with each new outcome or read the outcomes reported since a sequence number, e.g. with an EventCursor.
+    Callbacks are not cloned with the game and are not called again when steps are reverted or redone.
+    """
+
+    def __init__(self, capacity=None):
+        """
+        :param capacity: the maximum number of outcomes to keep. None keeps all of them.
+        """
+        assert capacity is None or capacity > 0
+        self.capacity = capacity
+        self.events = []
+        self.seq = 0
+        # The sequence number of the outcome in events[0] when the log was last empty, see _index()
+        self.offset = 0
+        object.__setattr__(self, 'subscribers', ())
+
+    def append(self, outcome):
+        """
+        Adds an outcome to the log and calls the callbacks subscribed to its type.
+        """
+        if self.capacity is None or len(self.events) < self.capacity:
+            self.events.append(outcome)
+        else:
+            self.events[(self.seq - self.offset) % self.capacity] = outcome
+        self.seq += 1
+        for outcome_types, callback in self.subscribers:
+            if outcome_types is None or outcome.outcome_type in outcome_types:
+                callback(outcome)
+
+    def subscribe(self, callback, outcome_types=None):
+        """
+        :param callback: function called with each new outcome.
+        :param outcome_types: the OutcomeTypes to call back on. None calls back on all outcomes.
+        """
+        outcome_types = frozenset(outcome_types) if outcome_types is not None else None
+        object.__setattr__(self, 'subscribers', self.subscribers + ((outcome_types, callback),))
+
+    def unsubscribe(self, callback):
+        object.__setattr__(self, 'subscribers', tuple(s for s in self.subscribers if s[1] is not callback))
+
+    def cursor(self, outcome_types=None):
+        """
+        :return: an EventCursor that reads the outcomes reported from now on.
+        """
+        return EventCursor(self, outcome_types)
+
+    def first_seq(self):
+        """
+        :return: the sequence number of the oldest outcome in the log.
+        """
+        return self.seq - len(self.events)
+
+    def _index(self, i):
+        """
+        :return: the index in events of the i'th oldest outcome in the log.
+        """
+        if self.capacity is None or len(self.events) < self.capacity:
+            return i
+        return (self.seq - self.offset + i) % self.capacity
+
+    def since(self, seq, outcome_types=None):
+        """
+        :param seq: a sequence number. Outcomes that have already been dropped from the log are skipped.
+        :param outcome_types: the OutcomeTypes to return. None returns all outcomes.
+        :return: the outcomes with a sequence number of at least seq, oldest first.
+        """
+        seq = max(seq, self.first_seq())
+        if seq >= self.seq:
+            return []
+        if self.capacity is None or len(self.events) < self.capacity:
+            outcomes = self.events[seq - self.first_seq():]
+        else:
+            i = self._index(seq - self.first_seq())
+            j = self._index(0)
+            outcomes = self.events[i:j] if i < j else self.events[i:] + self.events[:j]
+        if outcome_types is None:
+            return outcomes
+        return [outcome for outcome in outcomes if outcome.outcome_type in outcome_types]
+
+    def last(self, n):
+        """
+        :return: the n most recent outcomes, oldest first.
+        """
+        return self.since(self.seq - n)
+
+    def clear(self):
+        """
+        Drops all outcomes from the log. Sequence numbers are not reset.
+        """
+        self.events.clear()
+        self.offset = self.seq
+
+    def __len__(self):
+        return len(self.events)
+
+    def __iter__(self):
+        if self.capacity is None or len(self.events) < self.capacity:
+            return iter(self.events)
+        start = self._index(0)
+        return itertools.chain(itertools.islice(self.events, start, None), itertools.islice(self.events, start))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.since(0)[index]
+        n = len(self.events)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("EventLog index out of range")
+        return self.events[self._index(index)]
+
+    def to_json(self):
+        return [outcome.to_json() for outcome in self.since(0)]
+
+    def clone(self, memo):
+        clone = EventLog.__new__(EventLog)
+        memo[id(self)] = clone
+        clone.capacity = self.capacity
+        clone.events = [outcome.clone(memo) for outcome in self.events]
+        clone.seq = self.seq
+        clone.offset = self.offset
+        object.__setattr__(clone, 'subscribers', ())
+        return clone
+
+
+class EventCursor:
+    """
+    Reads the outcomes of an EventLog that were reported since the last read.
+    """
+
+    def __init__(self, log, outcome_types=None):
+        """
+        :param log: the EventLog to read.
+        :param outcome_types: the OutcomeTypes to read. None reads all outcomes.
+        """
+        self.log = log
+        self.outcome_types = frozenset(outcome_types) if outcome_types is not None else None
+        self.seq = log.seq
+
+    def read(self):
+        """
+        :return: the outcomes reported since the last read, oldest first.
+        """
+        outcomes = self.log.since(self.seq, self.outcome_types)
+        self.seq = self.log.seq
+        return outcomes
+
 
 class Inducement:
 
@@ -1046,6 +1895,10 @@ class Formation:
         self.name = name
         self.formation = formation
 
+    def clone(self, memo):
+        # Formations are loaded from files and are shared with clones
+        return self
+
     def _get_player(self, players, t):
         if t == 'S':
             idx = np.argmax([player.get_st() + (0.5 if player.has_skill(Skill.BLOCK) else 0) - (0.5 if player.has_skill(Skill.SURE_HANDS) else 0) for player in players])
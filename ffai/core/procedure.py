@@ -8,13 +8,14 @@ responsible for an isolated part of the game. Procedures are added to a stack, a
 before other procedures are run. Procedures can add other procedures to the stack simply by instantiating procedures.
 """
 from abc import abstractmethod, ABCMeta
+from functools import partial
 
 from ffai.core.model import *
 from ffai.core.table import *
 import time
 
 
-class Procedure:
+class Procedure(Reversible):
 
     def __init__(self, game, context=None):
         self.game = game
@@ -49,6 +50,13 @@ class Procedure:
         """
         return []
 
+    def clone(self, memo):
+        """
+        :param memo: a dict mapping the id of original objects to their clones.
+        :return: a copy of the procedure referring to the cloned game, players, balls and procedures in memo.
+        """
+        return clone_object(self, memo)
+
 
 class Regeneration(Procedure):
 
@@ -61,11 +69,11 @@ class Regeneration(Procedure):
         if self.player.has_skill(Skill.REGENERATION):
             regen_roll = DiceRoll([D6(self.game.rnd)], target=4, roll_type=RollType.REGENERATION_ROLL)
             if regen_roll.is_d6_success():
-                self.game.report(Outcome(OutcomeType.SUCCESSFUL_REGENERATION, player=self.player, rolls=[regen_roll]))
+                self.game.report(OutcomeType.SUCCESSFUL_REGENERATION, player=self.player, rolls=[regen_roll])
                 # self.game.pitch_to_reserves(self.player)
                 self.regenerates = True
             else:
-                self.game.report(Outcome(OutcomeType.FAILED_REGENERATION, player=self.player, rolls=[regen_roll]))
+                self.game.report(OutcomeType.FAILED_REGENERATION, player=self.player, rolls=[regen_roll])
         return True
 
 
@@ -103,13 +111,13 @@ class Apothecary(Procedure):
                 self.player.team.state.apothecaries -= 1
                 self.player.state.stunned = True
                 self.player.place_prone()
-                self.game.report(Outcome(OutcomeType.APOTHECARY_USED_KO, player=self.player, team=self.player.team))
+                self.game.report(OutcomeType.APOTHECARY_USED_KO, player=self.player, team=self.player.team)
 
             else:
 
                 # Player is KO
                 self.game.pitch_to_kod(self.player)
-                self.game.report(Outcome(OutcomeType.APOTHECARY_USED_KO, player=self.player, team=self.player.team))
+                self.game.report(OutcomeType.APOTHECARY_USED_KO, player=self.player, team=self.player.team)
 
             return True
 
@@ -123,8 +131,8 @@ class Apothecary(Procedure):
                 self.casualty_second = CasualtyType(n)
                 self.effect_second = Rules.casualty_effect[self.casualty_second]
                 self.player.team.state.apothecaries -= 1
-                self.game.report(Outcome(OutcomeType.CASUALTY_APOTHECARY, player=self.player, team=self.player.team,
-                                         rolls=[self.roll_first, self.roll_second]))
+                self.game.report(OutcomeType.CASUALTY_APOTHECARY, player=self.player, team=self.player.team,
+                                 rolls=[self.roll_first, self.roll_second])
                 self.waiting_apothecary = True
 
                 return False
@@ -221,7 +229,7 @@ class Armor(Procedure):
         if self.foul:
             if roll.same():
                 if not self.inflictor.has_skill(Skill.SNEAKY_GIT) or armor_broken:
-                    self.game.report(Outcome(OutcomeType.PLAYER_EJECTED, player=self.inflictor))
+                    self.game.report(OutcomeType.PLAYER_EJECTED, player=self.inflictor)
                     Turnover(self.game)
                     Ejection(self.game, self.inflictor)
                     ejected = True
@@ -230,11 +238,11 @@ class Armor(Procedure):
         if armor_broken:
             Injury(self.game, self.player, self.inflictor, foul=self.foul,
                    mighty_blow_used=mighty_blow_used, dirty_player_used=dirty_player_used, ejected=ejected)
-            self.game.report(Outcome(OutcomeType.ARMOR_BROKEN, player=self.player, opp_player=self.inflictor,
-                                     rolls=[roll]))
+            self.game.report(OutcomeType.ARMOR_BROKEN, player=self.player, opp_player=self.inflictor,
+                             rolls=[roll])
         else:
-            self.game.report(Outcome(OutcomeType.ARMOR_NOT_BROKEN, player=self.player, opp_player=self.inflictor,
-                                     rolls=[roll]))
+            self.game.report(OutcomeType.ARMOR_NOT_BROKEN, player=self.player, opp_player=self.inflictor,
+                             rolls=[roll])
 
         return True
 
@@ -262,11 +270,11 @@ class Stab(Procedure):
         self.roll.target = self.defender.get_av()
         if self.attacker.has_skill(Skill.STAKES) and self.defender.team.race in \
                 ['Khemri', 'Necromantic', 'Undead', 'Vampire']:
-            self.game.report(Outcome(OutcomeType.SKILL_USED, skill=Skill.STAB, player=self.attacker))
+            self.game.report(OutcomeType.SKILL_USED, skill=Skill.STAB, player=self.attacker)
             self.roll.modifiers += 1
         if self.roll.is_d6_success():
             KnockDown(self.game, player=self.defender, armor_roll=False, inflictor=self.attacker)
-        self.game.report(Outcome(OutcomeType.SKILL_USED, skill=Skill.STAB, player=self.attacker, rolls=[self.roll]))
+        self.game.report(OutcomeType.SKILL_USED, skill=Skill.STAB, player=self.attacker, rolls=[self.roll])
         # Can Stab be re-rolled?
         return True
 
@@ -285,8 +293,8 @@ class FoulAppearance(Procedure):
         if self.roll is None:
             self.roll = DiceRoll([D6(self.game.rnd)])
             self.roll.target = 2
-            self.game.report(
-                Outcome(OutcomeType.SKILL_USED, skill=Skill.FOUL_APPEARANCE, player=self.attacker, rolls=[self.roll]))
+            self.game.report(OutcomeType.SKILL_USED, skill=Skill.FOUL_APPEARANCE, player=self.attacker,
+                             rolls=[self.roll])
             if self.roll.is_d6_success():
                 return True
             else:
@@ -366,7 +374,7 @@ class Block(Procedure):
             # If not adjacent to defender - e.g. in case of fend
             if self.defender not in self.game.get_adjacent_opponents(self.attacker):
                 return True
-            self.game.report(Outcome(OutcomeType.SKILL_USED, player=self.attacker, skill=Skill.FRENZY))
+            self.game.report(OutcomeType.SKILL_USED, player=self.attacker, skill=Skill.FRENZY)
             self.attacker.use_skill(Skill.FRENZY)
             self.frenzy_checked = True
 
@@ -374,7 +382,7 @@ class Block(Procedure):
         if self.waiting_juggernaut:
             if action.action_type == ActionType.USE_SKILL:
                 self.selected_die = BBDieResult.PUSH
-                self.game.report(Outcome(OutcomeType.SKILL_USED, player=self.attacker, skill=Skill.JUGGERNAUT))
+                self.game.report(OutcomeType.SKILL_USED, player=self.attacker, skill=Skill.JUGGERNAUT)
             self.waiting_juggernaut = False
             self.juggernaut_checked = True
             return False
@@ -409,13 +417,13 @@ class Block(Procedure):
                     and self.dauntless_roll is None:
                 self.dauntless_roll = DiceRoll([D6(self.game.rnd)], roll_type=RollType.STRENGTH_ROLL)
                 self.dauntless_success = self.dauntless_roll.get_sum() + self.attacker.get_st() > self.defender.get_st()
-                self.game.report(Outcome(OutcomeType.DAUNTLESS_USED, team=self.attacker.team, player=self.attacker,
-                                         rolls=[self.dauntless_roll], n=True))
+                self.game.report(OutcomeType.DAUNTLESS_USED, team=self.attacker.team, player=self.attacker,
+                                 rolls=[self.dauntless_roll], n=True)
                 return False
 
             # Report Horns
             if self.blitz and self.attacker.has_skill(Skill.HORNS):
-                self.game.report(Outcome(OutcomeType.SKILL_USED, player=self.attacker, skill=Skill.HORNS))
+                self.game.report(OutcomeType.SKILL_USED, player=self.attacker, skill=Skill.HORNS)
 
             dice = self.game.num_block_dice(self.attacker, self.defender, blitz=self.blitz,
                                             dauntless_success=self.dauntless_success)
@@ -426,8 +434,8 @@ class Block(Procedure):
             for i in range(abs(dice)):
                 self.roll.dice.append(BBDie(self.game.rnd))
 
-            self.game.report(Outcome(OutcomeType.BLOCK_ROLL, player=self.attacker, opp_player=self.defender,
-                                     rolls=[self.roll]))
+            self.game.report(OutcomeType.BLOCK_ROLL, player=self.attacker, opp_player=self.defender,
+                             rolls=[self.roll])
 
             # check for re-roll
             self.reroll = Reroll(self.game, self.attacker, context=self)
@@ -488,7 +496,7 @@ class Block(Procedure):
             # Defender wrestle - Don't use if only one with Block skill
             if self.defender.has_skill(Skill.WRESTLE) and not (self.defender.has_skill(Skill.BLOCK) and not self.attacker.has_skill(Skill.BLOCK)):
                 if self.blitz and self.attacker.has_skill(Skill.JUGGERNAUT):
-                    self.game.report(Outcome(OutcomeType.SKILL_USED, player=self.attacker, skill=Skill.JUGGERNAUT))
+                    self.game.report(OutcomeType.SKILL_USED, player=self.attacker, skill=Skill.JUGGERNAUT)
                 else:
                     self.waiting_wrestle_defender = True
 
@@ -518,12 +526,12 @@ class Block(Procedure):
             Turnover(self.game)
             KnockDown(self.game, self.attacker, inflictor=self.defender)
         else:
-            self.game.report(Outcome(OutcomeType.SKILL_USED, player=self.attacker, skill=Skill.BLOCK))
+            self.game.report(OutcomeType.SKILL_USED, player=self.attacker, skill=Skill.BLOCK)
         # Defender down
         if not self.defender.has_skill(Skill.BLOCK):
             KnockDown(self.game, self.defender, inflictor=self.attacker)
         else:
-            self.game.report(Outcome(OutcomeType.SKILL_USED, player=self.defender, skill=Skill.BLOCK))
+            self.game.report(OutcomeType.SKILL_USED, player=self.defender, skill=Skill.BLOCK)
         return True
 
     def available_actions(self):
@@ -601,30 +609,30 @@ class Bounce(Procedure):
             y = 1
 
         self.ball.move(x, y)
-        self.game.report(Outcome(OutcomeType.BALL_BOUNCED, position=self.ball.position, rolls=[roll_scatter]))
+        self.game.report(OutcomeType.BALL_BOUNCED, position=self.ball.position, rolls=[roll_scatter])
 
         if self.kick:
             # Touchback
             if not self.game.is_team_side(self.ball.position, self.game.get_receiving_team()):
                 Touchback(self.game, self.ball)
-                self.game.report(Outcome(OutcomeType.TOUCHBACK, team=self.game.get_receiving_team(),
-                                         rolls=[roll_scatter]))
+                self.game.report(OutcomeType.TOUCHBACK, team=self.game.get_receiving_team(),
+                                 rolls=[roll_scatter])
                 return True
         else:
             # Out of bounds
             if self.game.is_out_of_bounds(self.ball.position):
                 ThrowIn(self.game, self.ball, Square(self.ball.position.x - x, self.ball.position.y - y))
-                self.game.report(Outcome(OutcomeType.BALL_OUT_OF_BOUNDS))
+                self.game.report(OutcomeType.BALL_OUT_OF_BOUNDS)
                 return True
 
         # On player -> Catch
         player_at = self.game.get_player_at(self.ball.position)
         if player_at is not None:
             Catch(self.game, player_at, self.ball)
-            self.game.report(Outcome(OutcomeType.BALL_HIT_PLAYER, position=self.ball.position, player=player_at))
+            self.game.report(OutcomeType.BALL_HIT_PLAYER, position=self.ball.position, player=player_at)
             return True
 
-        self.game.report(Outcome(OutcomeType.BALL_ON_GROUND, position=self.ball.position))
+        self.game.report(OutcomeType.BALL_ON_GROUND, position=self.ball.position)
         return True
 
     def available_actions(self):
@@ -661,10 +669,9 @@ class Casualty(Procedure):
             self.casualty = CasualtyType(n)
             self.effect = Rules.casualty_effect[self.casualty]
 
-            self.game.report(
-                Outcome(OutcomeType.CASUALTY, player=self.player, opp_player=self.inflictor, team=self.player.team,
-                        n=self.effect.name,
-                        rolls=[self.roll]))
+            self.game.report(OutcomeType.CASUALTY, player=self.player, opp_player=self.inflictor, team=self.player.team,
+                             n=self.effect.name,
+                             rolls=[self.roll])
 
             if self.player.team.state.apothecaries > 1:
                 Apothecary(self.game, self.player, roll=self.roll, outcome=OutcomeType.CASUALTY,
@@ -681,7 +688,7 @@ class Casualty(Procedure):
 
         # Decay
         if self.decay:
-            self.game.report(Outcome(OutcomeType.DECAYING, player=self.player))
+            self.game.report(OutcomeType.DECAYING, player=self.player)
             Casualty(self.game, self.player, self.inflictor)
 
         return True
@@ -706,7 +713,7 @@ class Catch(Procedure):
 
     def start(self):
         if self.diving:
-            self.game.report(Outcome(OutcomeType.SKILL_USED, player=self.player, skill=Skill.DIVING_CATCH))
+            self.game.report(OutcomeType.SKILL_USED, player=self.player, skill=Skill.DIVING_CATCH)
 
     def step(self, action):
 
@@ -716,7 +723,7 @@ class Catch(Procedure):
             # Can player even catch ball?
             if self.player.has_skill(Skill.NO_HANDS) or not self.player.can_catch():
                 Bounce(self.game, self.ball)
-                self.game.report(Outcome(OutcomeType.BALL_DROPPED, player=self.player))
+                self.game.report(OutcomeType.BALL_DROPPED, player=self.player)
                 return True
 
             # Roll
@@ -724,7 +731,7 @@ class Catch(Procedure):
             self.roll.modifiers = self.game.get_catch_modifiers(self.player, accurate=self.accurate, handoff=self.handoff)
             self.roll.target = Rules.agility_table[self.player.get_ag()]
             if self.roll.is_d6_success():
-                self.game.report(Outcome(OutcomeType.CATCH, player=self.player, rolls=[self.roll]))
+                self.game.report(OutcomeType.CATCH, player=self.player, rolls=[self.roll])
                 if self.diving:
                     self.ball.move_to(self.player.position)
                 self.ball.is_carried = True
@@ -732,7 +739,7 @@ class Catch(Procedure):
                     Touchdown(self.game, self.player)
                 return True
             else:
-                self.game.report(Outcome(OutcomeType.FAILED_CATCH, player=self.player, rolls=[self.roll]))
+                self.game.report(OutcomeType.FAILED_CATCH, player=self.player, rolls=[self.roll])
                 # Check for re-roll
                 self.reroll = Reroll(self.game, self.player, context=self)
                 return False
@@ -773,10 +780,10 @@ class Intercept(Procedure):
             # Make agility roll for passer
             self.safe_throw_roll = DiceRoll([D6(self.game.rnd)], roll_type=RollType.AGILITY_ROLL)
             self.safe_throw_roll.target = Rules.agility_table[self.passer.get_ag()]
-            self.game.report(
-                Outcome(OutcomeType.SKILL_USED, player=self.passer, skill=Skill.SAFE_THROW, rolls=[self.safe_throw_roll]))
+            self.game.report(OutcomeType.SKILL_USED, player=self.passer, skill=Skill.SAFE_THROW,
+                             rolls=[self.safe_throw_roll])
             if self.safe_throw_roll.is_d6_success():
-                self.game.report(Outcome(OutcomeType.FAILED_INTERCEPTION, player=self.interceptor))
+                self.game.report(OutcomeType.FAILED_INTERCEPTION, player=self.interceptor)
                 return True
             else:
                 # Check for re-roll
@@ -813,12 +820,11 @@ class Intercept(Procedure):
             self.roll.modifiers = self.game.get_catch_modifiers(self.interceptor, interception=True)
             self.roll.target = Rules.agility_table[self.interceptor.get_ag()]
             if self.roll.is_d6_success():
-                self.game.report(Outcome(OutcomeType.INTERCEPTION, player=self.interceptor, rolls=[self.roll]))
+                self.game.report(OutcomeType.INTERCEPTION, player=self.interceptor, rolls=[self.roll])
                 if self.passer is not None and self.passer.has_skill(Skill.SAFE_THROW):
                     if self.interceptor.has_skill(Skill.VERY_LONG_LEGS):
-                        self.game.report(
-                            Outcome(OutcomeType.SKILL_USED, player=self.passer, skill=Skill.SAFE_THROW))
-                        self.game.report(Outcome(OutcomeType.SKILL_USED, player=self.interceptor, skill=Skill.VERY_LONG_LEGS))
+                        self.game.report(OutcomeType.SKILL_USED, player=self.passer, skill=Skill.SAFE_THROW)
+                        self.game.report(OutcomeType.SKILL_USED, player=self.interceptor, skill=Skill.VERY_LONG_LEGS)
                     else:
                         self.waiting_safe_throw = True
                         return False
@@ -832,7 +838,7 @@ class Intercept(Procedure):
 
             else:
 
-                self.game.report(Outcome(OutcomeType.FAILED_INTERCEPTION, player=self.interceptor, rolls=[self.roll]))
+                self.game.report(OutcomeType.FAILED_INTERCEPTION, player=self.interceptor, rolls=[self.roll])
 
                 # Check for re-roll
                 self.reroll = Reroll(self.game, self.interceptor, context=self)
@@ -861,17 +867,17 @@ class CoinTossFlip(Procedure):
         if action.action_type == ActionType.HEADS:
             if self.game.rnd.rand(1)[0] >= 0.5:
                 self.game.state.coin_toss_winner = self.game.state.away_team
-                self.game.report(Outcome(OutcomeType.HEADS_WON))
+                self.game.report(OutcomeType.HEADS_WON)
             else:
                 self.game.state.coin_toss_winner = self.game.state.home_team
-                self.game.report(Outcome(OutcomeType.TAILS_LOSS))
+                self.game.report(OutcomeType.TAILS_LOSS)
         elif action.action_type == ActionType.TAILS:
             if self.game.rnd.rand(1)[0] >= 0.5:
                 self.game.state.coin_toss_winner = self.game.state.away_team
-                self.game.report(Outcome(OutcomeType.TAILS_WON))
+                self.game.report(OutcomeType.TAILS_WON)
             else:
                 self.game.state.coin_toss_winner = self.game.state.home_team
-                self.game.report(Outcome(OutcomeType.HEADS_LOSS))
+                self.game.report(OutcomeType.HEADS_LOSS)
 
         CoinTossKickReceive(self.game)
         self.game.remove_clocks()
@@ -908,9 +914,9 @@ class CoinTossKickReceive(Procedure):
         self.game.state.receiving_first_half = receiving
         self.game.state.receiving_this_drive = receiving
         if receiving == self.game.state.home_team:
-            self.game.report(Outcome(OutcomeType.HOME_RECEIVE, team=receiving))
+            self.game.report(OutcomeType.HOME_RECEIVE, team=receiving)
         else:
-            self.game.report(Outcome(OutcomeType.AWAY_RECEIVE, team=receiving))
+            self.game.report(OutcomeType.AWAY_RECEIVE, team=receiving)
         self.game.remove_clocks()
         return True
 
@@ -946,7 +952,7 @@ class Foul(Procedure):
         assists_to = self.game.get_assisting_players(self.defender, self.fouler, foul=True)
         modifier = len(assists_from) - len(assists_to)
 
-        self.game.report(Outcome(OutcomeType.FOUL, player=self.fouler, opp_player=self.defender))
+        self.game.report(OutcomeType.FOUL, player=self.fouler, opp_player=self.defender)
 
         # Armor roll
         Armor(self.game, self.defender, modifiers=modifier, inflictor=self.fouler, foul=True)
@@ -1012,9 +1018,9 @@ class Half(Procedure):
             return False
 
         if self.half == 1:
-            self.game.report(Outcome(OutcomeType.END_OF_FIRST_HALF))
+            self.game.report(OutcomeType.END_OF_FIRST_HALF)
         elif self.half == 2:
-            self.game.report(Outcome(OutcomeType.END_OF_SECOND_HALF))
+            self.game.report(OutcomeType.END_OF_SECOND_HALF)
 
         return True
 
@@ -1060,7 +1066,7 @@ class Injury(Procedure):
         if self.foul and not self.ejected:
             if roll.same():
                 if not self.inflictor.has_skill(Skill.SNEAKY_GIT):
-                    self.game.report(Outcome(OutcomeType.PLAYER_EJECTED, player=self.inflictor))
+                    self.game.report(OutcomeType.PLAYER_EJECTED, player=self.inflictor)
                     Turnover(self.game)
                     Ejection(self.game, self.inflictor)
 
@@ -1068,7 +1074,7 @@ class Injury(Procedure):
         roll.modifiers = stunty + mighty_blow + dirty_player + niggling
         if roll.get_result() >= 10:
             roll.modifiers = stunty + mighty_blow + dirty_player
-            self.game.report(Outcome(OutcomeType.CASUALTY, player=self.player, opp_player=self.inflictor, rolls=[roll]))
+            self.game.report(OutcomeType.CASUALTY, player=self.player, opp_player=self.inflictor, rolls=[roll])
             Casualty(self.game, self.player, roll, inflictor=self.inflictor, decay=self.player.has_skill(Skill.DECAY))
             return True
 
@@ -1083,8 +1089,8 @@ class Injury(Procedure):
         if self.player.has_skill(Skill.BALL_AND_CHAIN):
             KnockOut(self.game, self.player, roll=roll, inflictor=self.inflictor)
         else:
-            self.game.report(Outcome(OutcomeType.STUNNED, player=self.player, opp_player=self.inflictor,
-                                     rolls=[roll]))
+            self.game.report(OutcomeType.STUNNED, player=self.player, opp_player=self.inflictor,
+                             rolls=[roll])
             if self.in_crowd:
                 self.game.pitch_to_reserves(self.player)
             else:
@@ -1148,7 +1154,7 @@ class Touchback(Procedure):
             self.ball.is_carried = True
         self.ball.move_to(position)
         self.ball.on_ground = True
-        self.game.report(Outcome(OutcomeType.TOUCHBACK_BALL_PLACED, player=player, position=position))
+        self.game.report(OutcomeType.TOUCHBACK_BALL_PLACED, player=player, position=position)
         self.game.remove_secondary_clocks()
         return True
 
@@ -1172,7 +1178,7 @@ class LandKick(Procedure):
 
         if not self.game.is_team_side(self.ball.position, self.game.get_receiving_team()):
             Touchback(self.game, self.ball)
-            self.game.report(Outcome(OutcomeType.TOUCHBACK, team=self.game.get_receiving_team()))
+            self.game.report(OutcomeType.TOUCHBACK, team=self.game.get_receiving_team())
             return True
 
         # Gentle gust
@@ -1185,11 +1191,11 @@ class LandKick(Procedure):
         catcher = self.game.get_catcher(self.ball.position)
         if catcher is None:
             Bounce(self.game, self.ball, kick=True)
-            self.game.report(Outcome(OutcomeType.BALL_HIT_GROUND, position=self.ball.position))
+            self.game.report(OutcomeType.BALL_HIT_GROUND, position=self.ball.position)
             return True
 
         Catch(self.game, catcher, self.ball, kick=True)
-        self.game.report(Outcome(OutcomeType.BALL_HIT_PLAYER, position=self.ball.position, player=catcher))
+        self.game.report(OutcomeType.BALL_HIT_PLAYER, position=self.ball.position, player=catcher)
 
         return True
 
@@ -1212,9 +1218,9 @@ class Fans(Procedure):
             rolls.append(roll)
             fans = (roll.get_sum() + team.fan_factor) * 1000
             spectators.append(fans)
-            self.game.report(Outcome(OutcomeType.TEAM_SPECTATORS, n=fans, team=team, rolls=[roll]))
+            self.game.report(OutcomeType.TEAM_SPECTATORS, n=fans, team=team, rolls=[roll])
         self.game.state.spectators = int(np.sum(spectators))
-        self.game.report(Outcome(OutcomeType.SPECTATORS, n=self.game.state.spectators))
+        self.game.report(OutcomeType.SPECTATORS, n=self.game.state.spectators)
 
         # FAME
         max_fans = int(np.max(spectators))
@@ -1228,7 +1234,7 @@ class Fans(Procedure):
                     fame = 2
                 elif team_fans > min_fans:
                     fame = 1
-            self.game.report(Outcome(OutcomeType.FAME, n=fame, team=team))
+            self.game.report(OutcomeType.FAME, n=fame, team=team)
             team.state.fame = fame
 
         return True
@@ -1264,7 +1270,7 @@ class GetTheRef(Procedure):
     def step(self, action):
         for team in self.game.state.teams:
             team.state.bribes += 1
-            self.game.report(Outcome(OutcomeType.EXTRA_BRIBE, team=team))
+            self.game.report(OutcomeType.EXTRA_BRIBE, team=team)
         return True
 
     def available_actions(self):
@@ -1293,9 +1299,9 @@ class Riot(Procedure):
 
         self.game.add_or_skip_turn(self.effect)
         if self.effect == -1:
-            self.game.report(Outcome(OutcomeType.TURN_ADDED, rolls=[] if roll is None else [roll]))
+            self.game.report(OutcomeType.TURN_ADDED, rolls=[] if roll is None else [roll])
         if self.effect == 1:
-            self.game.report(Outcome(OutcomeType.TURN_SKIPPED, rolls=[] if roll is None else [roll]))
+            self.game.report(OutcomeType.TURN_SKIPPED, rolls=[] if roll is None else [roll])
 
         return True
 
@@ -1326,9 +1332,9 @@ class HighKick(Procedure):
             return True
         if action.action_type == ActionType.SELECT_PLAYER:
             self.game.move(action.player, self.ball.position)
-            self.game.report(Outcome(OutcomeType.PLAYER_PLACED_HIGH_KICK, position=self.game.get_ball_position(), team=self.receiving_team))
+            self.game.report(OutcomeType.PLAYER_PLACED_HIGH_KICK, position=self.game.get_ball_position(), team=self.receiving_team)
         elif action.action_type == ActionType.END_SETUP:
-            self.game.report(Outcome(OutcomeType.SETUP_DONE, team=self.receiving_team))
+            self.game.report(OutcomeType.SETUP_DONE, team=self.receiving_team)
         return True
 
     def available_actions(self):
@@ -1354,14 +1360,14 @@ class CheeringFans(Procedure):
             rolls.append(roll)
             roll.modifiers = team.state.fame + team.cheerleaders
             cheers.append(roll.get_result())
-            self.game.report(Outcome(OutcomeType.CHEERING_FANS_ROLL, team=team, rolls=[roll]))
+            self.game.report(OutcomeType.CHEERING_FANS_ROLL, team=team, rolls=[roll])
 
         max_cheers = np.max(cheers)
         for i in range(len(self.game.state.teams)):
             team = self.game.state.teams[i]
             if max_cheers == cheers[i]:
                 team.state.rerolls += 1
-                self.game.report(Outcome(OutcomeType.EXTRA_REROLL, team=team))
+                self.game.report(OutcomeType.EXTRA_REROLL, team=team)
 
         return True
 
@@ -1383,14 +1389,14 @@ class BrilliantCoaching(Procedure):
             rolls.append(roll)
             roll.modifiers = team.state.fame + team.ass_coaches
             brilliant_coaches.append(roll.get_result())
-            self.game.report(Outcome(OutcomeType.BRILLIANT_COACHING_ROLL, team=team, rolls=[roll]))
+            self.game.report(OutcomeType.BRILLIANT_COACHING_ROLL, team=team, rolls=[roll])
 
         max_cheers = np.max(brilliant_coaches)
         for i in range(len(self.game.state.teams)):
             team = self.game.state.teams[i]
             if max_cheers == brilliant_coaches[i]:
                 team.state.rerolls += 1
-                self.game.report(Outcome(OutcomeType.EXTRA_REROLL, team=team))
+                self.game.report(OutcomeType.EXTRA_REROLL, team=team)
 
         return True
 
@@ -1411,7 +1417,7 @@ class ThrowARock(Procedure):
             roll = DiceRoll([D3(self.game.rnd)], roll_type=RollType.THROW_A_ROCK_ROLL)
             roll.modifiers = team.state.fame
             rolls.append(roll.get_result())
-            self.game.report(Outcome(OutcomeType.THROW_A_ROCK_ROLL, team=team, rolls=[roll]))
+            self.game.report(OutcomeType.THROW_A_ROCK_ROLL, team=team, rolls=[roll])
 
         for i in range(len(self.game.state.teams)):
             team = self.game.state.teams[i]
@@ -1420,7 +1426,7 @@ class ThrowARock(Procedure):
                 if len(players) > 0:
                     player = self.game.rnd.choice(players)
                     KnockDown(self.game, player, armor_roll=False)
-                    self.game.report(Outcome(OutcomeType.HIT_BY_ROCK, player=player))
+                    self.game.report(OutcomeType.HIT_BY_ROCK, player=player)
 
         return True
 
@@ -1440,14 +1446,14 @@ class PitchInvasionRoll(Procedure):
         roll.modifiers = self.game.get_opp_team(self.team).state.fame
         if roll.get_result() >= 6 and roll.get_sum() != 1:
             if self.player.has_skill(Skill.BALL_AND_CHAIN):
-                self.game.report(Outcome(OutcomeType.KNOCKED_OUT, rolls=[roll], player=self.player, team=self.team))
+                self.game.report(OutcomeType.KNOCKED_OUT, rolls=[roll], player=self.player, team=self.team)
                 KnockOut(self.game, self.player, roll=roll)
             else:
                 self.player.place_prone()
                 self.player.state.stunned = True
-                self.game.report(Outcome(OutcomeType.STUNNED, rolls=[roll], player=self.player, team=self.team))
+                self.game.report(OutcomeType.STUNNED, rolls=[roll], player=self.player, team=self.team)
         else:
-            self.game.report(Outcome(OutcomeType.PLAYER_READY, rolls=[roll], player=self.player, team=self.team))
+            self.game.report(OutcomeType.PLAYER_READY, rolls=[roll], player=self.player, team=self.team)
 
         return True
 
@@ -1465,44 +1471,44 @@ class KickoffTable(Procedure):
     def step(self, action):
 
         roll = DiceRoll([D6(self.game.rnd), D6(self.game.rnd)], roll_type=RollType.KICKOFF_ROLL)
-        roll.result = roll.get_sum()
+        result = roll.get_sum()
 
-        if roll.result == 2:  # Get the ref!
+        if result == 2:  # Get the ref!
             GetTheRef(self.game)
-            self.game.report(Outcome(OutcomeType.KICKOFF_GET_THE_REF, rolls=[roll]))
-        elif roll.result == 3:  # Riot!
+            self.game.report(OutcomeType.KICKOFF_GET_THE_REF, rolls=[roll])
+        elif result == 3:  # Riot!
             Riot(self.game)
-            self.game.report(Outcome(OutcomeType.KICKOFF_RIOT, rolls=[roll]))
-        elif roll.result == 4:  # Perfect defense
+            self.game.report(OutcomeType.KICKOFF_RIOT, rolls=[roll])
+        elif result == 4:  # Perfect defense
             Setup(self.game, team=self.game.get_kicking_team(), reorganize=True)
-            self.game.report(Outcome(OutcomeType.KICKOFF_PERFECT_DEFENSE, team=self.game.get_kicking_team(),
-                                     rolls=[roll]))
-        elif roll.result == 5:  # High Kick
+            self.game.report(OutcomeType.KICKOFF_PERFECT_DEFENSE, team=self.game.get_kicking_team(),
+                             rolls=[roll])
+        elif result == 5:  # High Kick
             HighKick(self.game, self.ball)
-            self.game.report(Outcome(OutcomeType.KICKOFF_HIGH_KICK, rolls=[roll]))
-        elif roll.result == 6:  # Cheering fans
+            self.game.report(OutcomeType.KICKOFF_HIGH_KICK, rolls=[roll])
+        elif result == 6:  # Cheering fans
             CheeringFans(self.game)
-            self.game.report(Outcome(OutcomeType.KICKOFF_CHEERING_FANS, rolls=[roll]))
-        elif roll.result == 7:  # Changing Weather
+            self.game.report(OutcomeType.KICKOFF_CHEERING_FANS, rolls=[roll])
+        elif result == 7:  # Changing Weather
             WeatherTable(self.game, kickoff=True)
-            self.game.report(Outcome(OutcomeType.KICKOFF_CHANGING_WHEATHER, rolls=[roll]))
-        elif roll.result == 8:  # Brilliant Coaching
+            self.game.report(OutcomeType.KICKOFF_CHANGING_WHEATHER, rolls=[roll])
+        elif result == 8:  # Brilliant Coaching
             BrilliantCoaching(self.game)
-            self.game.report(Outcome(OutcomeType.KICKOFF_BRILLIANT_COACHING, rolls=[roll]))
-        elif roll.result == 9:  # Quick Snap
+            self.game.report(OutcomeType.KICKOFF_BRILLIANT_COACHING, rolls=[roll])
+        elif result == 9:  # Quick Snap
             Turn(self.game, self.game.get_receiving_team(), None, None, quick_snap=True)
-            self.game.report(Outcome(OutcomeType.KICKOFF_QUICK_SNAP, rolls=[roll]))
-        elif roll.result == 10:  # Blitz
+            self.game.report(OutcomeType.KICKOFF_QUICK_SNAP, rolls=[roll])
+        elif result == 10:  # Blitz
             Turn(self.game, self.game.get_kicking_team(), None, None, blitz=True)
-            self.game.report(Outcome(OutcomeType.KICKOFF_BLITZ, rolls=[roll]))
-        elif roll.result == 11:  # Throw a Rock
+            self.game.report(OutcomeType.KICKOFF_BLITZ, rolls=[roll])
+        elif result == 11:  # Throw a Rock
             ThrowARock(self.game)
-            self.game.report(Outcome(OutcomeType.KICKOFF_THROW_A_ROCK, rolls=[roll]))
-        elif roll.result == 12:  # Pitch Invasion
+            self.game.report(OutcomeType.KICKOFF_THROW_A_ROCK, rolls=[roll])
+        elif result == 12:  # Pitch Invasion
             for team in reversed(self.game.state.teams):
                 for player in sorted(self.game.get_players_on_pitch(team), key=lambda p: p.nr, reverse=True):
                     PitchInvasionRoll(self.game, team, player)
-            self.game.report(Outcome(OutcomeType.KICKOFF_PITCH_INVASION, rolls=[roll]))
+            self.game.report(OutcomeType.KICKOFF_PITCH_INVASION, rolls=[roll])
 
         return True
 
@@ -1531,7 +1537,7 @@ class KnockDown(Procedure):
         if self.player.team == self.game.state.current_team:
             self.player.state.used = True
 
-        self.game.report(Outcome(OutcomeType.KNOCKED_DOWN, player=self.player, opp_player=self.inflictor))
+        self.game.report(OutcomeType.KNOCKED_DOWN, player=self.player, opp_player=self.inflictor)
 
         # Turnover
         if self.turnover:
@@ -1542,7 +1548,7 @@ class KnockDown(Procedure):
         if ball is not None:
             if not self.game.is_out_of_bounds(self.player.position):
                 Bounce(self.game, ball)
-            self.game.report(Outcome(OutcomeType.FUMBLE, player=self.player, opp_player=self.inflictor))
+            self.game.report(OutcomeType.FUMBLE, player=self.player, opp_player=self.inflictor)
 
         # If armor roll should be made. Injury is also nested in armor.
         if self.injury_roll and not self.armor_roll:
@@ -1573,8 +1579,8 @@ class KnockOut(Procedure):
         else:
             # Knock out player
             self.game.pitch_to_kod(self.player)
-            self.game.report(Outcome(OutcomeType.KNOCKED_OUT, rolls=[self.roll], player=self.player,
-                                     opp_player=self.inflictor))
+            self.game.report(OutcomeType.KNOCKED_OUT, rolls=[self.roll], player=self.player,
+                             opp_player=self.inflictor)
 
         return True
 
@@ -1605,7 +1611,7 @@ class Leap(Procedure):
 
             if self.roll.is_d6_success():
                 self.game.move(self.player, self.position)
-                self.game.report(Outcome(OutcomeType.SUCCESSFUL_LEAP, player=self.player, rolls=[self.roll]))
+                self.game.report(OutcomeType.SUCCESSFUL_LEAP, player=self.player, rolls=[self.roll])
                 # Check if player moved onto the ball
                 ball = self.game.get_ball_at(self.player.position)
                 if ball is not None and not ball.is_carried:
@@ -1619,7 +1625,7 @@ class Leap(Procedure):
                     Touchdown(self.game, self.player)
                 return True
             else:
-                self.game.report(Outcome(OutcomeType.FAILED_LEAP, player=self.player, rolls=[self.roll]))
+                self.game.report(OutcomeType.FAILED_LEAP, player=self.player, rolls=[self.roll])
                 self.reroll = Reroll(self.game, self.player, self)
                 return False
 
@@ -1629,7 +1635,7 @@ class Leap(Procedure):
                 self.reroll = None
                 return False
             else:
-                self.game.report(Outcome(OutcomeType.FAILED_LEAP))
+                self.game.report(OutcomeType.FAILED_LEAP)
                 self.game.move(self.player, self.position)
                 KnockDown(self.game, self.player, turnover=True)
         return True
@@ -1666,7 +1672,7 @@ class Shadowing(Procedure):
             self.roll.modifiers = self.player.get_ma() - self.shadower.get_ma()
             self.roll.target_higher = False
             self.roll.target_lower = True
-            self.game.report(Outcome(OutcomeType.SKILL_USED, player=self.shadower, skill=Skill.SHADOWING, rolls=[self.roll]))
+            self.game.report(OutcomeType.SKILL_USED, player=self.shadower, skill=Skill.SHADOWING, rolls=[self.roll])
             if self.roll.is_d6_success():
                 self.game.move(self.shadower, self.position)
                 return True
@@ -1827,13 +1833,13 @@ class GFI(Procedure):
             if self.roll.is_d6_success():
 
                 # Success
-                self.game.report(Outcome(OutcomeType.SUCCESSFUL_GFI, player=self.player, position=self.position, rolls=[self.roll]))
+                self.game.report(OutcomeType.SUCCESSFUL_GFI, player=self.player, position=self.position, rolls=[self.roll])
                 return True
 
             else:
 
                 # Fail
-                self.game.report(Outcome(OutcomeType.FAILED_GFI, player=self.player, position=self.position, rolls=[self.roll]))
+                self.game.report(OutcomeType.FAILED_GFI, player=self.player, position=self.position, rolls=[self.roll])
 
                 # Check re-roll
                 self.reroll = Reroll(self.game, self.player, context=self)
@@ -1906,10 +1912,10 @@ class Dodge(Procedure):
             elif action.action_type == ActionType.USE_SKILL:
                 # Success
                 self.player.use_skill(Skill.BREAK_TACKLE)
-                self.game.report(Outcome(OutcomeType.SKILL_USED, player=self.player, skill=Skill.BREAK_TACKLE))
+                self.game.report(OutcomeType.SKILL_USED, player=self.player, skill=Skill.BREAK_TACKLE)
                 self.roll.target = self.break_tackle_target
-                self.game.report(Outcome(OutcomeType.SUCCESSFUL_DODGE, player=self.player, position=self.position,
-                                         rolls=[self.roll]))
+                self.game.report(OutcomeType.SUCCESSFUL_DODGE, player=self.player, position=self.position,
+                                 rolls=[self.roll])
                 return True
 
         # If player hasn't rolled
@@ -1930,11 +1936,11 @@ class Dodge(Procedure):
 
             if self.roll.is_d6_success():
                 # Success
-                self.game.report(Outcome(OutcomeType.SUCCESSFUL_DODGE, player=self.player, position=self.position, rolls=[self.roll]))
+                self.game.report(OutcomeType.SUCCESSFUL_DODGE, player=self.player, position=self.position, rolls=[self.roll])
                 return True
             else:
                 # Fail
-                self.game.report(Outcome(OutcomeType.FAILED_DODGE, player=self.player, position=self.position, rolls=[self.roll]))
+                self.game.report(OutcomeType.FAILED_DODGE, player=self.player, position=self.position, rolls=[self.roll])
                 if self.player.can_use_skill(Skill.BREAK_TACKLE) and self.player.get_st() > self.player.get_ag() and self.roll.get_result() >= self.break_tackle_target:
                     self.waiting_break_tackle = True
                     return False
@@ -2006,7 +2012,7 @@ class Handoff(Procedure):
         TurnoverIfPossessionLost(self.game, self.ball)
         self.ball.move_to(self.catcher.position)
         Catch(self.game, self.catcher, self.ball, handoff=True)
-        self.game.report(Outcome(OutcomeType.HANDOFF, player=self.player, opp_player=self.catcher))
+        self.game.report(OutcomeType.HANDOFF, player=self.player, opp_player=self.catcher)
         return True
 
 
@@ -2027,7 +2033,7 @@ class PassAction(Procedure):
 
     def start(self):
         if self.dump_off:
-            self.game.report(Outcome(OutcomeType.SKILL_USED, skill=Skill.DUMP_OFF, player=self.passer))
+            self.game.report(OutcomeType.SKILL_USED, skill=Skill.DUMP_OFF, player=self.passer)
         self.catcher = self.game.get_catcher(self.position)
 
     def step(self, action):
@@ -2056,7 +2062,7 @@ class PassAction(Procedure):
 
             if result == 6 or (result != 1 and mod_result >= self.roll.target):
                 # Accurate pass
-                self.game.report(Outcome(OutcomeType.ACCURATE_PASS, player=self.passer, rolls=[self.roll]))
+                self.game.report(OutcomeType.ACCURATE_PASS, player=self.passer, rolls=[self.roll])
                 self.ball.move_to(self.position)
                 if not self.dump_off:
                     TurnoverIfPossessionLost(self.game, self.ball)
@@ -2070,14 +2076,14 @@ class PassAction(Procedure):
             if result == 1 or (mod_result <= 1 and not self.passer.has_skill(Skill.SAFE_THROW)):
                 # Fumble
                 self.fumble = True
-                self.game.report(Outcome(OutcomeType.FUMBLE, player=self.passer, rolls=[self.roll]))
+                self.game.report(OutcomeType.FUMBLE, player=self.passer, rolls=[self.roll])
             elif mod_result <= 1 and self.passer.has_skill(Skill.SAFE_THROW):
                 # Inaccurate pass - Safe Throw
-                self.game.report(Outcome(OutcomeType.SKILL_USED, player=self.passer, skill=Skill.SAFE_THROW))
-                self.game.report(Outcome(OutcomeType.INACCURATE_PASS, player=self.passer, rolls=[self.roll]))
+                self.game.report(OutcomeType.SKILL_USED, player=self.passer, skill=Skill.SAFE_THROW)
+                self.game.report(OutcomeType.INACCURATE_PASS, player=self.passer, rolls=[self.roll])
             else:
                 # Inaccurate pass
-                self.game.report(Outcome(OutcomeType.INACCURATE_PASS, player=self.passer, rolls=[self.roll]))
+                self.game.report(OutcomeType.INACCURATE_PASS, player=self.passer, rolls=[self.roll])
 
             # Check if re-roll available
             self.reroll = Reroll(self.game, self.passer, context=self.context)
@@ -2126,14 +2132,14 @@ class Pickup(Procedure):
 
             # Roll
             if self.roll.is_d6_success():
-                self.game.report(Outcome(OutcomeType.SUCCESSFUL_PICKUP, player=self.player, rolls=[self.roll]))
+                self.game.report(OutcomeType.SUCCESSFUL_PICKUP, player=self.player, rolls=[self.roll])
                 self.ball.is_carried = True
                 if self.game.is_touchdown(self.player):
                     Touchdown(self.game, self.player)
                 return True
             else:
-                self.game.report(Outcome(OutcomeType.FAILED_PICKUP, player=self.player, position=self.player.position,
-                                         rolls=[self.roll]))
+                self.game.report(OutcomeType.FAILED_PICKUP, player=self.player, position=self.player.position,
+                                 rolls=[self.roll])
                 # Check re-roll
                 self.reroll = Reroll(self.game, self.player, context=self)
                 return False
@@ -2170,10 +2176,10 @@ class StandUp(Procedure):
             self.roll = DiceRoll([D6(self.game.rnd)], target=4, roll_type=RollType.STAND_UP_ROLL)
             if self.roll.is_d6_success():
                 self.player.state.up = True
-                self.game.report(Outcome(OutcomeType.STAND_UP, rolls=[self.roll], player=self.player))
+                self.game.report(OutcomeType.STAND_UP, rolls=[self.roll], player=self.player)
                 return True
             else:
-                self.game.report(Outcome(OutcomeType.FAILED_STAND_UP, rolls=[self.roll], player=self.player))
+                self.game.report(OutcomeType.FAILED_STAND_UP, rolls=[self.roll], player=self.player)
                 self.reroll = Reroll(self.game, self.player, self)
                 return False
         elif not self.roll_required:
@@ -2188,7 +2194,7 @@ class StandUp(Procedure):
             return False
         else:
             self.player.place_prone()
-            self.game.report(Outcome(OutcomeType.FAILED_STAND_UP, rolls=[self.roll], player=self.player))
+            self.game.report(OutcomeType.FAILED_STAND_UP, rolls=[self.roll], player=self.player)
             EndPlayerTurn(self.game, self.player)
         return True
 
@@ -2209,7 +2215,7 @@ class PlaceBall(Procedure):
         self.game.state.pitch.balls.append(self.ball)
         self.ball.on_ground = False
         self.ball.move_to(action.position)
-        self.game.report(Outcome(OutcomeType.BALL_PLACED, position=action.position, team=self.game.get_kicking_team()))
+        self.game.report(OutcomeType.BALL_PLACED, position=action.position, team=self.game.get_kicking_team())
         self.game.remove_secondary_clocks()
         return True
 
@@ -2226,7 +2232,7 @@ class EndPlayerTurn(Procedure):
     def step(self, action):
         self.player.state.used = True
         self.player.state.moves = 0
-        self.game.report(Outcome(OutcomeType.END_PLAYER_TURN, player=self.player))
+        self.game.report(OutcomeType.END_PLAYER_TURN, player=self.player)
         self.game.state.active_player = None
         self.player.state.squares_moved.clear()
         return True
@@ -2248,11 +2254,10 @@ class JumpUpToBlock(Procedure):
             self.roll.modifiers = 2
             if self.roll.is_d6_success():
                 self.player.state.up = True
-                self.game.report(Outcome(OutcomeType.SKILL_USED, skill=Skill.JUMP_UP, player=self.player, rolls=[self.roll]))
+                self.game.report(OutcomeType.SKILL_USED, skill=Skill.JUMP_UP, player=self.player, rolls=[self.roll])
                 return True
             else:
-                self.game.report(
-                    Outcome(OutcomeType.FAILED_JUMP_UP, player=self.player, rolls=[self.roll]))
+                self.game.report(OutcomeType.FAILED_JUMP_UP, player=self.player, rolls=[self.roll])
                 self.reroll = Reroll(self.game, self.player, self)
                 return False
 
@@ -2307,7 +2312,7 @@ class PlayerAction(Procedure):
             moves = 3
             if self.player.has_skill(Skill.JUMP_UP):
                 moves = 0
-                self.game.report(Outcome(OutcomeType.SKILL_USED, skill=Skill.JUMP_UP, player=self.player))
+                self.game.report(OutcomeType.SKILL_USED, skill=Skill.JUMP_UP, player=self.player)
             StandUp(self.game, self.player)
             self.player.state.moves += min(self.player.get_ma(), moves)
             for i in range(moves):
@@ -2435,7 +2440,6 @@ class PlayerAction(Procedure):
 
         # Move actions
         if self.player_action_type != PlayerActionType.BLOCK and not self.dump_off:
-            move_positions = []
             agi_rolls = []
             move_needed = 1 if not self.player.state.up else 1
             gfi = self.player.state.moves + move_needed > self.player.get_ma()
@@ -2453,49 +2457,22 @@ class PlayerAction(Procedure):
                   and self.player.state.moves + move_needed <= self.player.get_ma() + sprints) \
                     or (self.turn.quick_snap and self.player.state.moves == 0):
                 # Regular movement
-                for square in self.game.get_adjacent_squares(self.player.position, occupied=False):
-                    ball_at = self.game.get_ball_at(square)
-                    move_positions.append(square)
-                    rolls = []
-                    if not self.turn.quick_snap:
-                        if gfi:
-                            rolls.append(gfi_roll)
-                        if self.game.num_tackle_zones_in(self.player) > 0:
-                            modifiers = self.game.get_dodge_modifiers(self.player, square)
-                            target = Rules.agility_table[self.player.get_ag()]
-                            rolls.append(min(6, max(2, target - modifiers)))
-                        if ball_at is not None and ball_at.on_ground:
-                            target = Rules.agility_table[self.player.get_ag()]
-                            modifiers = self.game.get_pickup_modifiers(self.player, square)
-                            rolls.append(min(6, max(2, target - modifiers)))
-                    agi_rolls.append(rolls)
+                move_positions = self.game.get_adjacent_squares(self.player.position, occupied=False)
                 if len(move_positions) > 0:
-                    actions.append(ActionChoice(ActionType.MOVE, team=self.player.team,
-                                                positions=move_positions, agi_rolls=agi_rolls))
+                    actions.append(ActionChoice(ActionType.MOVE, team=self.player.team, positions=move_positions,
+                                                agi_rolls=partial(self._get_move_agi_rolls, move_positions, gfi, gfi_roll),
+                                                game=self.game))
                 # Leap
                 if self.player.can_use_skill(Skill.LEAP) and not self.turn.quick_snap:
-                    leap_agi_rolls = []
                     leap_positions = []
-                    modifiers = 0 if self.player.has_skill(Skill.VERY_LONG_LEGS) else 0
-                    target = Rules.agility_table[self.player.get_ag()]
-                    leap_roll = min(6, max(2, target - modifiers))
                     for square in self.game.get_adjacent_squares(self.player.position, occupied=False, distance=2):
                         distance = self.player.position.distance(square)
                         if self.player.state.moves + distance <= self.player.get_ma() + sprints:
-                            rolls = []
                             leap_positions.append(square)
-                            gfis = max(0, (self.player.state.moves + distance) - self.player.get_ma())
-                            for gfi in range(gfis):
-                                rolls.append(gfi_roll)
-                            rolls.append(leap_roll)
-                            ball_at = self.game.get_ball_at(square)
-                            if ball_at is not None and ball_at.on_ground:
-                                modifiers = self.game.get_pickup_modifiers(self.player, square)
-                                rolls.append(min(6, max(2, target - modifiers)))
-                            leap_agi_rolls.append(rolls)
                     if len(leap_positions) > 0:
-                        actions.append(ActionChoice(ActionType.LEAP, team=self.player.team,
-                                                positions=leap_positions, agi_rolls=leap_agi_rolls))
+                        actions.append(ActionChoice(ActionType.LEAP, team=self.player.team, positions=leap_positions,
+                                                    agi_rolls=partial(self._get_leap_agi_rolls, leap_positions, gfi_roll),
+                                                    game=self.game))
 
         # Block actions
         if self.player_action_type == PlayerActionType.BLOCK or \
@@ -2514,91 +2491,143 @@ class PlayerAction(Procedure):
 
             # Find adjacent enemies to block
             if can_block:
-                block_positions = []
-                block_rolls = []
-                stab_rolls = []
-                for player_to in self.game.get_adjacent_opponents(self.player, down=False):
-                    block_positions.append(player_to.position)
-                    dice = self.game.num_block_dice(attacker=self.player, defender=player_to,
-                                                       blitz=self.player_action_type == PlayerActionType.BLITZ,
-                                                       dauntless_success=False)
-                    block_rolls.append(dice)
-                    if self.player.has_skill(Skill.STAB):
-                        roll = player_to.get_av() + 1
-                        if self.player.has_skill(Skill.STAKES) and player_to.team.race in ['Khemri', 'Necromantic', 'Undead', 'Vampire']:
-                            roll += 1
-                        stab_rolls.append(roll)
+                opponents = self.game.get_adjacent_opponents(self.player, down=False)
+                block_positions = [player_to.position for player_to in opponents]
                 if len(block_positions) > 0:
                     agi_rolls = [([2] if gfi else []) for _ in block_positions]
                     actions.append(ActionChoice(ActionType.BLOCK, team=self.player.team,
-                                                positions=block_positions, block_rolls=block_rolls,
-                                                agi_rolls=agi_rolls))
+                                                positions=block_positions,
+                                                block_rolls=partial(self._get_block_rolls, opponents),
+                                                agi_rolls=agi_rolls, game=self.game))
                 if self.player.has_skill(Skill.STAB):
-                    stab_agi_rolls = [([2, stab_rolls[i]] if gfi else [stab_rolls[i]]) for i in range(len(block_positions))]
-                    agi_rolls = [([2] if gfi else []) for _ in block_positions] + stab_agi_rolls
                     actions.append(ActionChoice(ActionType.STAB, team=self.player.team,
                                                 positions=block_positions,
-                                                agi_rolls=agi_rolls))
+                                                agi_rolls=partial(self._get_stab_agi_rolls, opponents, gfi),
+                                                game=self.game))
 
         # Foul actions
         if self.player_action_type == PlayerActionType.FOUL:
-            foul_positions = []
-            foul_rolls = []
-            for player_to in self.game.get_adjacent_opponents(self.player, standing=False, down=True):
-                foul_positions.append(player_to.position)
-                armor = player_to.get_av()
-                assists_from = self.game.get_assisting_players(self.player, player_to, foul=True)
-                assists_to = self.game.get_assisting_players(player_to, self.player, foul=True)
-                foul_rolls.append(min(0, armor + 1 - len(assists_from) + len(assists_to)))
-
+            opponents = self.game.get_adjacent_opponents(self.player, standing=False, down=True)
+            foul_positions = [player_to.position for player_to in opponents]
             if len(foul_positions) > 0:
-                actions.append(ActionChoice(ActionType.FOUL, team=self.player.team,
-                                            positions=foul_positions, block_rolls=foul_rolls))
+                actions.append(ActionChoice(ActionType.FOUL, team=self.player.team, positions=foul_positions,
+                                            block_rolls=partial(self._get_foul_rolls, opponents), game=self.game))
 
         # Handoff actions
         if self.player_action_type == PlayerActionType.HANDOFF and self.game.has_ball(self.player):
             hand_off_positions = []
-            agi_rolls = []
             for player_to in self.game.get_adjacent_teammates(self.player):
                 if player_to.can_catch():
                     hand_off_positions.append(player_to.position)
-                    modifiers = self.game.get_catch_modifiers(self.player, player_to.position)
-                    target = Rules.agility_table[self.player.get_ag()]
-                    agi_rolls.append([min(6, max(2, target - modifiers))])
 
             if len(hand_off_positions) > 0:
-                actions.append(ActionChoice(ActionType.HANDOFF, team=self.player.team,
-                                            positions=hand_off_positions, agi_rolls=agi_rolls))
+                actions.append(ActionChoice(ActionType.HANDOFF, team=self.player.team, positions=hand_off_positions,
+                                            agi_rolls=partial(self._get_handoff_agi_rolls, hand_off_positions),
+                                            game=self.game))
 
         # Pass actions
         if self.player_action_type == PlayerActionType.PASS and self.game.has_ball(self.player):
             positions, distances = self.game.get_pass_distances(self.player, dump_off=self.dump_off)
-            agi_rolls = []
-            cache = {}
-            for i in range(len(distances)):
-                distance = distances[i]
-                position = positions[i]
-                if distance not in cache:
-                    modifiers = self.game.get_pass_modifiers(self.player, distance)
-                    target = Rules.agility_table[self.player.get_ag()]
-                    cache[distance] = min(6, max(2, target - modifiers))
-                rolls = [cache[distance]]
-                player_to = self.game.get_player_at(position)
-                if player_to is not None and player_to.team == self.player.team \
-                        and player_to.can_catch():
-                    catch_target = Rules.agility_table[player_to.get_ag()]
-                    catch_modifiers = self.game.get_catch_modifiers(player_to, accurate=True)
-                    rolls.append(min(6, max(2, catch_target - catch_modifiers)))
-                agi_rolls.append(rolls)
             if len(positions) > 0:
-                actions.append(ActionChoice(ActionType.PASS, team=self.player.team,
-                                            positions=positions, agi_rolls=agi_rolls))
+                actions.append(ActionChoice(ActionType.PASS, team=self.player.team, positions=positions,
+                                            agi_rolls=partial(self._get_pass_agi_rolls, positions, distances),
+                                            game=self.game))
         if self.dump_off:
             actions.append(ActionChoice(ActionType.DONT_USE_SKILL, team=self.player.team, skill=Skill.DUMP_OFF))
         else:
             actions.append(ActionChoice(ActionType.END_PLAYER_TURN, team=self.player.team))
         return actions
 
+    def _get_move_agi_rolls(self, positions, gfi, gfi_roll):
+        agi_rolls = []
+        for square in positions:
+            ball_at = self.game.get_ball_at(square)
+            rolls = []
+            if not self.turn.quick_snap:
+                if gfi:
+                    rolls.append(gfi_roll)
+                if self.game.num_tackle_zones_in(self.player) > 0:
+                    modifiers = self.game.get_dodge_modifiers(self.player, square)
+                    target = Rules.agility_table[self.player.get_ag()]
+                    rolls.append(min(6, max(2, target - modifiers)))
+                if ball_at is not None and ball_at.on_ground:
+                    target = Rules.agility_table[self.player.get_ag()]
+                    modifiers = self.game.get_pickup_modifiers(self.player, square)
+                    rolls.append(min(6, max(2, target - modifiers)))
+            agi_rolls.append(rolls)
+        return agi_rolls
+
+    def _get_leap_agi_rolls(self, positions, gfi_roll):
+        agi_rolls = []
+        modifiers = 0 if self.player.has_skill(Skill.VERY_LONG_LEGS) else 0
+        target = Rules.agility_table[self.player.get_ag()]
+        leap_roll = min(6, max(2, target - modifiers))
+        for square in positions:
+            distance = self.player.position.distance(square)
+            rolls = []
+            gfis = max(0, (self.player.state.moves + distance) - self.player.get_ma())
+            for gfi in range(gfis):
+                rolls.append(gfi_roll)
+            rolls.append(leap_roll)
+            ball_at = self.game.get_ball_at(square)
+            if ball_at is not None and ball_at.on_ground:
+                modifiers = self.game.get_pickup_modifiers(self.player, square)
+                rolls.append(min(6, max(2, target - modifiers)))
+            agi_rolls.append(rolls)
+        return agi_rolls
+
+    def _get_block_rolls(self, opponents):
+        return [self.game.num_block_dice(attacker=self.player, defender=player_to,
+                                         blitz=self.player_action_type == PlayerActionType.BLITZ,
+                                         dauntless_success=False) for player_to in opponents]
+
+    def _get_stab_agi_rolls(self, opponents, gfi):
+        stab_rolls = []
+        for player_to in opponents:
+            roll = player_to.get_av() + 1
+            if self.player.has_skill(Skill.STAKES) and player_to.team.race in ['Khemri', 'Necromantic', 'Undead', 'Vampire']:
+                roll += 1
+            stab_rolls.append(roll)
+        stab_agi_rolls = [([2, stab_rolls[i]] if gfi else [stab_rolls[i]]) for i in range(len(opponents))]
+        return [([2] if gfi else []) for _ in opponents] + stab_agi_rolls
+
+    def _get_foul_rolls(self, opponents):
+        foul_rolls = []
+        for player_to in opponents:
+            armor = player_to.get_av()
+            assists_from = self.game.get_assisting_players(self.player, player_to, foul=True)
+            assists_to = self.game.get_assisting_players(player_to, self.player, foul=True)
+            foul_rolls.append(min(0, armor + 1 - len(assists_from) + len(assists_to)))
+        return foul_rolls
+
+    def _get_handoff_agi_rolls(self, positions):
+        agi_rolls = []
+        for position in positions:
+            modifiers = self.game.get_catch_modifiers(self.player, position)
+            target = Rules.agility_table[self.player.get_ag()]
+            agi_rolls.append([min(6, max(2, target - modifiers))])
+        return agi_rolls
+
+    def _get_pass_agi_rolls(self, positions, distances):
+        agi_rolls = []
+        cache = {}
+        for i in range(len(distances)):
+            distance = distances[i]
+            position = positions[i]
+            if distance not in cache:
+                modifiers = self.game.get_pass_modifiers(self.player, distance)
+                target = Rules.agility_table[self.player.get_ag()]
+                cache[distance] = min(6, max(2, target - modifiers))
+            rolls = [cache[distance]]
+            player_to = self.game.get_player_at(position)
+            if player_to is not None and player_to.team == self.player.team \
+                    and player_to.can_catch():
+                catch_target = Rules.agility_table[player_to.get_ag()]
+                catch_modifiers = self.game.get_catch_modifiers(player_to, accurate=True)
+                rolls.append(min(6, max(2, catch_target - catch_modifiers)))
+            agi_rolls.append(rolls)
+        return agi_rolls
+
 
 class StartGame(Procedure):
 
@@ -2610,7 +2639,7 @@ class StartGame(Procedure):
             for player in team.players:
                 self.game.get_reserves(team).append(player)
         self.game.start_time = time.time()
-        self.game.report(Outcome(OutcomeType.GAME_STARTED))
+        self.game.report(OutcomeType.GAME_STARTED)
         return True
 
     def available_actions(self):
@@ -2626,9 +2655,9 @@ class EndGame(Procedure):
         self.game.state.game_over = True
         winner = self.game.get_winning_team()
         if winner is not None:
-            self.game.report(Outcome(OutcomeType.END_OF_GAME_WINNER, team=winner))
+            self.game.report(OutcomeType.END_OF_GAME_WINNER, team=winner)
         else:
-            self.game.report(Outcome(OutcomeType.END_OF_GAME_DRAW))
+            self.game.report(OutcomeType.END_OF_GAME_DRAW)
         return True
 
 
@@ -2668,10 +2697,10 @@ class PreKickoff(Procedure):
                 if roll.get_sum() >= 4:
                     self.game.kod_to_reserves(player)
                     self.checked.append(player)
-                    self.game.report(Outcome(OutcomeType.PLAYER_READY, player=player, rolls=[roll]))
+                    self.game.report(OutcomeType.PLAYER_READY, player=player, rolls=[roll])
                     return False
                 self.checked.append(player)
-                self.game.report(Outcome(OutcomeType.PLAYER_NOT_READY, player=player, rolls=[roll]))
+                self.game.report(OutcomeType.PLAYER_NOT_READY, player=player, rolls=[roll])
                 return False
         return True
 
@@ -2686,14 +2715,14 @@ class FollowUp(Procedure):
 
     def step(self, action):
         if self.defender.has_skill(Skill.FEND):
-            self.game.report(Outcome(OutcomeType.SKILL_USED, skill=Skill.FEND, player=self.defender))
+            self.game.report(OutcomeType.SKILL_USED, skill=Skill.FEND, player=self.defender)
             self.attacker.state.squares_moved.append(self.attacker.position)
         elif self.attacker.has_skill(Skill.FRENZY) or (action and action.position == self.pos_to):
             shadowers = self.game.get_adjacent_opponents(self.attacker, down=False, skill=Skill.SHADOWING)
             position = self.attacker.position
             self.game.move(self.attacker, self.pos_to)
             self.attacker.state.squares_moved.append(self.pos_to)
-            self.game.report(Outcome(OutcomeType.FOLLOW_UP, position=self.pos_to, player=self.attacker))
+            self.game.report(OutcomeType.FOLLOW_UP, position=self.pos_to, player=self.attacker)
             # Touchdown?
             if self.game.has_ball(self.attacker) and self.game.is_touchdown(self.attacker):
                 Touchdown(self.game, self.attacker)
@@ -2771,7 +2800,7 @@ class Push(Procedure):
 
         # Taken root players cannot be pushed
         if self.player.state.taken_root:
-            self.game.report(Outcome(OutcomeType.SKILL_USED, player=self.player, skill=Skill.TAKE_ROOT))
+            self.game.report(OutcomeType.SKILL_USED, player=self.player, skill=Skill.TAKE_ROOT)
             if self.knock_down:
                 KnockDown(self.game, self.player, in_crowd=False, armor_roll=True)
             return True
@@ -2779,7 +2808,7 @@ class Push(Procedure):
         # Use stand firm
         if self.waiting_stand_firm:
             if action.action_type == ActionType.USE_SKILL:
-                self.game.report(Outcome(OutcomeType.SKILL_USED, player=self.player, skill=Skill.STAND_FIRM))
+                self.game.report(OutcomeType.SKILL_USED, player=self.player, skill=Skill.STAND_FIRM)
                 if self.knock_down:
                     KnockDown(self.game, self.player, in_crowd=False, armor_roll=True)
                 return True
@@ -2790,7 +2819,7 @@ class Push(Procedure):
         # Stand firm
         if self.player.has_skill(Skill.STAND_FIRM) and not self.stand_firm_used:
             if self.pusher.has_skill(Skill.JUGGERNAUT) and self.blitz:
-                self.game.report(Outcome(OutcomeType.SKILL_USED, player=self.pusher, skill=Skill.JUGGERNAUT))
+                self.game.report(OutcomeType.SKILL_USED, player=self.pusher, skill=Skill.JUGGERNAUT)
             else:
                 self.waiting_stand_firm = True
                 return False
@@ -2799,14 +2828,14 @@ class Push(Procedure):
         if self.squares is None:
             # Sidestep and grab cancels out eachother - otherwise let the grabber or sidestepper select adjacent square
             if self.player.has_skill(Skill.SIDE_STEP) and not self.pusher.has_skill(Skill.GRAB):
-                self.game.report(Outcome(OutcomeType.SKILL_USED, player=self.player, skill=Skill.SIDE_STEP))
+                self.game.report(OutcomeType.SKILL_USED, player=self.player, skill=Skill.SIDE_STEP)
                 self.squares = self.game.get_adjacent_squares(self.player.position, occupied=False)
                 self.selector = self.player
                 if len(self.squares) > 0:
                     if self.player.team != self.game.state.current_team:
                         self.game.add_secondary_clock(self.player.team)
             elif self.pusher.has_skill(Skill.GRAB) and not self.player.has_skill(Skill.SIDE_STEP):
-                self.game.report(Outcome(OutcomeType.SKILL_USED, player=self.player, skill=Skill.GRAB))
+                self.game.report(OutcomeType.SKILL_USED, player=self.player, skill=Skill.GRAB)
                 self.squares = self.game.get_adjacent_squares(self.player.position, occupied=False)
             # If no free squares
             if self.squares is None or len(self.squares) == 0:
@@ -2820,9 +2849,9 @@ class Push(Procedure):
 
             # Report
             if self.crowd:
-                self.game.report(Outcome(OutcomeType.PUSHED_INTO_CROWD, player=self.player))
+                self.game.report(OutcomeType.PUSHED_INTO_CROWD, player=self.player)
             else:
-                self.game.report(Outcome(OutcomeType.PUSHED, player=self.player, position=action.position))
+                self.game.report(OutcomeType.PUSHED, player=self.player, position=action.position)
 
             # Follow up - wait if push is delayed
             player_at = self.game.get_player_at(action.position)
@@ -2832,8 +2861,8 @@ class Push(Procedure):
             self.squares = None
 
             # Save positions before chaining
-            self.push_to = Square(action.position.x, action.position.y)
-            self.follow_to = Square(self.player.position.x, self.player.position.y)
+            self.push_to = action.position
+            self.follow_to = self.player.position
 
             assert self.push_to != self.follow_to
 
@@ -2905,61 +2934,61 @@ class Scatter(Procedure):
                 self.ball.move(x, y)
 
                 if self.kick and i == 0 and not self.gentle_gust:
-                    self.game.report(Outcome(OutcomeType.BALL_SCATTER, rolls=rolls))
+                    self.game.report(OutcomeType.BALL_SCATTER, rolls=rolls)
 
                 # Check out of bounds
                 if self.kick:
                     if self.game.is_out_of_bounds(self.ball.position):
                         if self.gentle_gust:
                             # Touchback will be enforced after kick-off table when ball lands
-                            self.game.report(Outcome(OutcomeType.GENTLE_GUST_OUT_OF_BOUNDS, position=self.ball.position,
-                                                     rolls=rolls))
+                            self.game.report(OutcomeType.GENTLE_GUST_OUT_OF_BOUNDS, position=self.ball.position,
+                                             rolls=rolls)
                         else:
                             # Touchback will be enforced after kick-off table when ball lands
-                            self.game.report(Outcome(OutcomeType.KICK_OUT_OF_BOUNDS, position=self.ball.position,
-                                                     rolls=rolls))
+                            self.game.report(OutcomeType.KICK_OUT_OF_BOUNDS, position=self.ball.position,
+                                             rolls=rolls)
                         return True
                     elif self.game.is_team_side(self.ball.position, self.game.get_kicking_team()):
                         if self.gentle_gust:
                             # Touchback will be enforced after kick-off table when ball lands
-                            self.game.report(Outcome(OutcomeType.GENTLE_GUST_OPP_HALF, position=self.ball.position,
-                                                     rolls=rolls))
+                            self.game.report(OutcomeType.GENTLE_GUST_OPP_HALF, position=self.ball.position,
+                                             rolls=rolls)
                         else:
                             # Touchback will be enforced after kick-off table when ball lands
-                            self.game.report(Outcome(OutcomeType.KICK_OPP_HALF, position=self.ball.position, rolls=rolls))
+                            self.game.report(OutcomeType.KICK_OPP_HALF, position=self.ball.position, rolls=rolls)
                         return True
                 else:
                     # Throw in
                     if self.game.is_out_of_bounds(self.ball.position):
                         ThrowIn(self.game, self.ball, Square(self.ball.position.x-x, self.ball.position.y-y))
-                        self.game.report(Outcome(OutcomeType.BALL_SCATTER, rolls=rolls))
-                        self.game.report(Outcome(OutcomeType.BALL_OUT_OF_BOUNDS,
-                                                 position=self.ball.position))
+                        self.game.report(OutcomeType.BALL_SCATTER, rolls=rolls)
+                        self.game.report(OutcomeType.BALL_OUT_OF_BOUNDS,
+                                         position=self.ball.position)
                         return True
 
                     # Passes are scattered three times
                     if self.is_pass and s < n-1:
                         continue
 
-                    self.game.report(Outcome(OutcomeType.BALL_SCATTER, rolls=rolls))
+                    self.game.report(OutcomeType.BALL_SCATTER, rolls=rolls)
 
                     # On player -> Catch
                     player = self.game.get_catcher(self.ball.position)
                     if player is not None:
                         Catch(self.game, player, self.ball)
-                        self.game.report(Outcome(OutcomeType.BALL_HIT_PLAYER, position=self.ball.position,
-                                                 player=player, rolls=[roll_scatter]))
+                        self.game.report(OutcomeType.BALL_HIT_PLAYER, position=self.ball.position,
+                                         player=player, rolls=[roll_scatter])
                         return True
 
         if self.kick:
             if self.gentle_gust:
                 # Wait for ball to land
-                self.game.report(Outcome(OutcomeType.GENTLE_GUST_IN_BOUNDS, position=self.ball.position,
-                                         rolls=[roll_scatter]))
+                self.game.report(OutcomeType.GENTLE_GUST_IN_BOUNDS, position=self.ball.position,
+                                 rolls=[roll_scatter])
             else:
                 # Wait for ball to land
-                self.game.report(Outcome(OutcomeType.KICK_IN_BOUNDS, position=self.ball.position,
-                                         rolls=[roll_scatter, roll_distance]))
+                self.game.report(OutcomeType.KICK_IN_BOUNDS, position=self.ball.position,
+                                 rolls=[roll_scatter, roll_distance])
         else:
             # Bounce ball
             Bounce(self.game, self.ball)
@@ -2988,9 +3017,9 @@ class ClearBoard(Procedure):
                         roll = DiceRoll([D6(self.game.rnd)], roll_type=RollType.SWELTERING_HEAT_ROLL)
                         if roll.get_sum() == 1:
                             player.state.heated = True
-                            self.game.report(Outcome(OutcomeType.PLAYER_HEATED, player=player, rolls=[roll]))
+                            self.game.report(OutcomeType.PLAYER_HEATED, player=player, rolls=[roll])
                         else:
-                            self.game.report(Outcome(OutcomeType.PLAYER_NOT_HEATED, player=player, rolls=[roll]))
+                            self.game.report(OutcomeType.PLAYER_NOT_HEATED, player=player, rolls=[roll])
         return True
 
 
@@ -3031,17 +3060,17 @@ class Setup(Procedure):
         if action.action_type == ActionType.END_SETUP:
             if not self.game.is_setup_legal_count(self.team, max_players=self.game.config.pitch_max,
                                             min_players=self.game.config.pitch_min):
-                self.game.report(Outcome(OutcomeType.ILLEGAL_SETUP_NUM, team=self.team))
+                self.game.report(OutcomeType.ILLEGAL_SETUP_NUM, team=self.team)
                 return False
             elif not self.game.is_setup_legal_scrimmage(self.team, min_players=self.game.config.scrimmage_min):
-                self.game.report(Outcome(OutcomeType.ILLEGAL_SETUP_SCRIMMAGE, team=self.team))
+                self.game.report(OutcomeType.ILLEGAL_SETUP_SCRIMMAGE, team=self.team)
                 return False
             elif not self.game.is_setup_legal_wings(self.team, max_players=self.game.config.wing_max):
-                self.game.report(Outcome(OutcomeType.ILLEGAL_SETUP_WINGS, team=self.team))
+                self.game.report(OutcomeType.ILLEGAL_SETUP_WINGS, team=self.team)
                 return False
             self.game.state.current_team = None
             self.game.remove_clocks()
-            self.game.report(Outcome(OutcomeType.SETUP_DONE, team=self.team))
+            self.game.report(OutcomeType.SETUP_DONE, team=self.team)
             return True
 
         if action.action_type == ActionType.PLACE_PLAYER:
@@ -3055,7 +3084,7 @@ class Setup(Procedure):
                     self.game.swap(action.player, player_at)
                 else:
                     self.game.move(action.player, action.position)
-            self.game.report(Outcome(OutcomeType.PLAYER_PLACED, position=action.position, player=action.player))
+            self.game.report(OutcomeType.PLAYER_PLACED, position=action.position, player=action.player)
             return False
 
     def available_actions(self):
@@ -3137,11 +3166,11 @@ class ThrowIn(Procedure):
             self.ball.move(x, y)
             if self.game.is_out_of_bounds(self.ball.position):
                 ThrowIn(self.game, self.ball, Square(self.ball.position.x - x, self.ball.position.y - y))
-                self.game.report(Outcome(OutcomeType.THROW_IN_OUT_OF_BOUNDS, position=self.ball.position,
-                                         rolls=[roll_direction, roll_distance]))
+                self.game.report(OutcomeType.THROW_IN_OUT_OF_BOUNDS, position=self.ball.position,
+                                 rolls=[roll_direction, roll_distance])
                 return True
 
-        self.game.report(Outcome(OutcomeType.THROW_IN, position=self.ball.position, rolls=[roll_direction,  roll_distance]))
+        self.game.report(OutcomeType.THROW_IN, position=self.ball.position, rolls=[roll_direction,  roll_distance])
 
         # On player -> Catch
         catcher = self.game.get_catcher(self.ball.position)
@@ -3159,7 +3188,7 @@ class Turnover(Procedure):
         super().__init__(game)
 
     def step(self, action):
-        self.game.report(Outcome(OutcomeType.TURNOVER, team=self.game.state.current_team))
+        self.game.report(OutcomeType.TURNOVER, team=self.game.state.current_team)
         self.game.state.active_player = None
         EndTurn(self.game)
         return True
@@ -3172,7 +3201,7 @@ class Touchdown(Procedure):
         self.player = player
 
     def step(self, action):
-        self.game.report(Outcome(OutcomeType.TOUCHDOWN, team=self.player.team, player=self.player))
+        self.game.report(OutcomeType.TOUCHDOWN, team=self.player.team, player=self.player)
         self.player.team.state.score += 1
         self.game.state.kicking_this_drive = self.player.team
         self.game.state.receiving_this_drive = self.game.get_opp_team(self.player.team)
@@ -3194,7 +3223,7 @@ class TurnStunned(Procedure):
                 player.state.stunned = False
                 player.state.used = True
                 players.append(player)
-        self.game.report(Outcome(OutcomeType.STUNNED_TURNED))
+        self.game.report(OutcomeType.STUNNED_TURNED)
         return True
 
 
@@ -3207,13 +3236,9 @@ class EndTurn(Procedure):
     def step(self, action):
 
         # Remove all procs in the current turn - including the current turn proc.
-        x = 0
-        for i in reversed(range(self.game.state.stack.size())):
-            x += 1
-            if isinstance(self.game.state.stack.items[i], Turn):
+        while not self.game.state.stack.is_empty():
+            if isinstance(self.game.state.stack.pop(), Turn):
                 break
-        for i in range(x):
-            self.game.state.stack.pop()
 
         # Reset turn
         if self.game.state.current_team is not None:
@@ -3266,7 +3291,7 @@ class Turn(Procedure):
         # Start action
         self.game.state.active_player = player
         player_action = PlayerAction(self.game, player, player_action_type, turn=self)
-        self.game.report(Outcome(outcome_type, player=player))
+        self.game.report(outcome_type, player=player)
         if player.has_skill(Skill.BONE_HEAD):
             Bonehead(self.game, player, player_action)
         if player.has_skill(Skill.REALLY_STUPID):
@@ -3281,11 +3306,11 @@ class Turn(Procedure):
         if not self.stunned_turned:
             self.stunned_turned = True
             if self.blitz:
-                self.game.report(Outcome(OutcomeType.BLITZ_START, team=self.team))
+                self.game.report(OutcomeType.BLITZ_START, team=self.team)
             elif self.quick_snap:
-                self.game.report(Outcome(OutcomeType.QUICK_SNAP_START, team=self.team))
+                self.game.report(OutcomeType.QUICK_SNAP_START, team=self.team)
             else:
-                self.game.report(Outcome(OutcomeType.TURN_START, team=self.team, n=self.turn))
+                self.game.report(OutcomeType.TURN_START, team=self.team, n=self.turn)
                 self.team.state.turn = self.turn
                 TurnStunned(self.game, self.team)
             return False
@@ -3293,11 +3318,11 @@ class Turn(Procedure):
         # Handle End Turn action
         if action.action_type == ActionType.END_TURN:
             if self.blitz:
-                self.game.report(Outcome(OutcomeType.END_OF_BLITZ, team=self.team))
+                self.game.report(OutcomeType.END_OF_BLITZ, team=self.team)
             elif self.quick_snap:
-                self.game.report(Outcome(OutcomeType.END_OF_QUICK_SNAP, team=self.team))
+                self.game.report(OutcomeType.END_OF_QUICK_SNAP, team=self.team)
             else:
-                self.game.report(Outcome(OutcomeType.END_OF_TURN, team=self.team))
+                self.game.report(OutcomeType.END_OF_TURN, team=self.team)
             self.game.state.active_player = None
             EndTurn(self.game)
             
@@ -3396,21 +3421,21 @@ class WeatherTable(Procedure):
         roll = DiceRoll([D6(self.game.rnd), D6(self.game.rnd)], roll_type=RollType.WEATHER_ROLL)
         if roll.get_sum() == 2:
             self.game.state.weather = WeatherType.SWELTERING_HEAT
-            self.game.report(Outcome(OutcomeType.WEATHER_SWELTERING_HEAT, rolls=[roll]))
+            self.game.report(OutcomeType.WEATHER_SWELTERING_HEAT, rolls=[roll])
         if roll.get_sum() == 3:
             self.game.state.weather = WeatherType.VERY_SUNNY
-            self.game.report(Outcome(OutcomeType.WEATHER_VERY_SUNNY, rolls=[roll]))
+            self.game.report(OutcomeType.WEATHER_VERY_SUNNY, rolls=[roll])
         if 4 <= roll.get_sum() <= 10:
             if self.kickoff and self.game.state.weather == WeatherType.NICE:
                 self.game.state.gentle_gust = True
             self.game.state.weather = WeatherType.NICE
-            self.game.report(Outcome(OutcomeType.WEATHER_NICE, rolls=[roll]))
+            self.game.report(OutcomeType.WEATHER_NICE, rolls=[roll])
         if roll.get_sum() == 11:
             self.game.state.weather = WeatherType.POURING_RAIN
-            self.game.report(Outcome(OutcomeType.WEATHER_POURING_RAIN, rolls=[roll]))
+            self.game.report(OutcomeType.WEATHER_POURING_RAIN, rolls=[roll])
         if roll.get_sum() == 12:
             self.game.state.weather = WeatherType.BLIZZARD
-            self.game.report(Outcome(OutcomeType.WEATHER_BLIZZARD, rolls=[roll]))
+            self.game.report(OutcomeType.WEATHER_BLIZZARD, rolls=[roll])
         return True
 
 
@@ -3459,10 +3484,10 @@ class Negatrait(Procedure, metaclass=ABCMeta):
             if self.roll.is_d6_success():
                 # Success
                 self.remove_fail_state()
-                self.game.report(Outcome(self.success_outcome, player=self.player, rolls=[self.roll]))
+                self.game.report(self.success_outcome, player=self.player, rolls=[self.roll])
                 return True
             else:
-                self.game.report(Outcome(self.fail_outcome, player=self.player, skill=self.skill, rolls=[self.roll]))
+                self.game.report(self.fail_outcome, player=self.player, skill=self.skill, rolls=[self.roll])
                 # check reroll
                 self.reroll = Reroll(self.game, self.player, self)
                 return False
@@ -3639,7 +3664,7 @@ class Reroll(Procedure):
 
         # If skill
         if self.skill is not None:
-            self.game.report(Outcome(OutcomeType.SKILL_USED, player=self.player, skill=self.skill))
+            self.game.report(OutcomeType.SKILL_USED, player=self.player, skill=self.skill)
             return True
 
         # If no re-rolls are available
@@ -3655,7 +3680,7 @@ class Reroll(Procedure):
         # Use Pro skill?
         if self.can_use_pro:
             if action.action_type == ActionType.USE_SKILL:
-                self.game.report(Outcome(OutcomeType.SKILL_USED, player=self.player, skill=Skill.PRO))
+                self.game.report(OutcomeType.SKILL_USED, player=self.player, skill=Skill.PRO)
                 self.pro = Pro(self.game, self.player, context=self)
                 return False
             elif action.action_type == ActionType.DONT_USE_SKILL:
@@ -3678,7 +3703,7 @@ class Reroll(Procedure):
             if action.action_type == ActionType.USE_REROLL:
                 self.use_reroll = True
                 self.player.team.state.use_reroll()
-                self.game.report(Outcome(OutcomeType.REROLL_USED, team=self.player.team))
+                self.game.report(OutcomeType.REROLL_USED, team=self.player.team)
                 if self.player.has_skill(Skill.LONER):
                     self.loner = Loner(self.game, self.player, context=self)
                     return False
@@ -3767,11 +3792,11 @@ class Pro(Procedure):
 
             if self.roll.is_d6_success():
                 # Success
-                self.game.report(Outcome(OutcomeType.SUCCESSFUL_PRO, player=self.player, rolls=[self.roll]))
+                self.game.report(OutcomeType.SUCCESSFUL_PRO, player=self.player, rolls=[self.roll])
                 self.success = True
                 return True
             else:
-                self.game.report(Outcome(OutcomeType.FAILED_PRO, player=self.player, rolls=[self.roll]))
+                self.game.report(OutcomeType.FAILED_PRO, player=self.player, rolls=[self.roll])
                 # Team re-rolls can be used to re-roll a failed Pro roll
                 self.reroll = Reroll(self.game, self.player, context=self.context)
                 return False
@@ -3803,11 +3828,11 @@ class Loner(Procedure):
 
             if self.roll.is_d6_success():
                 # Success
-                self.game.report(Outcome(OutcomeType.SUCCESSFUL_LONER, player=self.player, rolls=[self.roll]))
+                self.game.report(OutcomeType.SUCCESSFUL_LONER, player=self.player, rolls=[self.roll])
                 self.success = True
                 return True
             else:
-                self.game.report(Outcome(OutcomeType.FAILED_LONER, player=self.player, skill=Skill.LONER, rolls=[self.roll]))
+                self.game.report(OutcomeType.FAILED_LONER, player=self.player, skill=Skill.LONER, rolls=[self.roll])
                 # Failed loner rolls can be re-rolled if the player has the Pro skill
                 self.reroll = Reroll(self.game, self.player, context=self.context)
                 return False
@@ -436,6 +436,12 @@ class Skill(Enum):
     PRO = 78
 
 
+# The bit of each skill in skill masks, e.g. Player.get_skill_mask()
+for _skill in Skill:
+    _skill.mask = 1 << _skill.value
+del _skill
+
+
 class PassDistance(Enum):
     QUICK_PASS = 1
     SHORT_PASS = 2
@@ -7,7 +7,12 @@ A few utilities used across the core modules.
 """
 
 import os
+from copy import deepcopy
+from enum import Enum
+from functools import partial
+from types import MethodType
 import ffai
+from ffai.core.journal import Reversible
 
 
 def parse_enum(enum_class, name):
@@ -75,18 +80,134 @@ def get_line(start, end):
     return points
 
 
-class Stack:
+def clone_value(value, memo):
+    """
+    Clones a value as part of Game.clone(). Objects that were already cloned are looked up in memo by their id, lists,
+    tuples, sets and dicts are copied element-wise and objects implementing clone(memo) are cloned. Classes of immutable
+    objects that are shared with the original, e.g. Square and Role, implement clone(memo) by returning the object.
+    Bound methods and partials of them are bound to the clone of their object, Enum members are shared and all other
+    objects are deep-copied.
+    :param value: the value to clone.
+    :param memo: a dict mapping the id of original objects to their clones.
+    :return: the cloned value.
+    """
+    value_type = type(value)
+    if value_type in _immutable_types:
+        return value
+    clone = memo.get(id(value), memo)
+    if clone is not memo:
+        return clone
+    if value_type is list:
+        return [clone_value(v, memo) for v in value]
+    if value_type is dict:
+        return {clone_value(k, memo): clone_value(v, memo) for k, v in value.items()}
+    if value_type is set:
+        return {clone_value(v, memo) for v in value}
+    if value_type is tuple:
+        return tuple(clone_value(v, memo) for v in value)
+    if value_type is MethodType:
+        return MethodType(value.__func__, clone_value(value.__self__, memo))
+    if value_type is partial:
+        return partial(clone_value(value.func, memo), *clone_value(value.args, memo),
+                       **clone_value(value.keywords, memo))
+    clone_method = getattr(value_type, 'clone', None)
+    if clone_method is not None:
+        return clone_method(value, memo)
+    if isinstance(value, Enum):
+        return value
+    return deepcopy(value, memo)
+
+
+_immutable_types = {type(None), bool, int, float, str}
+
+
+def clone_object(obj, memo):
+    """
+    Makes a shallow copy of obj, registers it in memo and clones each of its attributes with clone_value(). Objects of
+    classes with __slots__ must have all their slots set.
+    :param obj: the object to clone.
+    :param memo: a dict mapping the id of original objects to their clones.
+    :return: the cloned object.
+    """
+    cls = obj.__class__
+    clone = cls.__new__(cls)
+    memo[id(obj)] = clone
+    slots = getattr(cls, '__slots__', None)
+    if slots is None:
+        clone.__dict__.update({name: clone_value(value, memo) for name, value in obj.__dict__.items()})
+    else:
+        for name in slots:
+            setattr(clone, name, clone_value(getattr(obj, name), memo))
+    return clone
+
+
+class Stack(Reversible):
+
+    # The classes, except object and Reversible, that the items of a type are indexed under
+    indexed_classes = {}
+
     def __init__(self):
         self.items = []
+        # Maps each class to the positions in items of its instances, bottom-most first
+        self.index = {}
+
+    def clone(self, memo):
+        clone = Stack()
+        memo[id(self)] = clone
+        clone.items = [clone_value(item, memo) for item in self.items]
+        clone.index = dict(self.index)
+        return clone
 
     def is_empty(self):
         return self.items == []
 
     def push(self, item):
+        position = len(self.items)
         self.items.append(item)
+        for cls in self._get_indexed_classes(type(item)):
+            self.index[cls] = self.index.get(cls, ()) + (position,)
 
     def pop(self):
-        return self.items.pop()
+        item = self.items.pop()
+        for cls in self._get_indexed_classes(type(item)):
+            positions = self.index[cls]
+            if len(positions) == 1:
+                del self.index[cls]
+            else:
+                self.index[cls] = positions[:-1]
+        return item
+
+    def get_last(self, cls):
+        """
+        :param cls: a class.
+        :return: the top-most instance of cls in the stack or None if there is none.
+        """
+        positions = self.index.get(cls)
+        if positions is None:
+            return None
+        return self.items[positions[-1]]
+
+    def get_positions(self, cls):
+        """
+        :param cls: a class.
+        :return: a tuple of the positions in items of the instances of cls in the stack, bottom-most first.
+        """
+        return self.index.get(cls, ())
+
+    def count(self, cls):
+        """
+        :param cls: a class.
+        :return: the number of instances of cls in the stack.
+        """
+        return len(self.index.get(cls, ()))
+
+    @staticmethod
+    def _get_indexed_classes(item_type):
+        classes = Stack.indexed_classes.get(item_type)
+        if classes is None:
+            classes = tuple(cls for cls in item_type.__mro__ if cls is not object and cls is not Reversible)
+            Stack.indexed_classes[item_type] = classes
+        return classes
 
     def peek(self):
         return self.items[len(self.items)-1]
@@ -0,0 +1,154 @@
+"""
+This module contains a headless batch simulator that plays many games between two registered bots as fast as
+possible. Clocks, replays and the cloning of the game for the agents are switched off and the games are spread over a
+number of worker processes. Run it with:
+
+python -m ffai.sim random random --games 100 --workers 4
+"""
+import argparse
+import importlib
+import multiprocessing
+import time
+from ffai.ai.registry import make_bot, list_bots
+from ffai.core.game import Game
+from ffai.core.load import load_config, load_rule_set, load_arena, load_team_by_filename
+
+
+class SimulationResult:
+
+    def __init__(self, home_bot, away_bot, workers, seconds, chunks):
+        """
+        :param home_bot: id of the home bot.
+        :param away_bot: id of the away bot.
+        :param workers: number of worker processes used.
+        :param seconds: wall-clock time of the simulation.
+        :param chunks: the results of the chunks of games played by the workers.
+        """
+        self.home_bot = home_bot
+        self.away_bot = away_bot
+        self.workers = workers
+        self.seconds = seconds
+        self.games = sum(chunk['games'] for chunk in chunks)
+        self.steps = sum(chunk['steps'] for chunk in chunks)
+        self.home_wins = sum(chunk['home_wins'] for chunk in chunks)
+        self.away_wins = sum(chunk['away_wins'] for chunk in chunks)
+        self.draws = self.games - self.home_wins - self.away_wins
+        self.home_tds = sum(chunk['home_tds'] for chunk in chunks)
+        self.away_tds = sum(chunk['away_tds'] for chunk in chunks)
+        self.procedure_times = {}
+        for chunk in chunks:
+            for name, (count, proc_seconds) in chunk['procedure_times'].items():
+                if name not in self.procedure_times:
+                    self.procedure_times[name] = [0, 0.0]
+                self.procedure_times[name][0] += count
+                self.procedure_times[name][1] += proc_seconds
+        self.games_per_second = self.games / seconds if seconds > 0 else 0
+        self.steps_per_second = self.steps / seconds if seconds > 0 else 0
+
+    def print(self):
+        print(f"{self.home_bot} (home) vs. {self.away_bot} (away)")
+        print(f"Games: {self.games} with {self.workers} worker(s) in {self.seconds:.2f} s")
+        print(f"- {self.games_per_second:.2f} games/s")
+        print(f"- {self.steps_per_second:.0f} steps/s")
+        print(f"Results: {self.home_wins} home wins, {self.away_wins} away wins, {self.draws} draws")
+        print(f"TDs: {self.home_tds} - {self.away_tds}")
+        print("Procedure time:")
+        total = sum(seconds for _, seconds in self.procedure_times.values())
+        procedures = sorted(self.procedure_times.items(), key=lambda item: item[1][1], reverse=True)
+        print(f"{'procedure':<26}{'steps':>10}{'seconds':>10}{'us/step':>10}{'share':>8}")
+        for name, (count, seconds) in procedures:
+            share = seconds / total if total > 0 else 0
+            print(f"{name:<26}{count:>10}{seconds:>10.2f}{seconds / count * 1e6:>10.1f}{share:>8.1%}")
+
+
+def _play_games(home_bot, away_bot, seeds, config_name, home_team, away_team, modules):
+    """
+    Plays a game for each seed in one process.
+    :return: a dict with the number of games and steps, the results and the time spent in each procedure.
+    """
+    for module in modules:
+        importlib.import_module(module)
+    config = load_config(config_name)
+    config.competition_mode = False
+    config.fast_mode = True
+    config.debug_mode = False
+    config.clocks = False
+    config.silent = True
+    config.clone_game_for_agents = False
+    ruleset = load_rule_set(config.ruleset, all_rules=False)
+    arena = load_arena(config.arena)
+    home = load_team_by_filename(home_team, ruleset, board_size=config.pitch_max)
+    away = load_team_by_filename(away_team, ruleset, board_size=config.pitch_max)
+    result = {'games': 0, 'steps': 0, 'home_wins': 0, 'away_wins': 0, 'home_tds': 0, 'away_tds': 0,
+              'procedure_times': {}}
+    for seed in seeds:
+        home_agent = make_bot(home_bot)
+        away_agent = make_bot(away_bot)
+        game = Game(seed, home, away, home_agent, away_agent, config, arena=arena, ruleset=ruleset, record=False,
+                    seed=seed)
+        game.procedure_times = result['procedure_times']
+        game.init()
+        winner = game.get_winner()
+        result['games'] += 1
+        if winner is home_agent:
+            result['home_wins'] += 1
+        elif winner is away_agent:
+            result['away_wins'] += 1
+        result['home_tds'] += game.state.home_team.state.score
+        result['away_tds'] += game.state.away_team.state.score
+    result['steps'] = sum(count for count, _ in result['procedure_times'].values())
+    return result
+
+
+def simulate(home_bot, away_bot, num_games, workers=1, config_name="ff-11", home_team="human", away_team="human",
+             seed=0, modules=()):
+    """
+    Plays num_games games between two registered bots without clocks, replays or cloning of the game for the agents.
+    :param home_bot: id of the home bot in the bot registry.
+    :param away_bot: id of the away bot in the bot registry.
+    :param num_games: number of games to play.
+    :param workers: number of worker processes to spread the games over.
+    :param config_name: name of the configuration to load.
+    :param home_team: filename of the home team.
+    :param away_team: filename of the away team.
+    :param seed: seed of the first game. Game i is played with seed + i.
+    :param modules: names of modules to import in each worker, e.g. the modules that register the bots.
+    :return: a SimulationResult.
+    """
+    workers = max(1, min(workers, num_games))
+    chunks = [list(range(seed + i, seed + num_games, workers)) for i in range(workers)]
+    args = [(home_bot, away_bot, seeds, config_name, home_team, away_team, list(modules)) for seeds in chunks]
+    start = time.time()
+    if workers == 1:
+        results = [_play_games(*args[0])]
+    else:
+        with multiprocessing.Pool(workers) as pool:
+            results = pool.starmap(_play_games, args)
+    seconds = time.time() - start
+    return SimulationResult(home_bot, away_bot, workers, seconds, results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play many games between two registered bots.")
+    parser.add_argument("home_bot", help="id of the home bot")
+    parser.add_argument("away_bot", help="id of the away bot")
+    parser.add_argument("--games", type=int, default=10, help="number of games to play")
+    parser.add_argument("--workers", type=int, default=1, help="number of worker processes")
+    parser.add_argument("--config", default="ff-11", help="name of the configuration")
+    parser.add_argument("--home-team", default="human", help="filename of the home team")
+    parser.add_argument("--away-team", default="human", help="filename of the away team")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game")
+    parser.add_argument("--module", action="append", default=[], help="module to import that registers bots")
+    args = parser.parse_args()
+    for module in args.module:
+        importlib.import_module(module)
+    for bot in [args.home_bot, args.away_bot]:
+        if bot.lower() not in list_bots():
+            parser.error(f"Bot with ID {bot.lower()} not registered. Registered bots: {', '.join(list_bots())}")
+    result = simulate(args.home_bot, args.away_bot, args.games, workers=args.workers, config_name=args.config,
+                      home_team=args.home_team, away_team=args.away_team, seed=args.seed, modules=args.module)
+    result.print()
+
+
+if __name__ == "__main__":
+    main()
@@ -99,3 +99,19 @@ def test_multiple_gyms(env):
     for p in ps:
         p.join()
     assert True
+
+
+def test_gym_action_mask():
+    env = gym.make("FFAI-1-v2")
+    env.seed(0)
+    rnd = np.random.RandomState(0)
+    env.reset()
+    done = False
+    steps = 0
+    while not done and steps < 200:
+        mask = env.get_action_mask()
+        assert mask.any()
+        action = env.compute_action(rnd.choice(np.flatnonzero(mask)))
+        obs, reward, done, info = env.step(action)
+        steps += 1
+    assert steps > 10
@@ -0,0 +1,59 @@
+from tests.util import *
+from ffai.ai.env import FFAIEnv
+
+
+def test_action_mask_matches_available_actions():
+    game = get_game_turn()
+    non_spatial = FFAIEnv.non_spatial_action_types
+    spatial = FFAIEnv.spatial_action_types
+    squares = game.arena.width * game.arena.height
+    out = np.zeros(len(non_spatial) + len(spatial) * squares, dtype=bool)
+    bot = RandomBot("bot", seed=0)
+    for _ in range(100):
+        if game.state.game_over:
+            break
+        mask = game.get_action_mask(non_spatial, spatial, out=out)
+        assert mask is out
+        action_types = set(action_choice.action_type for action_choice in game.get_available_actions())
+        for i, action_type in enumerate(non_spatial):
+            assert mask[i] == (action_type in action_types)
+        for i, action_type in enumerate(spatial):
+            board = mask[len(non_spatial) + i * squares:len(non_spatial) + (i + 1) * squares]
+            positions = set()
+            for action_choice in game.get_available_actions():
+                if action_choice.action_type == action_type:
+                    positions.update(action_choice.positions or [player.position for player in action_choice.players])
+            assert set(game.get_square(i % game.arena.width, i // game.arena.width)
+                       for i in np.flatnonzero(board)) == positions
+        for index in np.flatnonzero(mask):
+            action = game.get_action_from_index(index, non_spatial, spatial)
+            assert game._is_action_allowed(action)
+        game.step(bot.act(game))
+
+
+def test_action_from_index():
+    game = get_game_turn()
+    non_spatial = [ActionType.END_TURN]
+    spatial = [ActionType.MOVE, ActionType.BLOCK]
+    squares = game.arena.width * game.arena.height
+    action = game.get_action_from_index(0, non_spatial, spatial)
+    assert action.action_type == ActionType.END_TURN and action.position is None
+    action = game.get_action_from_index(1 + squares + 2 * game.arena.width + 3, non_spatial, spatial)
+    assert action.action_type == ActionType.BLOCK
+    assert action.position == Square(3, 2)
+
+
+def test_is_action_allowed(capsys):
+    game = get_game_turn()
+    action_choice = game.get_action_choice(ActionType.START_MOVE)
+    assert action_choice is not None
+    assert game.get_action_choice(ActionType.SELECT_PUSH) is None
+    player = action_choice.players[0]
+    assert game._is_action_allowed(Action(ActionType.START_MOVE, player=player))
+    assert game._is_action_allowed(Action(ActionType.START_MOVE, position=Square(player.position.x, player.position.y)))
+    opponent = game.get_players_on_pitch(game.get_opp_team(game.state.current_team))[0]
+    assert not game._is_action_allowed(Action(ActionType.START_MOVE, player=opponent), silent=True)
+    assert capsys.readouterr().out == ""
+    assert not game._is_action_allowed(Action(ActionType.START_MOVE, player=opponent))
+    assert "Illegal player" in capsys.readouterr().out
+    assert not game._is_action_allowed(Action(ActionType.SELECT_PUSH))
@@ -29,3 +29,89 @@ def test_get_adjacent_opponents():
             assert len(game.get_assisting_players(opponent, player)) == i-1
             i += 1
 
+
+def test_get_square_returns_shared_squares():
+    game = get_game_turn(empty=True)
+    width, height = game.state.pitch.width, game.state.pitch.height
+    for x, y in [(0, 0), (6, 6), (width - 1, height - 1)]:
+        square = game.get_square(x, y)
+        assert square is game.state.pitch.squares[y][x]
+        assert square.x == x and square.y == y
+    assert game.get_square(width, 0) == Square(width, 0)
+    assert game.get_square(-1, 0) == Square(-1, 0)
+    assert game.clone().state.pitch.squares is game.state.pitch.squares
+    with pytest.raises(AttributeError):
+        game.get_square(1, 1).x = 2
+
+
+def test_tackle_zones_follow_player_state():
+    game = get_game_turn(empty=True)
+    player = game.get_reserves(game.state.home_team)[0]
+    opponent = game.get_reserves(game.state.away_team)[0]
+    game.reserves_to_pitch(player, Square(5, 5))
+    game.reserves_to_pitch(opponent, Square(6, 6))
+    assert game.num_tackle_zones_in(player) == 1
+    assert game.num_tackle_zones_at(player, Square(7, 7)) == 1
+    assert game.num_tackle_zones_at(player, Square(8, 8)) == 0
+    opponent.state.up = False
+    assert game.num_tackle_zones_in(player) == 0
+    opponent.state.up = True
+    opponent.state.hypnotized = True
+    assert game.num_tackle_zones_in(player) == 0
+    opponent.state.hypnotized = False
+    game.move(opponent, Square(7, 7))
+    assert game.num_tackle_zones_in(player) == 0
+    assert game.get_adjacent_opponents(player) == []
+    game.swap(player, opponent)
+    assert game.num_tackle_zones_at(player, Square(6, 6)) == 1
+    assert game.get_adjacent_opponents(player) == []
+    game.remove(opponent)
+    assert game.num_tackle_zones_at(player, Square(6, 6)) == 0
+
+
+def test_tackle_zone_versions_are_kept_per_game():
+    game = get_game_turn(empty=True)
+    player = game.get_reserves(game.state.home_team)[0]
+    opponent = game.get_reserves(game.state.away_team)[0]
+    game.reserves_to_pitch(player, Square(5, 5))
+    game.reserves_to_pitch(opponent, Square(6, 6))
+    clone = game.clone()
+    versions = game.state.pitch.player_versions
+    version = versions.tackle_zones
+    clone.get_player(opponent.player_id).state.up = False
+    assert versions.tackle_zones == version
+    assert clone.num_tackle_zones_in(clone.get_player(player.player_id)) == 0
+    assert game.num_tackle_zones_in(player) == 1
+    opponent.state.up = False
+    assert versions.tackle_zones > version
+    assert game.num_tackle_zones_in(player) == 0
+
+
+def test_assists_follow_player_state():
+    game = get_game_turn(empty=True)
+    team1 = game.state.home_team
+    team2 = game.state.away_team
+    attacker, assister = game.get_reserves(team1)[:2]
+    defender, marker = game.get_reserves(team2)[:2]
+    game.reserves_to_pitch(attacker, Square(5, 5))
+    game.reserves_to_pitch(defender, Square(6, 5))
+    game.reserves_to_pitch(assister, Square(7, 6))
+    # The assister is only in the defender's tackle zone
+    assert game.num_assists_at(attacker, defender, attacker.position) == (1, 0)
+    assert game.get_assisting_players(attacker, defender) == [assister]
+    game.reserves_to_pitch(marker, Square(8, 7))
+    assert game.num_assists_at(attacker, defender, attacker.position) == (0, 0)
+    assert game.get_assisting_players(attacker, defender) == []
+    marker.state.up = False
+    assert game.num_assists_at(attacker, defender, attacker.position) == (1, 0)
+    marker.state.up = True
+    assister.extra_skills.append(Skill.GUARD)
+    assister.invalidate_stats()
+    assert game.num_assists_at(attacker, defender, attacker.position) == (1, 0)
+    assert game.num_assists_at(attacker, defender, attacker.position, foul=True) == (0, 0)
+    # The marker assists against a blitz from a square it is adjacent to unless the assister is marking it
+    assert game.num_assists_at(attacker, defender, Square(7, 4)) == (1, 0)
+    game.move(marker, Square(8, 4))
+    assert game.num_assists_at(attacker, defender, Square(7, 4)) == (1, 1)
+    game.move(assister, Square(7, 5))
+    assert game.num_assists_at(attacker, defender, Square(7, 4)) == (1, 0)
@@ -10,6 +10,7 @@ def test_agility_test(ag):
     player = team.players[1]
     player.role.ag = ag
     player.role.skills = []
+    player.invalidate_stats()
     game.put(player, Square(10, 1))
     agility_roll = Rules.agility_table[player.get_ag()]
     if ag == 1:
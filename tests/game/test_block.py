@@ -184,3 +184,42 @@ def test_available_actions_on_block_reroll():
     assert len(actions) == 2
 
 
+def test_block_outcome_probs():
+    # One die: attacker down on skull and both down, defender down on both down, stumbles and pow
+    assert get_block_outcome_probs(1, 0, 0) == pytest.approx((2 / 6, 3 / 6, 0, 0, 0))
+    # Two dice with Block: attacker only down on two skulls
+    p_self, p_opp, _, _, _ = get_block_outcome_probs(2, Skill.BLOCK.mask, 0)
+    assert p_self == pytest.approx(1 / 36)
+    assert p_opp == pytest.approx(1 - (3 / 6) ** 2)
+    # Defender selects: prefers a skull, then both down to take the attacker down with it, then a push
+    p_self, p_opp, _, _, _ = get_block_outcome_probs(-2, 0, Skill.DODGE.mask)
+    assert p_self == pytest.approx(1 - (4 / 6) ** 2)
+    assert p_opp == pytest.approx((5 / 6) ** 2 - (4 / 6) ** 2 + (1 / 6) ** 2)
+    # Pushes into the crowd take the ball with them
+    _, p_opp, _, p_fumble_opp, p_crowd = get_block_outcome_probs(1, 0, 0, crowd=True, defender_ball=True)
+    assert p_crowd == pytest.approx(4 / 6)
+    assert p_opp == p_fumble_opp == pytest.approx(5 / 6)
+    _, _, _, _, p_crowd = get_block_outcome_probs(1, 0, Skill.STAND_FIRM.mask, crowd=True)
+    assert p_crowd == 0
+    # Pro re-rolls a knock-down of the attacker on a 4+
+    p_self, _, _, _, _ = get_block_outcome_probs(1, Skill.PRO.mask, 0)
+    assert p_self == pytest.approx(2 / 6 * (1 / 2 + 1 / 2 * 2 / 6))
+    assert get_block_outcome_probs(1, 0, 0) is get_block_outcome_probs(1, 0, 0)
+
+
+def test_block_probs():
+    game = get_game_turn()
+    team = game.get_agent_team(game.actor)
+    attacker, defender = get_block_players(game, team)
+    attacker.extra_st = defender.get_st() - attacker.get_st() + 1
+    attacker.extra_skills = [Skill.BLOCK]
+    defender.extra_skills = []
+    defender.role.skills = []
+    defender.invalidate_stats()
+    game.get_ball().move_to(defender.position)
+    game.get_ball().is_carried = True
+    assert game.num_block_dice(attacker, defender) == 2
+    p_self, p_opp, p_fumble_self, p_fumble_opp = game.get_block_probs(attacker, defender)
+    assert p_self == pytest.approx(1 / 36)
+    assert p_fumble_self == 0
+    assert p_fumble_opp == pytest.approx(p_opp)
@@ -0,0 +1,84 @@
+from tests.util import *
+
+
+def assert_arrays_match(game):
+    arrays = game.get_board_arrays()
+    for y in range(game.arena.height):
+        for x in range(game.arena.width):
+            player = game.state.pitch.board[y][x]
+            i = arrays.grid[y, x]
+            assert (player is None and i == -1) or arrays.players[i] is player
+    for i, player in enumerate(arrays.players):
+        if player.position is None:
+            assert not arrays.on_pitch()[i]
+        else:
+            assert tuple(arrays.position[i]) == (player.position.x, player.position.y)
+        assert arrays.up[i] == player.state.up
+        assert arrays.used[i] == player.state.used
+        assert arrays.ma[i] == player.get_ma()
+        assert arrays.st[i] == player.get_st()
+        assert arrays.team[i] == game.state.teams.index(player.team)
+
+
+def test_board_arrays_follow_pitch():
+    game = get_game_turn()
+    assert_arrays_match(game)
+    player = game.get_players_on_pitch(game.state.current_team)[0]
+    game.remove(player)
+    assert_arrays_match(game)
+    game.put(player, Square(1, 1))
+    game.move(player, Square(2, 1))
+    assert_arrays_match(game)
+    player.state.up = False
+    assert_arrays_match(game)
+    # The player arrays are only refreshed when a player has changed
+    version = game.get_board_arrays().version
+    assert game.get_board_arrays().version == version
+    player.extra_st += 1
+    assert_arrays_match(game)
+    assert game.get_board_arrays().version > version
+
+
+def test_board_arrays_with_clone_and_journal():
+    game = get_game_turn()
+    game.get_board_arrays()
+    game.enable_journal()
+    bot = RandomBot("bot", seed=1)
+    for _ in range(50):
+        if game.state.game_over:
+            break
+        game.step(bot.act(game))
+        clone = game.clone()
+        assert clone.state.pitch.arrays.grid is not game.state.pitch.arrays.grid
+        assert_arrays_match(clone)
+        assert_arrays_match(game)
+    game.revert(game.num_reversible_steps())
+    assert_arrays_match(game)
+
+
+def assert_players_on_pitch_match(game):
+    for team in game.state.teams:
+        players = [player for row in game.state.pitch.board for player in row
+                   if player is not None and player.team == team]
+        assert game.get_players_on_pitch(team) == players
+        assert game.get_players_on_pitch(team, used=False, up=True) == \
+            [player for player in players if not player.state.used and player.state.up]
+
+
+def test_players_on_pitch_follow_pitch():
+    game = get_game_turn()
+    assert_players_on_pitch_match(game)
+    game.enable_journal()
+    team = game.state.current_team
+    player = game.get_players_on_pitch(team)[0]
+    game.pitch_to_reserves(player)
+    assert player not in game.get_players_on_pitch(team)
+    assert_players_on_pitch_match(game)
+    game.reserves_to_pitch(player, Square(1, 1))
+    assert game.get_players_on_pitch(team)[0] == player
+    opponent = game.get_players_on_pitch(game.get_opp_team(team))[0]
+    game.swap(player, opponent)
+    assert_players_on_pitch_match(game)
+    game.revert(game.num_reversible_steps())
+    assert_players_on_pitch_match(game)
+    assert_players_on_pitch_match(game.clone())
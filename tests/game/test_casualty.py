@@ -9,6 +9,7 @@ def test_casualty():
     attacker, defender = get_block_players(game, team)
     attacker.extra_st = defender.get_st() - attacker.get_st() + 1  # make this a 2 die block.
     attacker.extra_skills.append(Skill.BLOCK)
+    attacker.invalidate_stats()
     defender_pos = Square(defender.position.x, defender.position.y)
     # it's a 2 dice block
     BBDie.clear_fixes()
@@ -44,8 +45,10 @@ def test_casualty_regeneration_success():
     attacker, defender = get_block_players(game, team)
     attacker.extra_st = defender.get_st() - attacker.get_st() + 1  # make this a 2 die block.
     attacker.extra_skills.append(Skill.BLOCK)
+    attacker.invalidate_stats()
     defender_pos = Square(defender.position.x, defender.position.y)
     defender.extra_skills.append(Skill.REGENERATION)
+    defender.invalidate_stats()
     # it's a 2 dice block
     BBDie.clear_fixes()
     BBDie.fix_result(BBDieResult.BOTH_DOWN)
@@ -80,8 +83,10 @@ def test_casualty_regeneration_fail():
     attacker, defender = get_block_players(game, team)
     attacker.extra_st = defender.get_st() - attacker.get_st() + 1  # make this a 2 die block.
     attacker.extra_skills.append(Skill.BLOCK)
+    attacker.invalidate_stats()
     defender_pos = Square(defender.position.x, defender.position.y)
     defender.extra_skills.append(Skill.REGENERATION)
+    defender.invalidate_stats()
     # it's a 2 dice block
     BBDie.clear_fixes()
     BBDie.fix_result(BBDieResult.BOTH_DOWN)
@@ -116,8 +121,10 @@ def test_casualty_with_decay():
     attacker, defender = get_block_players(game, team)
     attacker.extra_st = defender.get_st() - attacker.get_st() + 1  # make this a 2 die block.
     attacker.extra_skills.append(Skill.BLOCK)
+    attacker.invalidate_stats()
     defender_pos = Square(defender.position.x, defender.position.y)
     defender.extra_skills.append(Skill.DECAY)
+    defender.invalidate_stats()
     # it's a 2 dice block
     BBDie.clear_fixes()
     BBDie.fix_result(BBDieResult.BOTH_DOWN)
@@ -155,8 +162,10 @@ def test_casualty_with_decay_mng_twice_is_just_one():
     attacker, defender = get_block_players(game, team)
     attacker.extra_st = defender.get_st() - attacker.get_st() + 1  # make this a 2 die block.
     attacker.extra_skills.append(Skill.BLOCK)
+    attacker.invalidate_stats()
     defender_pos = Square(defender.position.x, defender.position.y)
     defender.extra_skills.append(Skill.DECAY)
+    defender.invalidate_stats()
     # it's a 2 dice block
     BBDie.clear_fixes()
     BBDie.fix_result(BBDieResult.BOTH_DOWN)
@@ -193,9 +202,11 @@ def test_casualty_regeneration_success():
     attacker, defender = get_block_players(game, team)
     attacker.extra_st = defender.get_st() - attacker.get_st() + 1  # make this a 2 die block.
     attacker.extra_skills.append(Skill.BLOCK)
+    attacker.invalidate_stats()
     defender_pos = Square(defender.position.x, defender.position.y)
     defender.extra_skills.append(Skill.REGENERATION)
     defender.extra_skills.append(Skill.DECAY)
+    defender.invalidate_stats()
 
     # it's a 2 dice block
     BBDie.clear_fixes()
@@ -231,9 +242,11 @@ def test_casualty_regeneration_failure():
     attacker, defender = get_block_players(game, team)
     attacker.extra_st = defender.get_st() - attacker.get_st() + 1  # make this a 2 die block.
     attacker.extra_skills.append(Skill.BLOCK)
+    attacker.invalidate_stats()
     defender_pos = Square(defender.position.x, defender.position.y)
     defender.extra_skills.append(Skill.REGENERATION)
     defender.extra_skills.append(Skill.DECAY)
+    defender.invalidate_stats()
 
     # it's a 2 dice block
     BBDie.clear_fixes()
@@ -10,6 +10,7 @@ def test_catch_modifiers(weather):
     passer = team.players[0]
     catcher = team.players[1]
     catcher.role.skills = []
+    catcher.invalidate_stats()
     game.put(passer, Square(1, 1))
     game.put(catcher, Square(10, 1))
     game.state.weather = weather
@@ -34,6 +35,7 @@ def test_catch_modifiers(weather):
     mods = game.get_catch_modifiers(catcher, handoff=True)
     assert mods == 0 + weather_mod
     catcher.role.skills = [Skill.EXTRA_ARMS]
+    catcher.invalidate_stats()
     mods = game.get_catch_modifiers(catcher, handoff=True)
     assert mods == 1 + weather_mod
 
@@ -45,6 +47,7 @@ def test_catch_modifiers():
     passer = team.players[0]
     catcher = team.players[1]
     catcher.role.skills = []
+    catcher.invalidate_stats()
     game.put(passer, Square(1, 1))
     game.put(catcher, Square(10, 1))
     game.state.weather = WeatherType.NICE
@@ -57,6 +60,7 @@ def test_catch_modifiers():
     mods = game.get_catch_modifiers(catcher, accurate=True)
     assert mods == 0
     catcher.role.skills = [Skill.NERVES_OF_STEEL]
+    catcher.invalidate_stats()
     mods = game.get_catch_modifiers(catcher, accurate=True)
     assert mods == 1
 
@@ -68,10 +72,12 @@ def test_diving_catch_modifiers():
     passer = team.players[0]
     catcher = team.players[1]
     catcher.role.skills = []
+    catcher.invalidate_stats()
     game.put(passer, Square(1, 1))
     game.put(catcher, Square(10, 1))
     game.state.weather = WeatherType.NICE
     catcher.role.skills = [Skill.DIVING_CATCH]
+    catcher.invalidate_stats()
     mods = game.get_catch_modifiers(catcher, accurate=True)
     assert mods == 2
     mods = game.get_catch_modifiers(catcher, accurate=False)
@@ -86,6 +92,7 @@ def test_catch_team_reroll():
     passer = team.players[0]
     catcher = team.players[1]
     catcher.role.skills = []
+    catcher.invalidate_stats()
     game.put(passer, Square(1, 1))
     game.get_ball().move_to(passer.position)
     game.get_ball().is_carried = True
@@ -110,6 +117,7 @@ def test_catch_skill_reroll():
     passer = team.players[0]
     catcher = team.players[1]
     catcher.role.skills = [Skill.CATCH]
+    catcher.invalidate_stats()
     game.put(passer, Square(1, 1))
     game.get_ball().move_to(passer.position)
     game.get_ball().is_carried = True
@@ -132,6 +140,7 @@ def test_diving_catch():
     passer = team.players[0]
     passer.role.skills = []
     passer.role.ag = 3
+    passer.invalidate_stats()
     game.put(passer, Square(1, 1))
     game.get_ball().move_to(passer.position)
     game.get_ball().is_carried = True
@@ -0,0 +1,64 @@
+from tests.util import *
+
+
+def get_game_json(game):
+    game_json = game.to_json()
+    game_json['state'].pop('clocks')
+    return game_json
+
+
+def test_clone_is_independent():
+    game = get_game_turn()
+    clone = game.clone()
+    assert get_game_json(clone) == get_game_json(game)
+    assert clone.arena is game.arena
+    assert clone.ruleset is game.ruleset
+    for team in game.state.teams:
+        clone_team = clone.get_team_by_id(team.team_id)
+        assert clone_team is not team
+        for player in team.players:
+            clone_player = clone.get_player(player.player_id)
+            assert clone_player is not player
+            assert clone_player.state is not player.state
+            assert clone_player.team is clone_team
+            assert clone_player.role is player.role
+            if player.position is not None:
+                assert clone.get_player_at(player.position) is clone_player
+    for proc in clone.state.stack.items:
+        assert proc.game is clone
+    clone_player = clone.get_players_on_pitch(clone.state.current_team)[0]
+    player = game.get_player(clone_player.player_id)
+    clone_player.state.up = False
+    assert player.state.up
+    clone.remove(clone_player)
+    assert game.get_player_at(player.position) is player
+
+
+def test_clone_continues_identically():
+    game = get_game_turn()
+    clone = game.clone()
+    bot = RandomBot("bot", seed=1)
+    clone_bot = RandomBot("bot", seed=1)
+    for _ in range(100):
+        if game.state.game_over:
+            break
+        game.step(bot.act(game))
+        clone.step(clone_bot.act(clone))
+        assert get_game_json(clone) == get_game_json(game)
+
+
+class Tally:
+
+    def __init__(self):
+        self.counts = []
+
+
+def test_clone_value_copies_objects_without_clone():
+    tally = Tally()
+    square = Square(1, 2)
+    clone = clone_value([tally, tally, square, Skill.BLOCK], {})
+    assert clone[0] is not tally
+    assert clone[0] is clone[1]
+    assert clone[0].counts is not tally.counts
+    assert clone[2] is square
+    assert clone[3] is Skill.BLOCK
@@ -186,6 +186,7 @@ def test_dodge_use_break_tackle():
     player.extra_skills = [Skill.BREAK_TACKLE]
     player.role.st = 4
     player.role.ag = 3
+    player.invalidate_stats()
     game.put(player, Square(11, 11))
 
     opponents = game.get_players_on_pitch(game.get_opp_team(team))
@@ -217,6 +218,7 @@ def test_break_tackle_reroll():
     player.extra_skills = [Skill.BREAK_TACKLE]
     player.role.st = 3
     player.role.ag = 2
+    player.invalidate_stats()
     game.put(player, Square(11, 11))
 
     opponents = game.get_players_on_pitch(game.get_opp_team(team))
@@ -252,6 +254,7 @@ def test_break_tackle_twice():
     player.extra_skills = [Skill.BREAK_TACKLE]
     player.role.st = 3
     player.role.ag = 2
+    player.invalidate_stats()
     game.put(player, Square(11, 11))
 
     opponents = game.get_players_on_pitch(game.get_opp_team(team))
@@ -279,3 +282,29 @@ def test_break_tackle_twice():
     assert player.position == to_second
     assert not player.state.up
     assert game.has_report_of_type(OutcomeType.FAILED_DODGE)
+
+
+def test_lazy_dodge_rolls():
+    game = get_game_turn(empty=True)
+    team = game.get_agent_team(game.actor)
+    player = team.players[0]
+    opp_player = game.get_opp_team(team).players[0]
+    game.put(player, Square(5, 5))
+    game.put(opp_player, Square(6, 5))
+    game.step(Action(ActionType.START_MOVE, player=player))
+    move = [choice for choice in game.state.available_actions if choice.action_type == ActionType.MOVE][0]
+    assert callable(move._agi_rolls)
+    target = Rules.agility_table[player.get_ag()]
+    expected = [[min(6, max(2, target - game.get_dodge_modifiers(player, position)))] for position in move.positions]
+    clone = game.clone()
+    assert callable(move._agi_rolls)
+    clone_move = [choice for choice in clone.state.available_actions if choice.action_type == ActionType.MOVE][0]
+    game.enable_journal()
+    game.step(Action(ActionType.MOVE, player=player, position=Square(5, 4)))
+    assert callable(move._agi_rolls)
+    assert clone_move.agi_rolls == expected
+    # The rolls are computed from the game state, so they cannot be read after the game has taken another step
+    with pytest.raises(Exception):
+        move.agi_rolls
+    game.revert()
+    assert move.agi_rolls == expected
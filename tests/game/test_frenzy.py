@@ -17,6 +17,7 @@ def test_frenzy_block():
         adjacent = game.get_adjacent_opponents(attacker)
         if len(adjacent) > 0:
             attacker.extra_skills.append(Skill.FRENZY)
+            attacker.invalidate_stats()
             defender = adjacent[0]
             break
     defender_pos = Square(defender.position.x, defender.position.y)
@@ -51,6 +52,7 @@ def test_frenzy_blitz():
         adjacent = game.get_adjacent_opponents(attacker)
         if len(adjacent) > 0:
             attacker.extra_skills.append(Skill.FRENZY)
+            attacker.invalidate_stats()
             defender = adjacent[0]
             break
     defender_pos = Square(defender.position.x, defender.position.y)
@@ -85,6 +87,7 @@ def test_frenzy_knocked_down():
         adjacent = game.get_adjacent_opponents(attacker)
         if len(adjacent) > 0:
             attacker.extra_skills.append(Skill.FRENZY)
+            attacker.invalidate_stats()
             defender = adjacent[0]
             break
     defender_pos = Square(defender.position.x, defender.position.y)
@@ -9,11 +9,14 @@ def test_interception_success():
     game.clear_board()
     passer = team.players[0]
     passer.role.skills = []
+    passer.invalidate_stats()
     catcher = team.players[1]
     catcher.role.skills = []
+    catcher.invalidate_stats()
     interceptor = opp_team.players[0]
     interceptor.role.skills = []
     interceptor.role.ag = 3
+    interceptor.invalidate_stats()
     game.put(passer, Square(1, 1))
     game.put(interceptor, Square(5, 1))
     game.put(catcher, Square(10, 1))
@@ -40,6 +43,7 @@ def test_interception_safe_throw_success():
     catcher.extra_skills = []
     interceptor = opp_team.players[0]
     interceptor.role.ag = 3
+    interceptor.invalidate_stats()
     interceptor.extra_skills = []
     game.put(passer, Square(1, 1))
     game.put(interceptor, Square(5, 1))
@@ -72,6 +76,7 @@ def test_interception_safe_throw_fail():
     catcher.extra_skills = []
     interceptor = opp_team.players[0]
     interceptor.role.ag = 3
+    interceptor.invalidate_stats()
     interceptor.extra_skills = []
     game.put(passer, Square(1, 1))
     game.put(interceptor, Square(5, 1))
@@ -103,6 +108,7 @@ def test_interception_safe_throw_very_long_legs_fail():
     catcher.extra_skills = []
     interceptor = opp_team.players[0]
     interceptor.role.ag = 3
+    interceptor.invalidate_stats()
     interceptor.extra_skills = [Skill.VERY_LONG_LEGS]
     game.put(passer, Square(1, 1))
     game.put(interceptor, Square(5, 1))
@@ -127,11 +133,14 @@ def test_interception_fail():
     game.clear_board()
     passer = team.players[0]
     passer.role.skills = []
+    passer.invalidate_stats()
     catcher = team.players[1]
     catcher.role.skills = []
+    catcher.invalidate_stats()
     interceptor = opp_team.players[0]
     interceptor.role.skills = []
     interceptor.role.ag = 3
+    interceptor.invalidate_stats()
     game.put(passer, Square(1, 1))
     game.put(interceptor, Square(5, 1))
     game.put(catcher, Square(10, 1))
@@ -160,6 +169,7 @@ def test_interception_modifiers():
     interceptor = opp_team.players[0]
     interceptor.extra_skills = []
     interceptor.role.ag = 3
+    interceptor.invalidate_stats()
     game.put(interceptor, Square(5, 1))
     game.state.weather = WeatherType.NICE
     mod = game.get_catch_modifiers(interceptor, interception=True)
@@ -170,3 +180,22 @@ def test_interception_modifiers():
     interceptor.extra_skills = [Skill.EXTRA_ARMS]
     mod = game.get_catch_modifiers(interceptor, interception=True)
     assert mod == -1
+
+
+def test_get_interceptors():
+    game = get_game_turn(empty=True)
+    team = game.state.home_team
+    opp_team = game.state.away_team
+    passer = team.players[0]
+    game.put(passer, Square(2, 2))
+    inside = [Square(4, 3), Square(6, 4), Square(9, 6)]
+    outside = [Square(1, 2), Square(4, 6), Square(11, 7), Square(8, 2)]
+    for player, square in zip(opp_team.players, inside + outside):
+        player.role.skills = []
+        player.invalidate_stats()
+        game.put(player, square)
+    interceptors = game.get_interceptors(passer.position, Square(10, 6), opp_team)
+    assert set(player.position for player in interceptors) == set(inside)
+    assert game.get_interceptors(passer.position, Square(10, 6), team) == []
+    assert get_pass_corridor(8, 4) is get_pass_corridor(8, 4)
+    assert (0, 0) in get_pass_corridor(8, 4) and (8, 4) in get_pass_corridor(8, 4)
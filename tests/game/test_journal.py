@@ -0,0 +1,110 @@
+import gc
+from tests.util import *
+
+
+def get_game_json(game):
+    game_json = game.to_json()
+    game_json['state'].pop('clocks')
+    return game_json
+
+
+def step_game(game, bot, steps):
+    states = []
+    for _ in range(steps):
+        if game.state.game_over:
+            break
+        game.step(bot.act(game))
+        states.append(get_game_json(game))
+    return states
+
+
+def test_revert_restores_each_step():
+    game = get_game_turn()
+    game.enable_journal()
+    initial = get_game_json(game)
+    states = step_game(game, RandomBot("bot", seed=1), 100)
+    assert game.num_reversible_steps() == len(states)
+    for state in reversed(states[:-1]):
+        game.revert()
+        assert get_game_json(game) == state
+    game.revert()
+    assert get_game_json(game) == initial
+    assert game.num_reversible_steps() == 0
+
+
+def test_redo_and_continue_after_revert():
+    game = get_game_turn()
+    game.enable_journal()
+    initial = get_game_json(game)
+    states = step_game(game, RandomBot("bot", seed=1), 50)
+    game.revert(len(states))
+    assert get_game_json(game) == initial
+    game.redo(len(states))
+    assert get_game_json(game) == states[-1]
+    # The random number generator is restored so the same actions lead to the same states
+    game.revert(len(states))
+    assert step_game(game, RandomBot("bot", seed=1), 50) == states
+
+
+def test_clone_has_no_journal():
+    game = get_game_turn()
+    game.enable_journal()
+    clone = game.clone()
+    assert clone.journal is None
+    num_entries = len(game.journal.entries)
+    step_game(clone, RandomBot("bot", seed=1), 10)
+    assert len(game.journal.entries) == num_entries
+
+
+def test_disable_journal():
+    game = get_game_turn()
+    game.enable_journal()
+    journal = game.journal
+    game.disable_journal()
+    assert game.state._journal is None
+    assert game.state.pitch.board[0]._journal is None
+    step_game(game, RandomBot("bot", seed=1), 10)
+    assert game.journal is None
+    assert len(journal.entries) == 0
+
+
+class Holder(Reversible):
+
+    def __init__(self):
+        self.items = []
+
+
+def test_containers_stored_during_a_step_are_attached_after_it():
+    holder = Holder()
+    journal = Journal()
+    journal.attach(holder)
+    rnd = np.random.RandomState(0)
+    journal.begin_step(rnd)
+    items = [1]
+    holder.items = items
+    # The stored list is not replaced while the step that stored it may still modify it
+    items.append(2)
+    assert holder.items is items
+    journal.begin_step(rnd)
+    assert holder.items == [1, 2]
+    holder.items.append(3)
+    journal.revert()
+    assert holder.items == [1, 2]
+    journal.revert()
+    assert holder.items == []
+    journal.detach()
+    assert holder._journal is None
+
+
+def test_dropped_journal_removes_the_hook():
+    gc.collect()
+    assert Journal.num_attached == 0
+    game = get_game_turn()
+    game.enable_journal()
+    step_game(game, RandomBot("bot", seed=1), 5)
+    assert '__setattr__' in Reversible.__dict__
+    # The game is dropped without disabling the journal
+    del game
+    gc.collect()
+    assert Journal.num_attached == 0
+    assert '__setattr__' not in Reversible.__dict__
@@ -12,6 +12,7 @@ def test_leap_one_square_success():
     player = team.players[0]
     player.extra_skills = [Skill.LEAP]
     player.role.ag = 3
+    player.invalidate_stats()
 
     game.put(player, Square(1, 1))
 
@@ -37,6 +38,7 @@ def test_leap_two_squares_success():
     player = team.players[0]
     player.extra_skills = [Skill.LEAP]
     player.role.ag = 3
+    player.invalidate_stats()
 
     game.put(player, Square(1, 1))
 
@@ -62,6 +64,7 @@ def test_leap_two_squares_fail():
     player = team.players[0]
     player.extra_skills = [Skill.LEAP]
     player.role.ag = 3
+    player.invalidate_stats()
 
     game.put(player, Square(1, 1))
 
@@ -88,6 +91,7 @@ def test_leap_very_long_legs_success():
     player = team.players[0]
     player.extra_skills = [Skill.LEAP, Skill.VERY_LONG_LEGS]
     player.role.ag = 3
+    player.invalidate_stats()
 
     game.put(player, Square(1, 1))
 
@@ -112,6 +116,7 @@ def test_leap_tackle_zone():
     player = players[1]
     player.extra_skills = [Skill.LEAP]
     player.role.ag = 3
+    player.invalidate_stats()
 
     opp_team = game.get_opp_team(team)
     opp_player = opp_team.players[0]
@@ -136,6 +141,7 @@ def test_two_leaps():
     player = players[1]
     player.extra_skills = [Skill.LEAP]
     player.role.ag = 3
+    player.invalidate_stats()
 
     game.set_available_actions()
     game.step(Action(ActionType.START_MOVE, player=player))
@@ -213,6 +213,7 @@ def test_really_stupid_fails_if_support_is_really_stupid(dice_value):
 
     team_mate = players[2]
     team_mate.extra_skills.append(Skill.REALLY_STUPID)
+    team_mate.invalidate_stats()
     game.put(player, Square(5, 5))
     game.put(team_mate, Square(5,6))
 
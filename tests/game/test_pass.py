@@ -30,6 +30,7 @@ def test_pass_distances_and_modifiers(data):
     asserted_pass_range = data[1]
     passer = team.players[0]
     passer.role.skills = []
+    passer.invalidate_stats()
     catcher = team.players[1]
     game.put(passer, Square(1, 1))
     game.state.weather = WeatherType.NICE
@@ -79,6 +80,7 @@ def test_accurate_pass():
     passer = team.players[0]
     passer.role.skills = []
     passer.role.ag = 3
+    passer.invalidate_stats()
     catcher = team.players[1]
     game.put(passer, Square(1, 1))
     game.state.weather = WeatherType.NICE
@@ -87,6 +89,7 @@ def test_accurate_pass():
     pass_distance = game.get_pass_distance(passer.position, catcher.position)
     pass_mods = game.get_pass_modifiers(passer, pass_distance)
     passer.role.skills = [Skill.ACCURATE]
+    passer.invalidate_stats()
     accurate_pass_mods = game.get_pass_modifiers(passer, pass_distance)
     assert pass_mods + 1 == accurate_pass_mods
 
@@ -97,12 +100,15 @@ def test_strong_arm():
     game.clear_board()
     passer = team.players[0]
     passer.role.ag = 3
+    passer.invalidate_stats()
     game.put(passer, Square(1, 1))
     game.state.weather = WeatherType.NICE
     for pass_distance in [PassDistance.QUICK_PASS, PassDistance.SHORT_PASS, PassDistance.LONG_PASS, PassDistance.LONG_BOMB, PassDistance.HAIL_MARY]:
         passer.role.skills = []
+        passer.invalidate_stats()
         pass_mods = game.get_pass_modifiers(passer, pass_distance)
         passer.role.skills = [Skill.STRONG_ARM]
+        passer.invalidate_stats()
         strong_arm_mods = game.get_pass_modifiers(passer, pass_distance)
         if pass_distance in [PassDistance.SHORT_PASS, PassDistance.LONG_PASS, PassDistance.LONG_BOMB]:
             assert pass_mods + 1 == strong_arm_mods
@@ -117,6 +123,7 @@ def test_pass_nerves_of_steel():
     passer = team.players[0]
     passer.role.skills = []
     passer.role.ag = 3
+    passer.invalidate_stats()
     catcher = team.players[1]
     game.put(passer, Square(1, 1))
     opponent = game.get_opp_team(team).players[0]
@@ -130,6 +137,27 @@ def test_pass_nerves_of_steel():
     pass_distance = game.get_pass_distance(passer.position, catcher.position)
     pass_mods = game.get_pass_modifiers(passer, pass_distance)
     passer.role.skills = [Skill.NERVES_OF_STEEL]
+    passer.invalidate_stats()
     nos_pass_mods = game.get_pass_modifiers(passer, pass_distance)
     # nos removes the 1 TZ impact
     assert pass_mods + 1 == nos_pass_mods
+
+
+def test_pass_distances_at():
+    game = get_game_turn(empty=True)
+    passer = game.get_reserves(game.state.home_team)[0]
+    for position in [Square(1, 1), Square(5, 9), Square(game.arena.width - 2, game.arena.height - 2)]:
+        squares, distances = game.get_pass_distances_at(passer, position)
+        expected = [square for row in game.state.pitch.squares for square in row
+                    if not game.is_out_of_bounds(square) and square != position
+                    and game.get_pass_distance(position, square) != PassDistance.HAIL_MARY]
+        assert squares == expected
+        assert distances == [game.get_pass_distance(position, square) for square in squares]
+    squares, distances = game.get_pass_distances_at(passer, Square(5, 9), dump_off=True)
+    assert len(squares) > 0 and set(distances) == {PassDistance.QUICK_PASS}
+    passer.extra_skills = [Skill.HAIL_MARY_PASS]
+    squares, distances = game.get_pass_distances_at(passer, Square(1, 1))
+    assert PassDistance.HAIL_MARY in distances
+    game.state.weather = WeatherType.BLIZZARD
+    squares, distances = game.get_pass_distances_at(passer, Square(1, 1))
+    assert set(distances) == {PassDistance.QUICK_PASS, PassDistance.SHORT_PASS}
@@ -0,0 +1,172 @@
+from tests.util import *
+import pytest
+import ffai.ai.pathfinding as pf
+
+
+def test_node_heap_matches_sorted_list():
+    rnd = np.random.RandomState(0)
+    heap = pf.NodeHeap()
+    sorted_list = pf.SortedList(lambda node: node.value())
+    nodes = [pf.Node(i, 0) for i in range(40)]
+    for _ in range(500):
+        node = nodes[rnd.randint(len(nodes))]
+        if heap.contains(node):
+            if rnd.rand() < 0.5:
+                heap.remove(node)
+                sorted_list.remove(node)
+            else:
+                node.cost = rnd.randint(5) / 4
+                heap.update(node)
+                sorted_list.remove(node)
+                sorted_list.append(node)
+        else:
+            node.cost = rnd.randint(5) / 4
+            heap.append(node)
+            sorted_list.append(node)
+        assert len(heap) == len(sorted_list)
+        if len(heap) > 0:
+            assert heap.first() is sorted_list.first()
+
+
+def test_safest_path_on_empty_board():
+    game = get_game_turn(empty=True)
+    player = game.get_reserves(game.state.home_team)[0]
+    game.reserves_to_pitch(player, Square(5, 5))
+    player.role.ma = 6
+    player.invalidate_stats()
+    path = pf.get_safest_path(game, player, Square(8, 7))
+    assert path.prob == 1.0
+    assert [(square.x, square.y) for square in path.steps] == [(6, 5), (7, 6), (8, 7)]
+    opponent = game.get_reserves(game.state.away_team)[0]
+    game.reserves_to_pitch(opponent, Square(6, 5))
+    game.ff_map = None
+    # Leaving the tackle zone is a dodge and the path goes around the opponent's tackle zones
+    path = pf.get_safest_path(game, player, Square(8, 7))
+    assert [(square.x, square.y) for square in path.steps] == [(4, 6), (5, 7), (6, 7), (7, 7), (8, 7)]
+    assert path.prob == pytest.approx(4 / 6)
+    paths = pf.get_all_paths(game, player)
+    assert all(0 < path.prob <= 1.0 for path in paths)
+    assert Square(6, 5) not in [path.get_last_step() for path in paths]
+
+
+def test_path_grid_matches_all_paths():
+    game = get_game_turn(empty=True)
+    player = game.get_reserves(game.state.home_team)[0]
+    game.reserves_to_pitch(player, Square(5, 5))
+    opponent = game.get_reserves(game.state.away_team)[0]
+    game.reserves_to_pitch(opponent, Square(6, 5))
+    paths = pf.get_all_paths(game, player)
+    grid = pf.get_all_path_grid(game, player)
+    grid_paths = grid.get_paths()
+    assert [path.steps for path in grid_paths] == [path.steps for path in paths]
+    assert [path.prob for path in grid_paths] == [path.prob for path in paths]
+    assert grid.reachable().sum() == len(paths)
+    assert not grid.reachable()[5, 6] and grid.prob[5, 6] == 0
+    assert grid.prob[5, 5] == 1.0 and grid.get_path(Square(5, 5)).is_empty()
+    for path in paths:
+        square = path.get_last_step()
+        assert grid.moves[square.y, square.x] == len(path)
+    # The safest path of any player of a team is the maximum over their grids
+    other = game.get_reserves(game.state.home_team)[0]
+    game.reserves_to_pitch(other, Square(10, 10))
+    team_prob = np.maximum(grid.prob, pf.get_all_path_grid(game, other).prob)
+    assert team_prob[10, 10] == 1.0 and team_prob[5, 6] == 0
+
+
+def test_tile_map_follows_board_version():
+    game = get_game_turn(empty=True)
+    player = game.get_reserves(game.state.home_team)[0]
+    game.reserves_to_pitch(player, Square(5, 5))
+    player.role.ma = 6
+    player.invalidate_stats()
+    path = pf.get_safest_path(game, player, Square(8, 7))
+    dodge_probs = game.ff_map.dodge_probs
+    assert pf.get_safest_path(game, player, Square(8, 5)).prob == 1.0
+    assert game.ff_map.dodge_probs is dodge_probs
+    version = game.state.pitch.version
+    opponent = game.get_reserves(game.state.away_team)[0]
+    game.reserves_to_pitch(opponent, Square(6, 5))
+    assert game.state.pitch.version > version
+    # The memo tables of the tile map are repaired without resetting game.ff_map
+    path = pf.get_safest_path(game, player, Square(8, 7))
+    assert game.ff_map.dodge_probs is dodge_probs
+    assert path.prob == pytest.approx(4 / 6)
+    assert game.ff_map.blocked(None, 6, 5)
+    assert game.ff_map.get_dodge_prob(player, 5, 5, 5, 6, True) == game.get_dodge_prob_from(player, Square(5, 5), Square(5, 6), allow_dodge_reroll=True)
+    # The dodges are recomputed when the skills of the mover change, even if the board has not changed
+    player.extra_skills.append(Skill.DODGE)
+    player.invalidate_stats()
+    assert game.ff_map.get_dodge_prob(player, 5, 5, 5, 6, True) == game.get_dodge_prob_from(player, Square(5, 5), Square(5, 6), allow_dodge_reroll=True)
+    assert pf.get_safest_path(game, player, Square(8, 7)).prob == pytest.approx(4 / 6 + 2 / 6 * 4 / 6)
+
+
+def test_find_path_stops_when_goals_are_out_of_reach():
+    game = get_game_turn(empty=True)
+    player = game.get_reserves(game.state.home_team)[0]
+    game.reserves_to_pitch(player, Square(5, 5))
+    player.role.ma = 3
+    player.invalidate_stats()
+    game.ff_map = pf.FFTileMap(game)
+    finder = pf.FFPathFinder(game.ff_map, 3)
+    mover = pf.FFMover(player)
+    assert finder.get_goal_distance(5, 5, tx=9, ty=7) == 4
+    assert finder.find_path(mover, 5, 5, 9, 7) is None
+    assert finder.find_path(mover, 5, 5, 8, 7).prob == 1.0
+    tile = Tile.HOME_TOUCHDOWN if player.team == game.state.away_team else Tile.AWAY_TOUCHDOWN
+    distances = game.ff_map.get_tile_distances(tile)
+    assert min(distances[5]) == 0 and distances[5][5] > 3
+    assert finder.find_path(mover, 5, 5, tile=tile) is None
+    opponent = game.get_reserves(game.state.away_team)[0]
+    game.reserves_to_pitch(opponent, Square(10, 5))
+    assert finder.get_goal_distance(5, 5, player=opponent) == 4
+    assert finder.find_path(mover, 5, 5, player=opponent) is None
+    path = pf.FFPathFinder(game.ff_map, 4).find_path(mover, 5, 5, player=opponent)
+    assert len(path) == 4 and path.get_last_step().distance(opponent.position) == 1
+
+
+def test_cached_paths_are_repaired_across_steps():
+    game = get_game_turn(empty=True)
+    player = game.get_reserves(game.state.home_team)[0]
+    game.reserves_to_pitch(player, Square(5, 5))
+    player.role.ma = 3
+    player.invalidate_stats()
+    pf.get_all_paths(game, player)
+    pf.get_safest_path(game, player, Square(8, 7))
+    tile_map = game.ff_map
+    entries = dict(tile_map.paths)
+    # A player far from the squares the searches depended on leaves the cached results in place
+    opponents = game.get_reserves(game.state.away_team)
+    game.reserves_to_pitch(opponents[0], Square(20, 10))
+    pf.get_all_paths(game, player)
+    pf.get_safest_path(game, player, Square(8, 7))
+    assert tile_map.paths == entries
+    # A player next to the mover invalidates them
+    game.reserves_to_pitch(opponents[1], Square(6, 5))
+    cached = pf.get_all_paths(game, player)
+    assert tile_map.paths != entries
+    assert game.ff_map is tile_map
+    game.ff_map = None
+    fresh = pf.get_all_paths(game, player)
+    assert [(path.get_last_step(), path.prob) for path in cached] == \
+        [(path.get_last_step(), path.prob) for path in fresh]
+
+
+def test_cached_results_are_not_changed_by_the_caller():
+    game = get_game_turn(empty=True)
+    player = game.get_reserves(game.state.home_team)[0]
+    game.reserves_to_pitch(player, Square(5, 5))
+    player.role.ma = 3
+    player.invalidate_stats()
+    path = pf.get_safest_path(game, player, Square(8, 7))
+    path.prob = path.prob * (5.0 / 6.0)
+    path.steps.pop()
+    path = pf.get_safest_path(game, player, Square(8, 7))
+    assert path.prob == 1.0 and len(path) == 3
+    paths = pf.get_all_paths(game, player)
+    probs = [path.prob for path in paths]
+    paths[0].prob = 0
+    paths.clear()
+    assert [path.prob for path in pf.get_all_paths(game, player)] == probs
+    grid = pf.get_all_path_grid(game, player)
+    grid.prob[:] = 0
+    assert pf.get_all_path_grid(game, player).prob[7, 8] == 1.0
@@ -10,6 +10,7 @@ def test_pickup_modifiers(weather):
     player = team.players[0]
     player.role.skills = []
     player.role.ag = 3
+    player.invalidate_stats()
     game.put(player, Square(1, 1))
     game.get_ball().move_to(player.position)
     game.get_ball().is_carried = False
@@ -19,14 +20,18 @@ def test_pickup_modifiers(weather):
     assert mods == 1 + weather_mod
     # Big hand mod
     player.role.skills = [Skill.BIG_HAND]
+    player.invalidate_stats()
     mods = game.get_pickup_modifiers(player, player.position)
     assert mods == 1
     player.role.skills = []
+    player.invalidate_stats()
     # Extra arms
     player.role.skills = [Skill.EXTRA_ARMS]
+    player.invalidate_stats()
     mods = game.get_pickup_modifiers(player, player.position)
     assert mods == 2 + weather_mod
     player.role.skills = []
+    player.invalidate_stats()
     # Tackle zone modifier
     opp_player = game.get_opp_team(team).players[0]
     game.put(opp_player, Square(2, 2))
@@ -38,6 +43,7 @@ def test_pickup_modifiers(weather):
     assert mods == - 1 + weather_mod
     # Big hand
     player.role.skills = [Skill.BIG_HAND]
+    player.invalidate_stats()
     mods = game.get_pickup_modifiers(player, player.position)
     assert mods == 1
 
@@ -50,9 +56,12 @@ def test_pickup_sure_hands(sure_hands):
     player = team.players[0]
     if sure_hands:
         player.role.skills = [Skill.SURE_HANDS]
+        player.invalidate_stats()
     else:
         player.role.skills = []
+        player.invalidate_stats()
     player.role.ag = 3
+    player.invalidate_stats()
     game.put(player, Square(1, 1))
     game.get_ball().move_to(Square(2, 2))
     game.get_ball().is_carried = False
@@ -72,4 +81,23 @@ def test_pickup_sure_hands(sure_hands):
         assert not game.has_report_of_type(OutcomeType.SKILL_USED)
 
 
-
+def test_ball_queries():
+    game = get_game_turn()
+    team = game.get_agent_team(game.actor)
+    game.clear_board()
+    player = team.players[0]
+    game.put(player, Square(5, 5))
+    ball = game.get_ball()
+    ball.move_to(player.position)
+    ball.on_ground = True
+    ball.is_carried = True
+    assert game.has_ball(player)
+    assert game.get_ball_at(Square(5, 5)) is ball
+    assert game.get_ball_carrier() == player
+    game.move(player, Square(6, 5))
+    assert ball.position == Square(6, 5)
+    assert game.has_ball(player)
+    ball.on_ground = False
+    assert not game.has_ball(player)
+    assert game.get_ball_at(player.position) is None
+    assert game.get_ball_at(player.position, in_air=True) is ball
@@ -0,0 +1,30 @@
+from tests.util import *
+
+
+def test_stats_follow_player_changes():
+    game = get_game_turn(empty=True)
+    player = game.get_reserves(game.state.home_team)[0]
+    st = player.get_st()
+    player.extra_st += 1
+    assert player.get_st() == st + 1
+    assert not player.has_skill(Skill.DIVING_TACKLE)
+    player.extra_skills.append(Skill.DIVING_TACKLE)
+    # The stats are only recomputed when they are invalidated after a list is modified in place
+    assert not player.has_skill(Skill.DIVING_TACKLE)
+    player.invalidate_stats()
+    assert player.has_skill(Skill.DIVING_TACKLE)
+    player.role.skills = [Skill.SURE_HANDS]
+    player.invalidate_stats()
+    assert player.has_skill(Skill.SURE_HANDS)
+    assert player.get_skill_mask() == Skill.SURE_HANDS.mask | Skill.DIVING_TACKLE.mask
+    player.extra_skills = [Skill.GUARD]
+    assert not player.has_skill(Skill.DIVING_TACKLE)
+    assert player.get_skill_mask() == Skill.SURE_HANDS.mask | Skill.GUARD.mask
+    ag = player.get_ag()
+    game.apply_casualty(player, None, CasualtyType.BROKEN_NECK, CasualtyEffect.AG, None)
+    assert player.get_ag() == ag - 1
+    av = player.get_av()
+    player.injuries = [CasualtyEffect.AV]
+    assert player.get_av() == av - 1
+    player.state.taken_root = True
+    assert player.get_ma() == 0
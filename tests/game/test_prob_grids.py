@@ -0,0 +1,61 @@
+from tests.util import *
+import pytest
+import numpy as np
+
+
+def assert_grid(game, grid, prob):
+    for y in range(1, game.arena.height - 1):
+        for x in range(1, game.arena.width - 1):
+            assert grid[y, x] == pytest.approx(prob(game.get_square(x, y)))
+    assert np.all(grid[0, :] == 0) and np.all(grid[:, -1] == 0)
+
+
+def setup_board():
+    game = get_game_turn(empty=True)
+    team = game.state.home_team
+    opp_team = game.state.away_team
+    player = team.players[0]
+    player.extra_skills = [Skill.DODGE, Skill.SURE_HANDS, Skill.CATCH]
+    game.put(player, Square(5, 5))
+    for opp_player, square in zip(opp_team.players, [Square(6, 5), Square(7, 7), Square(4, 8), Square(10, 6)]):
+        game.put(opp_player, square)
+    opp_team.players[0].extra_skills = [Skill.PREHENSILE_TAIL]
+    opp_team.players[1].extra_skills = [Skill.DISTURBING_PRESENCE]
+    opp_team.players[2].state.up = False
+    return game, player
+
+
+def test_dodge_prob_grid():
+    game, player = setup_board()
+    grid = game.get_dodge_prob_grid(player)
+    assert_grid(game, grid, lambda square: game.get_dodge_prob(player, square))
+    from_position = Square(6, 6)
+    grid = game.get_dodge_prob_grid(player, from_position=from_position, allow_dodge_reroll=False)
+    assert player.position == Square(5, 5)
+    assert_grid(game, grid, lambda square: game.get_dodge_prob_from(player, from_position, square))
+    assert np.all(game.get_dodge_prob_grid(player, from_position=Square(12, 2))[1:-1, 1:-1] == 1)
+
+
+def test_pickup_and_catch_prob_grids():
+    game, player = setup_board()
+    game.state.weather = WeatherType.POURING_RAIN
+    grid = game.get_pickup_prob_grid(player)
+    assert_grid(game, grid, lambda square: game.get_pickup_prob(player, square))
+    grid = game.get_catch_prob_grid(player, accurate=True)
+    for y in range(1, game.arena.height - 1):
+        for x in range(1, game.arena.width - 1):
+            square = game.get_square(x, y)
+            if game.get_player_at(square) is None:
+                game.move(player, square)
+                assert grid[y, x] == pytest.approx(game.get_catch_prob(player, accurate=True))
+
+
+def test_pass_prob_grid():
+    game, player = setup_board()
+    grid = game.get_pass_prob_grid(player)
+    squares, distances = game.get_pass_distances(player)
+    assert np.count_nonzero(grid) == len(squares)
+    target = Rules.agility_table[player.get_ag()]
+    for square, distance in zip(squares, distances):
+        roll = min(6, max(2, target - game.get_pass_modifiers(player, distance)))
+        assert grid[square.y, square.x] == pytest.approx((7 - roll) / 6.0)
@@ -0,0 +1,81 @@
+from tests.util import *
+import pytest
+
+
+def play_game(reported_outcome_types):
+    game = get_game_turn(seed=1)
+    game.config.reported_outcome_types = reported_outcome_types
+    game.state.reports.clear()
+    bot = RandomBot("bot", seed=1)
+    while not game.state.game_over:
+        game.step(bot.act(game))
+    return game
+
+
+def test_reported_outcome_types():
+    full = play_game(None)
+    assert len(full.state.reports) > 0
+    whitelist = {OutcomeType.END_OF_GAME, OutcomeType.TURNOVER}
+    filtered = play_game(whitelist)
+    assert len(filtered.state.reports) > 0
+    assert [report.outcome_type for report in filtered.state.reports] == \
+        [report.outcome_type for report in full.state.reports if report.outcome_type in whitelist]
+    assert len(play_game(set()).state.reports) == 0
+
+
+def test_event_log_keeps_recent_outcomes():
+    log = EventLog(capacity=3)
+    outcomes = [Outcome(OutcomeType.TURNOVER if i % 2 else OutcomeType.TOUCHDOWN, n=i) for i in range(5)]
+    cursor = log.cursor(outcome_types=[OutcomeType.TOUCHDOWN])
+    touchdowns = []
+    log.subscribe(touchdowns.append, outcome_types=[OutcomeType.TOUCHDOWN])
+    for outcome in outcomes[:2]:
+        log.append(outcome)
+    assert cursor.read() == [outcomes[0]]
+    for outcome in outcomes[2:]:
+        log.append(outcome)
+    assert log.seq == 5
+    assert len(log) == 3
+    assert list(log) == outcomes[2:]
+    assert log[-1] is outcomes[4]
+    assert log.since(0) == outcomes[2:]
+    assert log.since(3) == outcomes[3:]
+    assert log.last(2) == outcomes[3:]
+    assert cursor.read() == [outcomes[2], outcomes[4]]
+    assert cursor.read() == []
+    assert touchdowns == [outcomes[0], outcomes[2], outcomes[4]]
+
+
+def test_event_log_clear_keeps_the_ring_in_order():
+    log = EventLog(capacity=3)
+    for i in range(5):
+        log.append(Outcome(OutcomeType.TURNOVER, n=i))
+    log.clear()
+    assert list(log) == []
+    for i in range(5, 9):
+        log.append(Outcome(OutcomeType.TURNOVER, n=i))
+    assert [outcome.n for outcome in log] == [6, 7, 8]
+    assert [outcome.n for outcome in log.since(0)] == [6, 7, 8]
+    assert [outcome.n for outcome in log.since(7)] == [7, 8]
+    assert log[0].n == 6
+    assert log[-1].n == 8
+    with pytest.raises(IndexError):
+        log[3]
+
+
+def test_event_log_with_capacity_in_game():
+    game = get_game_turn(seed=1)
+    game.state.reports = EventLog(capacity=10)
+    game.enable_journal()
+    bot = RandomBot("bot", seed=1)
+    seqs = []
+    for _ in range(50):
+        game.step(bot.act(game))
+        seqs.append((game.state.reports.seq, [report.outcome_type for report in game.state.reports]))
+    assert len(game.state.reports) == 10
+    clone = game.clone()
+    assert [report.outcome_type for report in clone.state.reports] == seqs[-1][1]
+    for seq, outcome_types in reversed(seqs[:-1]):
+        game.revert()
+        assert game.state.reports.seq == seq
+        assert [report.outcome_type for report in game.state.reports] == outcome_types
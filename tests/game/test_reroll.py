@@ -68,6 +68,7 @@ def test_gfi_reroll_success():
     players = game.get_players_on_pitch(team=current_team)
     player = players[1]
     player.role.skills = []
+    player.invalidate_stats()
     player.extra_skills = []
     assert not player.has_skill(Skill.SURE_FEET)
     player.state.moves = player.get_ma()
@@ -96,6 +97,7 @@ def test_gfi_reroll_fail():
     players = game.get_players_on_pitch(team=current_team)
     player = players[1]
     player.role.skills = []
+    player.invalidate_stats()
     player.extra_skills = []
     assert not player.has_skill(Skill.SURE_FEET)
     player.state.moves = player.get_ma()
@@ -128,6 +130,7 @@ def test_bonehead_loner_reroll_success():
     players = game.get_players_on_pitch(team=current_team)
     player = players[1]
     player.role.skills = []
+    player.invalidate_stats()
     player.extra_skills = [Skill.BONE_HEAD, Skill.LONER]
 
     # make sure we don't get stuck waiting for re-roll actions
@@ -155,6 +158,7 @@ def test_bonehead_loner_reroll_fail():
     players = game.get_players_on_pitch(team=current_team)
     player = players[1]
     player.role.skills = []
+    player.invalidate_stats()
     player.extra_skills = [Skill.BONE_HEAD, Skill.LONER]
 
     # make sure we don't get stuck waiting for re-roll actions
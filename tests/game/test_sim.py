@@ -0,0 +1,38 @@
+from tests.util import *
+from ffai.sim import simulate
+
+
+def test_simulate_games_without_clocks():
+    result = simulate("random", "random", 2, config_name="ff-1", home_team="human-1", away_team="human-1")
+    assert result.games == 2
+    assert result.home_wins + result.away_wins + result.draws == 2
+    assert result.steps == sum(count for count, _ in result.procedure_times.values())
+    assert "Turn" in result.procedure_times
+
+
+def test_clocks_can_be_disabled():
+    game = get_game_turn()
+    game.config.clocks = False
+    game.add_primary_clock(game.state.home_team)
+    game.add_secondary_clock(game.state.away_team)
+    assert len(game.state.clocks) == 0
+
+
+class RecordingBot(RandomBot):
+
+    def new_game(self, game, team):
+        super().new_game(game, team)
+        self.game = game
+
+
+def test_bots_get_a_clone_unless_the_config_shares_the_game():
+    for clone_game in [True, False]:
+        config = load_config("ff-11")
+        config.clone_game_for_agents = clone_game
+        ruleset = load_rule_set(config.ruleset)
+        home = load_team_by_filename("human", ruleset)
+        away = load_team_by_filename("orc", ruleset)
+        bot = RecordingBot("bot")
+        game = Game(1, home, away, Agent("human", human=True), bot, config)
+        game.init()
+        assert (bot.game is not game) == clone_game
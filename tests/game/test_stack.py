@@ -0,0 +1,29 @@
+from tests.util import *
+
+
+def assert_index_matches(stack):
+    for cls in [Turn, PlayerAction, Block, Procedure]:
+        instances = [proc for proc in stack.items if isinstance(proc, cls)]
+        assert stack.count(cls) == len(instances)
+        assert stack.get_last(cls) is (instances[-1] if instances else None)
+        assert [stack.items[i] for i in stack.get_positions(cls)] == instances
+
+
+def test_stack_index_follows_game():
+    game = get_game_turn()
+    game.enable_journal()
+    bot = RandomBot("bot", seed=1)
+    for _ in range(100):
+        if game.state.game_over:
+            break
+        game.step(bot.act(game))
+        assert_index_matches(game.state.stack)
+        assert_index_matches(game.clone().state.stack)
+        assert game.current_turn() is game.state.stack.get_last(Turn)
+        names = ["QuickSnap" if isinstance(proc, Turn) and proc.quick_snap else
+                 "Blitz" if isinstance(proc, Turn) and proc.blitz else proc.__class__.__name__
+                 for proc in game.state.stack.items]
+        assert game.get_procedure_names() == names
+    for _ in range(game.num_reversible_steps()):
+        game.revert()
+        assert_index_matches(game.state.stack)
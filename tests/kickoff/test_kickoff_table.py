@@ -64,9 +64,9 @@ def test_perfect_defence():
             square = Square(player.position.x, player.position.y)
             assert game.get_player_at(square) == player
             if square.x <= 13:
-                square.x -= 1
+                square = Square(square.x - 1, square.y)
             else:
-                square.y += 1
+                square = Square(square.x, square.y + 1)
             game.step(Action(ActionType.PLACE_PLAYER, player=player, position=square))
             assert game.get_player_at(square) == player
 
@@ -330,10 +330,9 @@ def test_changing_weather(dice_roll):
     D6.fix_result(dice_roll[1])  # Weather roll
     pos = game.state.available_actions[0].positions[0]
     if pos.x <= 13:
-        pos.x = 6
+        pos = Square(6, 7)
     elif pos.x >= 14:
-        pos.x = 19
-    pos.y = 7
+        pos = Square(19, 7)
     game.step(Action(ActionType.PLACE_BALL, position=pos))
     assert game.has_report_of_type(OutcomeType.KICKOFF_CHANGING_WHEATHER)
     if np.sum(dice_roll) == 2:
@@ -609,8 +608,10 @@ def test_pitch_invasion_ball_and_chain():
     game.state.away_team.state.fame = 0
     assert len(game.get_players_on_pitch(game.state.home_team)) == 11
     assert len(game.get_players_on_pitch(game.state.away_team)) == 11
-    game.get_players_on_pitch(game.state.home_team)[0].extra_skills.append(Skill.BALL_AND_CHAIN)
-    game.get_players_on_pitch(game.state.away_team)[0].extra_skills.append(Skill.BALL_AND_CHAIN)
+    for team in game.state.teams:
+        player = game.get_players_on_pitch(team)[0]
+        player.extra_skills.append(Skill.BALL_AND_CHAIN)
+        player.invalidate_stats()
     D6.fix_result(1)  # Scatter
     D6.fix_result(6)  # Pitch invasion
     D6.fix_result(6)  # Pitch invasion